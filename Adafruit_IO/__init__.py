@@ -18,8 +18,67 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-from .client import Client
-from .mqtt_client import MQTTClient
-from .errors import AdafruitIOError, RequestError, ThrottlingError, MQTTError
-from .model import Data, Feed, Group, Dashboard, Block, Layout
+import importlib
+import sys
+
 from ._version import __version__
+
+# Public names and the modules that define them.  They are imported on first
+# use (PEP 562), so `import Adafruit_IO` doesn't load requests, paho-mqtt or
+# aiohttp until a client is actually needed.
+_EXPORTS = {
+    'Client': 'client',
+    'AsyncClient': 'async_client',
+    'MQTTClient': 'mqtt_client',
+    'AsyncMQTTClient': 'async_mqtt_client',
+    'CallbackExecutor': 'executor',
+    'RateLimiter': 'ratelimit',
+    'RetryPolicy': 'retry',
+    'HTTPCache': 'httpcache',
+    'JSONCodec': 'codec',
+    'AdafruitIOError': 'errors',
+    'RequestError': 'errors',
+    'ThrottlingError': 'errors',
+    'MQTTError': 'errors',
+    'Data': 'model',
+    'Feed': 'model',
+    'Group': 'model',
+    'Dashboard': 'model',
+    'Block': 'model',
+    'Layout': 'model',
+    'LazySequence': 'model',
+    'DataBlock': 'datablock',
+    'FeedCache': 'cache',
+    'BufferedSender': 'buffered',
+    'Outbox': 'outbox',
+}
+
+__all__ = list(_EXPORTS) + ['__version__']
+
+# Submodules, which used to be loaded (and so reachable as attributes of the
+# package) by `import Adafruit_IO`.
+_SUBMODULES = ('async_client', 'async_mqtt_client', 'buffered', 'cache', 'client',
+               'codec', 'datablock', 'errors', 'executor', 'httpcache', 'model',
+               'mqtt_client', 'outbox', 'ratelimit', 'retry', 'topics')
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
+
+
+# Module __getattr__ needs Python 3.7, import everything up front before that.
+if sys.version_info < (3, 7):
+    for _name in _EXPORTS:
+        __getattr__(_name)
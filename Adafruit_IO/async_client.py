@@ -0,0 +1,439 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+from urllib.parse import urlparse
+from urllib.parse import parse_qs
+
+# aiohttp is an optional dependency, only needed for the asyncio client.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .client import Client, DEFAULT_PAGE_LIMIT, _parse_next_link
+from .model import Data, Feed, Group, Dashboard, Block, Layout
+
+# Maximum number of requests the client keeps in flight at once.
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class _Response(object):
+    """Minimal requests-style view of a fully read aiohttp response, so the
+    error handling shared with Client (and RequestError) can be reused.
+    """
+
+    def __init__(self, status_code, reason, headers, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncClient(object):
+    """asyncio client instance for interacting with the Adafruit IO service
+    using its REST API.  Mirrors the Client class, but every network call is a
+    coroutine so many requests can be kept in flight on a single thread.
+
+    Requires the aiohttp package.
+    """
+
+    def __init__(self, username, key, proxy=None, base_url='https://io.adafruit.com',
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        """Create an instance of the Adafruit IO asyncio REST API client.
+
+        :param string username: Adafruit IO username.
+        :param string key: Adafruit IO access key.
+        :param string proxy: Optional proxy URL to send requests through.
+        :param string base_url: Adafruit IO service to connect to.
+        :param int max_connections: Maximum number of concurrent requests
+            (and pooled connections) to allow.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires the aiohttp package, "
+                              "install it with: pip install aiohttp")
+        self.username = username
+        self.key = key
+        self.proxy = proxy
+        self.base_url = base_url.rstrip('/')
+        self.max_connections = max_connections
+        # The session is created on first use, from inside the running loop.
+        self._session = None
+
+    async def close(self):
+        """Close the pooled HTTP session and release its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _compose_url(self, path):
+        return '{0}/api/{1}/{2}/{3}'.format(self.base_url, 'v2', self.username, path)
+
+    async def _request(self, method, path, params=None, data=None):
+        headers = {'X-AIO-Key': self.key}
+        if data is not None:
+            headers['Content-Type'] = 'application/json'
+            data = json.dumps(data)
+        async with self._get_session().request(method, self._compose_url(path),
+                                               headers=Client._headers(headers),
+                                               params=params, data=data,
+                                               proxy=self.proxy) as resp:
+            response = _Response(resp.status, resp.reason, resp.headers,
+                                 await resp.read())
+        Client._handle_error(response)
+        return response
+
+    async def _get(self, path, params=None):
+        return (await self._request('GET', path, params=params)).json()
+
+    async def _post(self, path, data):
+        return (await self._request('POST', path, data=data)).json()
+
+    async def _delete(self, path):
+        await self._request('DELETE', path)
+
+    # Data functionality.
+    async def send_data(self, feed, value, metadata=None, precision=None):
+        """Helper function to simplify adding a value to a feed.  Will append the
+        specified value to the feed identified by either name, key, or ID.
+        Returns a Data instance with details about the newly appended row of data.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param string value: Value to send.
+        :param dict metadata: Optional metadata associated with the value.
+        :param int precision: Optional amount of precision points to send.
+        """
+        if precision:
+            try:
+                value = round(value, precision)
+            except NotImplementedError:
+                raise NotImplementedError("Using the precision kwarg requires a float value")
+        payload = Client._create_payload(value, metadata)
+        return await self.create_data(feed, payload)
+
+    send = send_data
+
+    async def send_batch_data(self, feed, data_list):
+        """Create multiple rows of data in the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param Data data_list: Multiple data values.
+        """
+        path = "feeds/{0}/data/batch".format(feed)
+        data_dict = type(data_list)((data._asdict() for data in data_list))
+        await self._post(path, {"data": data_dict})
+
+    async def append(self, feed, value):
+        """Append a value to a feed which must already exist.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param string value: Value to append to feed.
+        """
+        return await self.create_data(feed, Data(value=value))
+
+    async def create_data(self, feed, data):
+        """Create a new row of data in the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param Data data: Instance of the Data class. Must have a value property set.
+        """
+        path = "feeds/{0}/data".format(feed)
+        return Data.from_dict(await self._post(path, data._asdict()))
+
+    async def receive(self, feed):
+        """Retrieve the most recent value for the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        """
+        path = "feeds/{0}/data/last".format(feed)
+        return Data.from_dict(await self._get(path))
+
+    async def receive_next(self, feed):
+        """Retrieve the next unread value from the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        """
+        path = "feeds/{0}/data/next".format(feed)
+        return Data.from_dict(await self._get(path))
+
+    async def receive_previous(self, feed):
+        """Retrieve the previous unread value from the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        """
+        path = "feeds/{0}/data/previous".format(feed)
+        return Data.from_dict(await self._get(path))
+
+    async def data(self, feed, data_id=None, max_results=DEFAULT_PAGE_LIMIT):
+        """Retrieve data from a feed. If data_id is not specified then all the data
+        for the feed will be returned in an array.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param string data_id: ID of the piece of data to retrieve.
+        :param int max_results: The maximum number of results to return. To
+            return all data, set to None.
+        """
+        if max_results is None:
+            res = await self._get(f'feeds/{feed}/details')
+            max_results = res['details']['data']['count']
+        if data_id:
+            path = "feeds/{0}/data/{1}".format(feed, data_id)
+            return Data.from_dict(await self._get(path))
+
+        params = {'limit': max_results} if max_results else None
+        data = []
+        path = "feeds/{0}/data".format(feed)
+        while len(data) < max_results:
+            response = await self._request('GET', path, params=params)
+            data.extend(Data.from_dicts(response.json()))
+            nlink = _parse_next_link(response.headers.get('link', ''))
+            if not nlink:
+                break
+            # Parse the link for the query parameters
+            params = {k: v[-1] for k, v in parse_qs(urlparse(nlink).query).items()}
+            if max_results:
+                params['limit'] = max_results - len(data)
+        return data
+
+    async def delete(self, feed, data_id):
+        """Delete data from a feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param string data_id: ID of the piece of data to delete.
+        """
+        path = "feeds/{0}/data/{1}".format(feed, data_id)
+        await self._delete(path)
+
+    # Integrations functionality.
+    async def receive_time(self, timezone=None):
+        """Returns a struct_time from the Adafruit IO Server based on requested
+        timezone, or automatically based on the device's IP address.
+
+        :param string timezone: Optional timezone to return the time in.
+        """
+        path = 'integrations/time/struct.json'
+        if timezone:
+            path += f'?tz={timezone}'
+        return Client._parse_time_struct(await self._get(path))
+
+    async def receive_weather(self, weather_id=None):
+        """Adafruit IO Weather Service.
+
+        :param int weather_id: optional ID for retrieving a specified weather record.
+        """
+        if weather_id:
+            weather_path = "integrations/weather/{0}".format(weather_id)
+        else:
+            weather_path = "integrations/weather"
+        return await self._get(weather_path)
+
+    async def create_weather(self, weather_record):
+        """Create a new weather record.
+
+        :param dict weather_record: Weather record to create.
+        """
+        return await self._post("integrations/weather", weather_record)
+
+    async def delete_weather(self, weather_id):
+        """Delete a weather record.
+
+        :param int weather_id: ID of the weather record to delete.
+        """
+        await self._delete("integrations/weather/{0}".format(weather_id))
+
+    async def receive_air_quality(self, airq_location_id=None, forecast=None):
+        """Adafruit IO Air Quality Service.
+
+        :param int airq_location_id: optional ID for retrieving a specified air quality record.
+        :param string forecast: Can be "current", "forecast_today", or "forecast_tomorrow".
+        """
+        if airq_location_id:
+            if forecast:
+                path = "integrations/air_quality/{0}/{1}".format(airq_location_id, forecast)
+            else:
+                path = "integrations/air_quality/{0}".format(airq_location_id)
+        else:
+            path = "integrations/air_quality"
+        return await self._get(path)
+
+    async def create_air_quality(self, air_quality_record):
+        """Create a new air quality record.
+
+        :param dict air_quality_record: Air quality record to create.
+        """
+        return await self._post("integrations/air_quality", air_quality_record)
+
+    async def delete_air_quality(self, air_quality_id):
+        """Delete an air quality record.
+
+        :param int air_quality_id: ID of the air quality record to delete.
+        """
+        await self._delete("integrations/air_quality/{0}".format(air_quality_id))
+
+    async def receive_random(self, randomizer_id=None):
+        """Access to Adafruit IO's Random Data service.
+
+        :param int randomizer_id: optional ID for retrieving a specified randomizer.
+        """
+        if randomizer_id:
+            random_path = "integrations/words/{0}".format(randomizer_id)
+        else:
+            random_path = "integrations/words"
+        return await self._get(random_path)
+
+    # Feed functionality.
+    async def feeds(self, feed=None):
+        """Retrieve a list of all feeds, or the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed, defaults to None.
+        """
+        if feed is None:
+            return Feed.from_dicts(await self._get("feeds"))
+        return Feed.from_dict(await self._get("feeds/{0}".format(feed)))
+
+    async def create_feed(self, feed, group_key=None):
+        """Create the specified feed.
+
+        :param string feed: Key of Adafruit IO feed.
+        :param group_key group: Group to place new feed in.
+        """
+        f = feed._asdict()
+        del f['id']  # Don't pass id on create call
+        path = "feeds/"
+        if group_key is not None:  # create feed in a group
+            path = "groups/%s/feeds" % group_key
+        return Feed.from_dict(await self._post(path, {"feed": f}))
+
+    async def delete_feed(self, feed):
+        """Delete the specified feed.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        """
+        await self._delete("feeds/{0}".format(feed))
+
+    # Group functionality.
+    async def groups(self, group=None):
+        """Retrieve a list of all groups, or the specified group.
+
+        :param string group: Name/Key/ID of Adafruit IO Group. Defaults to None.
+        """
+        if group is None:
+            return Group.from_dicts(await self._get("groups/"))
+        return Group.from_dict(await self._get("groups/{0}".format(group)))
+
+    async def create_group(self, group):
+        """Create the specified group.
+
+        :param string group: Name/Key/ID of Adafruit IO Group.
+        """
+        return Group.from_dict(await self._post("groups/", group._asdict()))
+
+    async def delete_group(self, group):
+        """Delete the specified group.
+
+        :param string group: Name/Key/ID of Adafruit IO Group.
+        """
+        await self._delete("groups/{0}".format(group))
+
+    # Dashboard functionality.
+    async def dashboards(self, dashboard=None):
+        """Retrieve a list of all dashboards, or the specified dashboard.
+
+        :param string dashboard: Key of Adafruit IO Dashboard. Defaults to None.
+        """
+        if dashboard is None:
+            return Dashboard.from_dicts(await self._get("dashboards/"))
+        return Dashboard.from_dict(await self._get("dashboards/{0}".format(dashboard)))
+
+    async def create_dashboard(self, dashboard):
+        """Create the specified dashboard.
+
+        :param Dashboard dashboard: Dashboard object to create
+        """
+        return Dashboard.from_dict(await self._post("dashboards/", dashboard._asdict()))
+
+    async def delete_dashboard(self, dashboard):
+        """Delete the specified dashboard.
+
+        :param string dashboard: Key of Adafruit IO Dashboard.
+        """
+        await self._delete("dashboards/{0}".format(dashboard))
+
+    # Block functionality.
+    async def blocks(self, dashboard, block=None):
+        """Retrieve a list of all blocks from a dashboard, or the specified block.
+
+        :param string dashboard: Key of Adafruit IO Dashboard.
+        :param string block: id of Adafruit IO Block. Defaults to None.
+        """
+        if block is None:
+            path = "dashboards/{0}/blocks".format(dashboard)
+            return Block.from_dicts(await self._get(path))
+        path = "dashboards/{0}/blocks/{1}".format(dashboard, block)
+        return Block.from_dict(await self._get(path))
+
+    async def create_block(self, dashboard, block):
+        """Create the specified block under the specified dashboard.
+
+        :param string dashboard: Key of Adafruit IO Dashboard.
+        :param Block block: Block object to create under dashboard
+        """
+        path = "dashboards/{0}/blocks".format(dashboard)
+        return Block.from_dict(await self._post(path, block._asdict()))
+
+    async def delete_block(self, dashboard, block):
+        """Delete the specified block.
+
+        :param string dashboard: Key of Adafruit IO Dashboard.
+        :param string block: id of Adafruit IO Block.
+        """
+        await self._delete("dashboards/{0}/blocks/{1}".format(dashboard, block))
+
+    # Layout functionality.
+    async def layouts(self, dashboard):
+        """Retrieve the layouts array from a dashboard
+
+        :param string dashboard: key of Adafruit IO Dashboard.
+        """
+        dashboard = await self._get("dashboards/{0}".format(dashboard))
+        return Layout.from_dict(dashboard['layouts'])
+
+    async def update_layout(self, dashboard, layout):
+        """Update the layout of the specified dashboard.
+
+        :param string dashboard: Key of Adafruit IO Dashboard.
+        :param Layout layout: Layout object to update under dashboard
+        """
+        path = "dashboards/{0}/update_layouts".format(dashboard)
+        return Layout.from_dict(await self._post(path, {'layouts': layout._asdict()}))
@@ -0,0 +1,322 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import functools
+import threading
+from collections import deque
+
+import paho.mqtt.client as mqtt
+
+from .errors import MQTTError
+from .mqtt_client import KEEP_ALIVE_SEC, validate_feed_key
+from .topics import TopicRouter, FEED, GROUP
+
+# Maximum number of received messages buffered for messages().
+DEFAULT_MAX_QUEUED = 1000
+
+
+class AsyncMQTTClient(object):
+    """asyncio client for publishing and subscribing to feed changes on
+    Adafruit IO using the MQTT protocol.
+
+    The paho-mqtt socket is driven by the event loop's reader and writer
+    callbacks, so there is no network thread and no callbacks: connect,
+    subscribe and publish are coroutines that resolve when the broker
+    answers, and received messages are read with `async for feed, payload
+    in client.messages()`.  Only the initial connection (name lookup, TCP
+    and TLS handshakes) runs in the loop's default executor.
+    """
+
+    def __init__(self, username, key, service_host='io.adafruit.com', secure=True,
+                 port=None, max_queued=DEFAULT_MAX_QUEUED):
+        """Create an instance of the asyncio MQTT client.
+
+        :param string username: Adafruit IO username.
+        :param string key: Adafruit IO access key.
+        :param string service_host: MQTT broker to connect to.
+        :param bool secure: Use an encrypted (TLS) connection.
+        :param int port: Port of the MQTT broker, defaults to 8883 for secure
+            and 1883 for insecure connections.
+        :param int max_queued: Maximum number of received messages kept until
+            they are read from messages().  When more arrive the oldest are
+            dropped, and counted in the dropped attribute.
+        """
+        self._username = username
+        self._service_host = service_host
+        if port is not None:
+            self._service_port = port
+        else:
+            self._service_port = 8883 if secure else 1883
+        self.max_queued = max_queued
+        self.dropped = 0
+        self._client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        if secure:
+            self._client.tls_set_context()
+        self._client.username_pw_set(username, key)
+        self._client.on_connect = self._mqtt_connect
+        self._client.on_disconnect = self._mqtt_disconnect
+        self._client.on_message = self._mqtt_message
+        self._client.on_subscribe = self._mqtt_acked
+        self._client.on_unsubscribe = self._mqtt_acked
+        self._client.on_publish = self._mqtt_publish
+        self._client.on_socket_open = self._socket_open
+        self._client.on_socket_close = self._socket_close
+        self._client.on_socket_register_write = self._socket_register_write
+        self._client.on_socket_unregister_write = self._socket_unregister_write
+        self._router = TopicRouter()
+        self._loop = None
+        self._loop_thread = None
+        self._misc = None
+        self._connected = False
+        self._connecting = None
+        self._disconnecting = None
+        self._error = None
+        # Futures waiting for a SUBACK, UNSUBACK or PUBACK, by message id.
+        self._pending = {}
+        self._messages = deque()
+        self._message_ready = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.disconnect()
+
+    def is_connected(self):
+        """Returns True if connected to Adafruit IO and False if not."""
+        return self._connected
+
+    async def connect(self, **kwargs):
+        """Connect to Adafruit IO, returning once the broker accepted the
+        connection.  Raises MQTTError if it didn't.  Optional keyword
+        arguments are passed to the paho-mqtt client connect function.
+        """
+        if self._connected:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        if self._message_ready is None:
+            self._message_ready = asyncio.Event()
+        self._error = None
+        self._connecting = self._loop.create_future()
+        keepalive = kwargs.pop('keepalive', KEEP_ALIVE_SEC)
+        try:
+            await self._loop.run_in_executor(None, functools.partial(
+                self._client.connect, self._service_host, port=self._service_port,
+                keepalive=keepalive, **kwargs))
+            await self._connecting
+        finally:
+            self._connecting = None
+
+    async def disconnect(self):
+        """Disconnect from Adafruit IO.  messages() stops once the messages
+        already received have been read."""
+        if not self._connected:
+            return
+        self._disconnecting = self._loop.create_future()
+        self._client.disconnect()
+        try:
+            await self._disconnecting
+        finally:
+            self._disconnecting = None
+
+    async def subscribe(self, feed_key, feed_user=None, qos=0):
+        """Subscribe to changes on the specified feed, returning the QoS the
+        broker granted.
+
+        :param str feed_key: The key of the feed to subscribe to.
+        :param str feed_user: Optional, identifies feed owner. Used for feed sharing.
+        :param int qos: The QoS to use when subscribing. Defaults to 0.
+        """
+        validate_feed_key(feed_key)
+        if qos > 1:
+            raise MQTTError("Adafruit IO only supports a QoS level of 0 or 1.")
+        topic = '{0}/feeds/{1}'.format(feed_user or self._username, feed_key)
+        self._router.add(topic, FEED)
+        granted = await self._track(*self._client.subscribe(topic, qos=qos))
+        return granted[0]
+
+    async def subscribe_group(self, group_id, qos=0):
+        """Subscribe to changes on the specified group, returning the QoS the
+        broker granted.
+
+        :param str group_id: The id of the group to subscribe to.
+        :param int qos: The QoS to use when subscribing. Defaults to 0.
+        """
+        topic = '{0}/groups/{1}'.format(self._username, group_id)
+        self._router.add(topic, GROUP)
+        granted = await self._track(*self._client.subscribe(topic, qos=qos))
+        return granted[0]
+
+    async def unsubscribe(self, feed_key=None, group_id=None):
+        """Unsubscribe from a feed or a group, returning once the broker
+        confirmed it."""
+        if feed_key is not None:
+            validate_feed_key(feed_key)
+            topic = '{0}/feeds/{1}'.format(self._username, feed_key)
+        elif group_id is not None:
+            topic = '{0}/groups/{1}'.format(self._username, group_id)
+        else:
+            raise TypeError('Invalid topic type specified.')
+        self._router.remove(topic)
+        await self._track(*self._client.unsubscribe(topic))
+
+    async def publish(self, feed_key, value=None, group_id=None, feed_user=None, qos=0):
+        """Publish a value to a specified feed.  With QoS 0 this returns
+        once the message is written to the socket, with QoS 1 once the broker
+        acknowledged it.
+
+        :param str feed_key: The key of the feed to update.
+        :param value: The new value to publish to the feed.
+        :param str group_id: Optional id of the group of the feed.
+        :param str feed_user: Optional feed owner. Used for feed sharing.
+        :param int qos: The QoS to publish with. Defaults to 0.
+        """
+        validate_feed_key(feed_key)
+        if qos > 1:
+            raise MQTTError("Adafruit IO only supports a QoS level of 0 or 1.")
+        if feed_user is not None:
+            topic = '{0}/feeds/{1}'.format(feed_user, feed_key)
+        elif group_id is not None:
+            topic = '{0}/feeds/{1}.{2}'.format(self._username, group_id, feed_key)
+        else:
+            topic = '{0}/feeds/{1}'.format(self._username, feed_key)
+        info = self._client.publish(topic, payload=value, qos=qos)
+        await self._track(info.rc, info.mid)
+
+    async def messages(self):
+        """Iterate over received messages as (feed, payload) pairs, named
+        like the MQTTClient on_message arguments.  Iteration stops after a
+        disconnect(), and raises MQTTError if the connection was lost.
+        """
+        while True:
+            if self._messages:
+                yield self._messages.popleft()
+            elif self._connected or self._connecting is not None:
+                self._message_ready.clear()
+                await self._message_ready.wait()
+            elif self._error is not None:
+                raise self._error
+            else:
+                return
+
+    def _track(self, rc, mid):
+        # Return a future resolved when the broker answers message mid.
+        if rc != mqtt.MQTT_ERR_SUCCESS:
+            raise MQTTError(rc)
+        future = self._loop.create_future()
+        self._pending[mid] = future
+        return future
+
+    def _mqtt_connect(self, client, userdata, flags, reason_code, properties):
+        future = self._connecting
+        if reason_code.is_failure:
+            if future is not None and not future.done():
+                future.set_exception(MQTTError(reason_code))
+            return
+        self._connected = True
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def _mqtt_disconnect(self, client, userdata, flags, reason_code, properties):
+        self._connected = False
+        error = MQTTError(reason_code) if reason_code.is_failure else None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(MQTTError(mqtt.MQTT_ERR_CONN_LOST))
+        self._pending.clear()
+        if self._connecting is not None and not self._connecting.done():
+            self._connecting.set_exception(error or MQTTError(mqtt.MQTT_ERR_CONN_LOST))
+        if self._disconnecting is not None and not self._disconnecting.done():
+            self._disconnecting.set_result(None)
+        elif error is not None:
+            self._error = error
+        if self._message_ready is not None:
+            self._message_ready.set()
+
+    def _mqtt_message(self, client, userdata, msg):
+        kind, name = self._router.route(msg.topic)
+        payload = '' if msg.payload is None else msg.payload.decode('utf-8')
+        if len(self._messages) >= self.max_queued:
+            self._messages.popleft()
+            self.dropped += 1
+        self._messages.append((name, payload))
+        self._message_ready.set()
+
+    def _mqtt_acked(self, client, userdata, mid, reason_codes, properties):
+        future = self._pending.pop(mid, None)
+        if future is None or future.done():
+            return
+        failed = [code for code in reason_codes if code.is_failure]
+        if failed:
+            future.set_exception(MQTTError(failed[0]))
+        else:
+            future.set_result([code.value for code in reason_codes])
+
+    def _mqtt_publish(self, client, userdata, mid, reason_code, properties):
+        future = self._pending.pop(mid, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    # paho-mqtt calls these to have the event loop watch its socket.  The
+    # first ones happen during connect, on an executor thread.
+    def _in_loop(self, fn, *args):
+        if threading.get_ident() == self._loop_thread:
+            fn(*args)
+        else:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def _socket_open(self, client, userdata, sock):
+        self._in_loop(self._watch, sock)
+
+    def _socket_close(self, client, userdata, sock):
+        self._in_loop(self._unwatch, sock)
+
+    def _socket_register_write(self, client, userdata, sock):
+        self._in_loop(self._loop.add_writer, sock, self._client.loop_write)
+
+    def _socket_unregister_write(self, client, userdata, sock):
+        self._in_loop(self._loop.remove_writer, sock)
+
+    def _watch(self, sock):
+        self._loop.add_reader(sock, self._read)
+        self._misc = self._loop.create_task(self._misc_loop())
+
+    def _unwatch(self, sock):
+        self._loop.remove_reader(sock)
+        self._loop.remove_writer(sock)
+        if self._misc is not None:
+            self._misc.cancel()
+            self._misc = None
+
+    def _read(self):
+        self._client.loop_read()
+        # TLS can hold decrypted packets the event loop doesn't know about.
+        sock = self._client.socket()
+        while sock is not None and getattr(sock, 'pending', None) and sock.pending():
+            if self._client.loop_read() != mqtt.MQTT_ERR_SUCCESS:
+                break
+            sock = self._client.socket()
+
+    async def _misc_loop(self):
+        # Sends keep alives and retries unacknowledged messages.
+        while self._client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            await asyncio.sleep(1)
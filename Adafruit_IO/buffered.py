@@ -0,0 +1,211 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+def _now():
+    # Capture time of a point, in the ISO 8601 format Adafruit IO uses.
+    return datetime.now(timezone.utc).isoformat()
+
+
+class BufferedSender(object):
+    """Collects values sent to feeds and uploads them in batches.
+
+    send() only buffers the value, stamped with the time it was captured, so
+    the feed history is the same as if it had been sent right away.  A
+    feed's buffer is uploaded with one send_batch_data call when it holds
+    max_batch points, or by a background thread once its oldest point is
+    max_age seconds old.  At most max_points points are buffered in total:
+    when that is reached send() flushes every feed before returning, and if
+    uploads keep failing the oldest points are dropped (and counted in the
+    dropped attribute).
+
+    send() never raises upload errors, they are logged and the points stay
+    buffered to be sent again.  A feed whose upload failed is only retried
+    automatically after a backoff delay from the client's RetryPolicy, which
+    grows with every failure.  flush() and close() try every feed and raise
+    the first error.
+    """
+
+    def __init__(self, client, max_batch=100, max_age=5.0, max_points=10000):
+        """Create a buffered sender and start its flush thread.
+
+        :param Client client: REST client used to upload the batches.
+        :param int max_batch: Points per feed that trigger an upload.
+        :param float max_age: Seconds a point may wait before it is uploaded.
+        :param int max_points: Maximum number of points buffered in total.
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self.max_age = max_age
+        self.max_points = max_points
+        self.dropped = 0
+        self._buffers = {}
+        self._oldest = {}
+        # Failed uploads in a row, and when to try again, per feed.
+        self._failures = {}
+        self._retry_at = {}
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send(self, feed, value, metadata=None):
+        """Buffer a value for a feed.  Takes the same arguments as
+        Client.send_data.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param string value: Value to send.
+        :param dict metadata: Optional metadata associated with the value.
+        """
+        data = Client._create_payload(value, metadata)
+        if data.created_at is None:
+            data = data._replace(created_at=_now())
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BufferedSender is closed.")
+            buf = self._buffers.setdefault(feed, [])
+            if not buf:
+                self._oldest[feed] = time.monotonic()
+            buf.append(data)
+            self._count += 1
+            now = time.monotonic()
+            full = len(buf) >= self.max_batch and self._retry_at.get(feed, 0) <= now
+            over = self._count >= self.max_points
+        if over:
+            with self._cond:
+                feeds = [f for f in self._buffers if self._retry_at.get(f, 0) <= now]
+            for feed in feeds:
+                self._try_flush(feed)
+            self._trim()
+        elif full:
+            self._try_flush(feed)
+
+    send_data = send
+
+    def flush(self):
+        """Upload every buffered point now.  Raises the first upload error,
+        after putting the points that failed back in the buffer."""
+        error = None
+        with self._cond:
+            feeds = list(self._buffers)
+        for feed in feeds:
+            try:
+                self._flush_feed(feed)
+            except Exception as err:
+                error = error or err
+        if error is not None:
+            raise error
+
+    def close(self):
+        """Stop the flush thread and upload whatever is still buffered."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _try_flush(self, feed):
+        try:
+            self._flush_feed(feed)
+        except Exception as err:
+            logger.warning('Failed to send buffered data to %s: %s', feed, err)
+
+    def _flush_feed(self, feed):
+        with self._cond:
+            points = self._buffers.pop(feed, None)
+            oldest = self._oldest.pop(feed, None)
+            if not points:
+                return
+            self._count -= len(points)
+        try:
+            results = self.client.send_batch_data(feed, points)
+        except Exception:
+            self._requeue(feed, points, oldest)
+            raise
+        failed = [result for result in results if result.error is not None]
+        if failed:
+            self._requeue(feed, [data for result in failed for data in result.data], oldest)
+            raise failed[0].error
+        with self._cond:
+            self._failures.pop(feed, None)
+            self._retry_at.pop(feed, None)
+
+    def _requeue(self, feed, points, oldest):
+        # Put points that failed to upload back in front of newer ones,
+        # dropping the oldest points if that would exceed max_points.
+        with self._cond:
+            failures = self._failures.get(feed, 0) + 1
+            self._failures[feed] = failures
+            self._retry_at[feed] = time.monotonic() + \
+                self.client.retry.backoff_delay(failures)
+            points.extend(self._buffers.pop(feed, []))
+            excess = self._count + len(points) - self.max_points
+            if excess > 0:
+                del points[:excess]
+                self.dropped += excess
+            if points:
+                self._buffers[feed] = points
+                self._oldest[feed] = oldest
+                self._count += len(points)
+
+    def _trim(self):
+        # Drop the oldest points while more than max_points are buffered.
+        with self._cond:
+            excess = self._count - self.max_points
+            for feed in sorted(self._oldest, key=self._oldest.get):
+                if excess <= 0:
+                    break
+                buf = self._buffers[feed]
+                drop = min(excess, len(buf))
+                del buf[:drop]
+                if not buf:
+                    del self._buffers[feed]
+                    del self._oldest[feed]
+                self._count -= drop
+                self.dropped += drop
+                excess -= drop
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait(timeout=min(self.max_age, 1.0))
+                if self._closed:
+                    return
+                now = time.monotonic()
+                due = [feed for feed, oldest in self._oldest.items()
+                       if now - oldest >= self.max_age and
+                       self._retry_at.get(feed, 0) <= now]
+            for feed in due:
+                self._try_flush(feed)
@@ -0,0 +1,217 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from .client import MAX_PAGE_LIMIT
+from .model import Data
+
+# Data fields stored for every cached point.
+CACHE_FIELDS = ('id', 'created_epoch', 'created_at', 'value', 'feed_id',
+                'lat', 'lon', 'ele')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS points (
+    username TEXT NOT NULL,
+    feed TEXT NOT NULL,
+    id TEXT NOT NULL,
+    created_epoch REAL,
+    created_at TEXT,
+    value TEXT,
+    feed_id INTEGER,
+    lat REAL,
+    lon REAL,
+    ele REAL,
+    PRIMARY KEY (username, feed, id)
+);
+CREATE INDEX IF NOT EXISTS points_by_time ON points (username, feed, created_epoch);
+CREATE TABLE IF NOT EXISTS synced (
+    username TEXT NOT NULL,
+    feed TEXT NOT NULL,
+    low_water REAL,
+    high_water REAL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (username, feed)
+);
+"""
+
+
+def _epoch(value):
+    # Time bounds may be epoch seconds, datetimes or ISO 8601 strings.
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    return float(value)
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+
+
+class FeedCache(object):
+    """Persistent local copy of feed history, stored in SQLite.
+
+    The first sync of a feed downloads its history; later syncs only fetch
+    points created since the newest cached point (the high-water mark).
+    data() serves time ranges from the local copy, and only syncs when the
+    range reaches past what has been cached.  Points are keyed by the
+    client's username, the feed and the point id, so one database can hold
+    several accounts and feeds.
+    """
+
+    def __init__(self, client, path):
+        """Open (or create) a cache.
+
+        :param Client client: REST client used to download feed data.
+        :param string path: Path of the SQLite database file.
+        """
+        self.client = client
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _state(self, feed):
+        with self._lock:
+            return self._db.execute(
+                "SELECT low_water, high_water, synced_at FROM synced "
+                "WHERE username = ? AND feed = ?", (self.client.username, feed)).fetchone()
+
+    def _store(self, feed, points):
+        # Insert (or refresh) a page of raw data records.
+        rows = [(self.client.username, feed) + tuple(p.get(f) for f in CACHE_FIELDS)
+                for p in points]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO points (username, feed, {0}) "
+                "VALUES (?, ?, {1})".format(', '.join(CACHE_FIELDS),
+                                            ', '.join('?' * len(CACHE_FIELDS))), rows)
+
+    def _download(self, feed, start=None, end=None):
+        # Store every point between start and end, returning the newest epoch.
+        newest = None
+        points = self.client.iter_data(feed, raw=True,
+                                       start_time=None if start is None else _iso(start),
+                                       end_time=None if end is None else _iso(end))
+        page = []
+        for point in points:
+            epoch = point.get('created_epoch')
+            if epoch is not None and (newest is None or epoch > newest):
+                newest = epoch
+            page.append(point)
+            if len(page) >= MAX_PAGE_LIMIT:
+                self._store(feed, page)
+                page = []
+        self._store(feed, page)
+        return newest
+
+    def sync(self, feed, since=None):
+        """Bring the cached copy of a feed up to date.  Only points created
+        after the newest cached point are downloaded, plus any older points
+        back to `since` that haven't been cached yet.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param since: Optional oldest time to cache, as epoch seconds, a
+            datetime or an ISO 8601 string.  Defaults to the whole history.
+        """
+        since = _epoch(since)
+        synced_at = time.time()
+        state = self._state(feed)
+        if state is None:
+            low, high = since, self._download(feed, start=since)
+        else:
+            low, high, _ = state
+            if low is not None and (since is None or since < low):
+                # Backfill history older than what was cached before.
+                self._download(feed, start=since, end=low)
+                low = since
+            # The start time is inclusive, so the newest cached point is
+            # fetched again and simply replaced.
+            newest = self._download(feed, start=high)
+            if newest is not None and (high is None or newest > high):
+                high = newest
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO synced (username, feed, low_water, high_water, "
+                "synced_at) VALUES (?, ?, ?, ?, ?)",
+                (self.client.username, feed, low, high, synced_at))
+
+    def covers(self, feed, start_time=None, end_time=None):
+        """Return True if the cache already holds every point of the feed
+        between start_time and end_time.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param start_time: Optional oldest time, as epoch seconds, a datetime
+            or an ISO 8601 string.
+        :param end_time: Optional newest time, in the same formats.
+        """
+        state = self._state(feed)
+        if state is None:
+            return False
+        low, _, synced_at = state
+        start, end = _epoch(start_time), _epoch(end_time)
+        if low is not None and (start is None or start < low):
+            return False
+        return end is not None and end <= synced_at
+
+    def data(self, feed, start_time=None, end_time=None, max_results=None):
+        """Return the data of a feed between start_time and end_time, newest
+        first, as Data instances.  The range is served from the cache when it
+        is already covered, otherwise the feed is synced first.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param start_time: Optional oldest time, as epoch seconds, a datetime
+            or an ISO 8601 string.
+        :param end_time: Optional newest time, in the same formats.
+        :param int max_results: Optional maximum number of points to return.
+        """
+        if not self.covers(feed, start_time, end_time):
+            self.sync(feed, since=start_time)
+        query = "SELECT {0} FROM points WHERE username = ? AND feed = ?".format(
+            ', '.join(CACHE_FIELDS))
+        args = [self.client.username, feed]
+        if start_time is not None:
+            query += " AND created_epoch >= ?"
+            args.append(_epoch(start_time))
+        if end_time is not None:
+            query += " AND created_epoch <= ?"
+            args.append(_epoch(end_time))
+        query += " ORDER BY created_epoch DESC"
+        if max_results is not None:
+            query += " LIMIT ?"
+            args.append(max_results)
+        with self._lock:
+            rows = self._db.execute(query, args).fetchall()
+        return [Data(**dict(zip(CACHE_FIELDS, row))) for row in rows]
@@ -20,51 +20,223 @@
 # SOFTWARE.
 import time
 from time import struct_time
-import json
-import platform
-try:
-    from importlib.metadata import version as package_version  # Python 3.8+
-except ImportError:
-    try:
-        from importlib_metadata import version as package_version  # Backport for <3.8
-    except ImportError:  # pragma: no cover - fallback for older Python
-        package_version = None
-        import pkg_resources
+from collections import deque, namedtuple
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from functools import lru_cache
+import queue
+import threading
 import re
 from urllib.parse import urlparse
 from urllib.parse import parse_qs
+from urllib.parse import urlencode
 # import logging
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .codec import get_codec
 from .errors import RequestError, ThrottlingError
-from .model import Data, Feed, Group, Dashboard, Block, Layout
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .model import Data, Feed, Group, Dashboard, Block, Layout, LazySequence
+from .datablock import DataBlock, DEFAULT_BLOCK_FIELDS
 
 DEFAULT_PAGE_LIMIT = 100
 
-# set outgoing version, pulled from package metadata
-if package_version is not None:
-    version = package_version("Adafruit_IO")
-else:
-    version = pkg_resources.require("Adafruit_IO")[0].version
-default_headers = {
-    'User-Agent': 'AdafruitIO-Python/{0} ({1}, {2} {3})'.format(version,
-                                                                platform.platform(),
-                                                                platform.python_implementation(),
-                                                                platform.python_version())
-}
+# Largest page of data the service returns for a single request.
+MAX_PAGE_LIMIT = 1000
+
+# Page download times (in seconds) used to shrink or grow the page size.
+SLOW_PAGE_SEC = 10.0
+FAST_PAGE_SEC = 2.0
+
+# Connection pool defaults for the shared keep-alive session (these match the
+# requests library defaults).
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Default (connect, read) timeouts in seconds for each REST request.
+DEFAULT_TIMEOUT = (10.0, 30.0)
+
+# Number of points sent per request by send_batch_data.
+DEFAULT_BATCH_SIZE = 1000
+
+# Outcome of one chunk uploaded by send_batch_data.  offset is the position of
+# the chunk's first point in the input; data holds the chunk's points if it
+# failed (so it can be retried), otherwise None.
+BatchResult = namedtuple('BatchResult', ['offset', 'count', 'error', 'data'])
+
+# Marks the end of a prefetched iterator.
+_DONE = object()
+
+
+def _package_version():
+    # Outgoing version, pulled from package metadata (or the source tree if the
+    # package isn't installed).  Loading importlib.metadata is slow, so this is
+    # only done once the first request is made.
+    try:
+        try:
+            from importlib.metadata import version as package_version  # Python 3.8+
+        except ImportError:
+            from importlib_metadata import version as package_version  # Backport for <3.8
+        return package_version("Adafruit_IO")
+    except Exception:
+        from ._version import __version__
+        return __version__
+
+
+@lru_cache(maxsize=None)
+def _default_headers():
+    import platform
+    return {
+        'User-Agent': 'AdafruitIO-Python/{0} ({1}, {2} {3})'.format(_package_version(),
+                                                                    platform.platform(),
+                                                                    platform.python_implementation(),
+                                                                    platform.python_version())
+    }
+
+
+def __getattr__(name):
+    # version and default_headers used to be computed when the module was
+    # imported, keep them available for code that reads them.
+    if name == 'version':
+        return _package_version()
+    if name == 'default_headers':
+        return dict(_default_headers())
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+def _prefetch(iterable, depth):
+    """Consume an iterator on a background thread, keeping up to `depth`
+    items ready ahead of the caller.  Exceptions raised by the iterator are
+    re-raised to the caller, and closing the returned generator stops the
+    background thread.
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as err:
+            put((_DONE, err))
+        else:
+            put((_DONE, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _copy(value):
+    # Copy cached lists, namedtuples are immutable already.
+    return list(value) if isinstance(value, list) else value
+
+
+def _format_time(value):
+    # Accept datetimes as well as the ISO 8601 strings the service expects.
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class DataIterator(object):
+    """Iterator over the pages of a feed's history, returned by
+    Client.iter_data().  The cursor attribute is a token for the first page
+    that has not been fully read yet, or None once all data has been read.
+    """
+
+    def __init__(self, pages, raw=False):
+        self.cursor = None
+        self._items = self._iter_items(pages, raw)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    def _iter_items(self, pages, raw):
+        for page, next_params in pages:
+            if not raw:
+                page = Data.from_dicts(page)
+            yield from page[:-1]
+            # Move the cursor on before handing out the last item of a page,
+            # so a caller that stops here doesn't read the page again.
+            self.cursor = urlencode(next_params) if next_params else None
+            if page:
+                yield page[-1]
+
+
+def _parse_next_link(link_header):
+    # Return the `next` page URL from a pagination Link header, if any.
+    res = re.search('rel="next", <(.+?)>', link_header)
+    if not res:
+        return
+    return res.groups()[0]
+
 
 class Client(object):
     """Client instance for interacting with the Adafruit IO service using its
     REST API.  Use this client class to send, receive, and enumerate feed data.
     """
 
-    def __init__(self, username, key, proxies=None, base_url='https://io.adafruit.com'):
+    def __init__(self, username, key, proxies=None, base_url='https://io.adafruit.com',
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False,
+                 rate_limit=None, timeout=DEFAULT_TIMEOUT, retry=None,
+                 http_cache=None, json_codec=None):
         """Create an instance of the Adafruit IO REST API client.  Key must be
         provided and set to your Adafruit IO access key value.  Optionaly
         provide a proxies dict in the format used by the requests library,
         and a base_url to point at a different Adafruit IO service
         (the default is the production Adafruit IO service over SSL).
+
+        All requests share one keep-alive session, so connections to Adafruit
+        IO are reused instead of being opened for every call.  Call close()
+        (or use the client as a context manager) to release them.
+
+        :param int pool_connections: Number of per-host connection pools to cache.
+        :param int pool_maxsize: Maximum number of connections kept open per host.
+        :param bool pool_block: If True, block when all pooled connections to
+            a host are busy instead of opening a new, unpooled connection.
+        :param rate_limit: Optional client-side rate limit, either a number of
+            data points per minute or a RateLimiter instance (which can be
+            shared between clients of the same account).  Requests are
+            delayed to stay within it instead of failing with ThrottlingError.
+        :param timeout: Seconds to wait for each request, either one number or
+            a (connect, read) tuple.  None waits forever.
+        :param RetryPolicy retry: Policy for retrying failed requests.  The
+            default retries GET and DELETE calls up to 3 times on connection
+            errors and 5xx responses; pass RetryPolicy(max_attempts=1) to
+            disable retries.
+        :param HTTPCache http_cache: Optional cache for feed, group, dashboard
+            and block lookups.  Cached results are reused for its ttl, then
+            revalidated with conditional requests.  A cache can be shared
+            between clients.
+        :param json_codec: JSON library used for request and response bodies:
+            a codec instance or 'json', 'orjson' or 'ujson'.  Defaults to the
+            fastest one installed.
         """
         self.username = username
         self.key = key
@@ -79,6 +251,32 @@ class Client(object):
         # Store the last response of a get or post
         self._last_response = None
 
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+        self.timeout = timeout
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.http_cache = http_cache
+        self.json_codec = get_codec(json_codec)
+
+        # Pooled keep-alive session used by every REST call.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def close(self):
+        """Close the pooled HTTP session and release its connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @staticmethod
     def to_red(data):
         """Hex color feed to red channel.
@@ -105,7 +303,7 @@ class Client(object):
 
     @staticmethod
     def _headers(given):
-        headers = default_headers.copy()
+        headers = dict(_default_headers())
         headers.update(given)
         return headers
 
@@ -118,47 +316,158 @@ class Client(object):
         return Data(value=value)
 
     @staticmethod
-    def _handle_error(response):
+    def _handle_error(response, codec=None):
         # Throttling Error
         if response.status_code == 429:
             raise ThrottlingError()
         # Resource on AdafruitIO not Found Error
         elif response.status_code == 400:
-            raise RequestError(response)
+            raise RequestError(response, codec)
         # Handle all other errors (400 & 500 level HTTP responses)
         elif response.status_code >= 400:
-            raise RequestError(response)
+            raise RequestError(response, codec)
         # Else do nothing if there was no error.
 
     def _compose_url(self, path):
         return '{0}/api/{1}/{2}/{3}'.format(self.base_url, 'v2', self.username, path)
 
+    def _timeout(self, started):
+        # Per-attempt (connect, read) timeout, shortened to fit the deadline.
+        # Raises Timeout if the deadline has already passed (for example
+        # while waiting for the rate limiter), as requests rejects a zero
+        # timeout.
+        remaining = self.retry.remaining(started)
+        if remaining is not None and remaining <= 0:
+            raise requests.Timeout("Deadline of {0} seconds exceeded.".format(self.retry.deadline))
+        if remaining is None or self.timeout is None:
+            return self.timeout if remaining is None else remaining
+        if isinstance(self.timeout, tuple):
+            return tuple(min(t, remaining) if t is not None else remaining
+                         for t in self.timeout)
+        return min(self.timeout, remaining)
+
+    def _request(self, method, path, points=1, **kwargs):
+        started = self.retry.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(points)
+            timeout = self._timeout(started)
+            try:
+                response = self._session.request(method, self._compose_url(path),
+                                                 proxies=self.proxies,
+                                                 timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                delay = self.retry.next_delay(
+                    method, attempt, started,
+                    connect_failed=isinstance(err, requests.ConnectTimeout))
+                if delay is None:
+                    raise
+                self.retry.sleep(delay)
+                continue
+            self._last_response = response
+            if response.status_code == 429 and self.rate_limiter is not None:
+                retry_after = self._retry_after(response)
+                self.rate_limiter.throttled(retry_after)
+                # A throttled request wasn't applied, so like a connection
+                # that couldn't be opened it is retried for any method.  The
+                # limiter does the waiting before the next attempt.
+                if self.retry.next_delay(method, attempt, started, retry_after=retry_after,
+                                         connect_failed=True) is not None:
+                    continue
+            if response.status_code >= 400:
+                delay = self.retry.next_delay(method, attempt, started,
+                                              status_code=response.status_code,
+                                              retry_after=self._retry_after(response))
+                if delay is not None:
+                    self.retry.sleep(delay)
+                    continue
+            self._handle_error(response, self.json_codec)
+            if method != 'GET' and self.http_cache is not None:
+                self._invalidate_cache(path)
+            return response
+
+    @staticmethod
+    def _retry_after(response):
+        # Seconds the service asked us to wait before retrying, if it said.
+        try:
+            return float(response.headers['Retry-After'])
+        except (KeyError, ValueError):
+            return None
+
+    def _get_response(self, path, params=None):
+        return self._request('GET', path,
+                             headers=self._headers({'X-AIO-Key': self.key}),
+                             params=params)
+
     def _get(self, path, params=None):
-        response = requests.get(self._compose_url(path),
-                                headers=self._headers({'X-AIO-Key': self.key}),
-                                proxies=self.proxies,
-                                params=params)
-        self._last_response = response
-        self._handle_error(response)
-        return response.json()
-
-    def _post(self, path, data):
-        response = requests.post(self._compose_url(path),
+        return self._decode(self._get_response(path, params))
+
+    def _decode(self, response):
+        return self.json_codec.loads(response.content)
+
+    def _cache_key(self, path, variant=None):
+        # Keys include the service and account, so clients can share a cache.
+        levels = tuple(level for level in path.split('/') if level)
+        return (self.base_url, self.username, levels, variant)
+
+    def _invalidate_cache(self, path):
+        # Drop the cached metadata a write to path may have changed: the
+        # listings and objects it is under and everything under the object
+        # written.  Groups list their feeds, so changing a feed drops them
+        # too, and creating a feed in a group drops the feed listing.
+        # Sending data doesn't change metadata.
+        written = self._cache_key(path)[2]
+        if written[2:3] == ('data',):
+            return
+        account = (self.base_url, self.username)
+
+        def changed(key):
+            if key[:2] != account:
+                return False
+            levels = key[2]
+            return (levels == written[:len(levels)] or levels[:2] == written[:2] or
+                    (written[0] == 'feeds' and levels[:1] == ('groups',)) or
+                    ('feeds' in written and levels == ('feeds',)))
+
+        self.http_cache.invalidate(changed)
+
+    def _get_cached(self, path, parse, variant=None):
+        # GET a metadata listing through the HTTP cache, if one is enabled.
+        # Parsed objects are cached (separately per variant of parse), so a
+        # hit costs neither a request nor parsing; lists are copied so callers
+        # can't change the cached value.
+        cache = self.http_cache
+        if cache is None:
+            return parse(self._get(path))
+        key = self._cache_key(path, variant)
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            return _copy(entry.value)
+        headers = {'X-AIO-Key': self.key}
+        if entry is not None:
+            headers.update(cache.validators(entry))
+        response = self._request('GET', path, headers=self._headers(headers))
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(key)
+            return _copy(entry.value)
+        value = parse(self._decode(response))
+        cache.put(key, value, response.headers.get('ETag'),
+                  response.headers.get('Last-Modified'))
+        return _copy(value)
+
+    def _post(self, path, data, points=1):
+        response = self._request('POST', path, points=points,
                                  headers=self._headers({'X-AIO-Key': self.key,
                                                         'Content-Type': 'application/json'}),
-                                 proxies=self.proxies,
-                                 data=json.dumps(data))
-        self._last_response = response
-        self._handle_error(response)
-        return response.json()
+                                 data=self.json_codec.dumps(data))
+        return self._decode(response)
 
     def _delete(self, path):
-        response = requests.delete(self._compose_url(path),
-                                   headers=self._headers({'X-AIO-Key': self.key,
-                                                          'Content-Type': 'application/json'}),
-                                   proxies=self.proxies)
-        self._last_response = response
-        self._handle_error(response)
+        self._request('DELETE', path,
+                      headers=self._headers({'X-AIO-Key': self.key,
+                                             'Content-Type': 'application/json'}))
 
     # Data functionality.
     def send_data(self, feed, value, metadata=None, precision=None):
@@ -182,18 +491,122 @@ class Client(object):
 
     send = send_data
 
-    def send_batch_data(self, feed, data_list):
-        """Create a new row of data in the specified feed.  Feed can be a feed
-        ID, feed key, or feed name.  Data must be an instance of the Data class
-        with at least a value property set on it.  Returns a Data instance with
-        details about the newly appended row of data.
+    def send_batch_data(self, feed, data_list, chunk_size=DEFAULT_BATCH_SIZE, max_workers=1):
+        """Create new rows of data in the specified feed.  Feed can be a feed
+        ID, feed key, or feed name.  Each item must be an instance of the Data
+        class with at least a value property set on it.
+
+        data_list can be any iterable (including a generator); it is read
+        chunk_size points at a time and each chunk is sent as one batch
+        request, so very long backfills never have to be held in memory.  With
+        max_workers above 1 the chunks are uploaded concurrently, and points
+        without a created_at are stamped (in increasing order) as they are
+        read so the feed keeps the order of the input.
+
+        Returns a list of BatchResult, one per chunk.  A chunk that failed has
+        its error and its points set so it can be sent again.  If every chunk
+        failed the first error is raised instead.
 
         :param string feed: Name/Key/ID of Adafruit IO feed.
-        :param Data data_list: Multiple data values.
+        :param data_list: Iterable of Data values.
+        :param int chunk_size: Maximum number of points per request.
+        :param int max_workers: Maximum number of chunks uploaded at once.
         """
         path = "feeds/{0}/data/batch".format(feed)
-        data_dict = type(data_list)((data._asdict() for data in data_list))
-        self._post(path, {"data": data_dict})
+
+        def upload(offset, chunk):
+            try:
+                self._post(path, {"data": [data._asdict() for data in chunk]},
+                           points=len(chunk))
+            except Exception as err:
+                return BatchResult(offset, len(chunk), err, chunk)
+            return BatchResult(offset, len(chunk), None, None)
+
+        chunks = self._chunk_data(data_list, chunk_size, stamp=max_workers > 1)
+        if max_workers <= 1:
+            results = [upload(offset, chunk) for offset, chunk in chunks]
+        else:
+            results = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Keep only a couple of chunks per worker queued, so the input
+                # is read as fast as it is uploaded.
+                pending = deque()
+                for offset, chunk in chunks:
+                    if len(pending) >= 2 * max_workers:
+                        results.append(pending.popleft().result())
+                    pending.append(executor.submit(upload, offset, chunk))
+                results.extend(future.result() for future in pending)
+        if results and all(result.error is not None for result in results):
+            raise results[0].error
+        return results
+
+    @staticmethod
+    def _chunk_data(data_list, chunk_size, stamp=False):
+        # Yield (offset, chunk) lists of at most chunk_size points.  With stamp
+        # set, points without created_at get strictly increasing timestamps.
+        items = iter(data_list)
+        offset = 0
+        last = None
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                return
+            if stamp:
+                for i, data in enumerate(chunk):
+                    if data.created_at is None:
+                        now = datetime.now(timezone.utc)
+                        if last is not None and now <= last:
+                            now = last + timedelta(microseconds=1)
+                        last = now
+                        chunk[i] = data._replace(created_at=now.isoformat())
+            yield offset, chunk
+            offset += len(chunk)
+
+    def send_group_data(self, group, values, metadata=None):
+        """Send a value to several feeds of a group with a single request.
+        Returns a list of Data instances, one per newly created value.
+
+        :param string group: Key of the Adafruit IO group.
+        :param dict values: Values to send, keyed by feed key within the group.
+        :param dict metadata: Optional metadata shared by all values (lat,
+            lon, ele and created_at).
+        """
+        path = "groups/{0}/data".format(group)
+        payload = {"feeds": [{"key": key, "value": value} for key, value in values.items()]}
+        if metadata is not None:
+            location = {k: metadata[k] for k in ('lat', 'lon', 'ele')
+                        if metadata.get(k) is not None}
+            if location:
+                payload["location"] = location
+            if metadata.get('created_at') is not None:
+                payload["created_at"] = _format_time(metadata['created_at'])
+        return Data.from_dicts(self._post(path, payload, points=len(values)))
+
+    def send_group_batch_data(self, group, rows, chunk_size=DEFAULT_BATCH_SIZE, max_workers=1):
+        """Send many timestamped rows of values to the feeds of a group.  The
+        rows are regrouped per feed and each feed is sent with
+        send_batch_data, so the number of requests depends on the number of
+        feeds rather than the number of rows.
+
+        Returns a dict with the list of BatchResult for every feed, in the
+        order the feeds first appear.  If every chunk of a feed failed its
+        entry holds the error instead.
+
+        :param string group: Key of the Adafruit IO group.
+        :param rows: Iterable of (created_at, {feed_key: value}) pairs, where
+            created_at is an ISO 8601 string or a datetime.
+        :param int chunk_size: Maximum number of points per request.
+        :param int max_workers: Maximum number of feeds sent at once.
+        """
+        points = {}
+        for created_at, values in rows:
+            created_at = _format_time(created_at)
+            for key, value in values.items():
+                points.setdefault(key, []).append(Data(value=value, created_at=created_at))
+        return self._map_feeds(
+            lambda key: self.send_batch_data("{0}.{1}".format(group, key), points[key],
+                                             chunk_size=chunk_size),
+            list(points), max_workers)
 
     def append(self, feed, value):
         """Helper function to simplify adding a value to a feed.  Will append the
@@ -341,7 +754,7 @@ class Client(object):
         path = "feeds/{0}/data/previous".format(feed)
         return Data.from_dict(self._get(path))
 
-    def data(self, feed, data_id=None, max_results=DEFAULT_PAGE_LIMIT):
+    def data(self, feed, data_id=None, max_results=DEFAULT_PAGE_LIMIT, prefetch=0, lazy=False):
         """Retrieve data from a feed. If data_id is not specified then all the data
         for the feed will be returned in an array.
 
@@ -349,6 +762,11 @@ class Client(object):
         :param string data_id: ID of the piece of data to delete.
         :param int max_results: The maximum number of results to return. To
             return all data, set to None.
+        :param int prefetch: Number of pages to download ahead on a background
+            thread while earlier pages are being parsed.  Defaults to 0, which
+            downloads one page at a time.
+        :param bool lazy: Return a LazySequence that only builds Data instances
+            when they are accessed, instead of a list.
         """
         if max_results is None:
             res = self._get(f'feeds/{feed}/details')
@@ -357,20 +775,163 @@ class Client(object):
             path = "feeds/{0}/data/{1}".format(feed, data_id)
             return Data.from_dict(self._get(path))
 
-        params = {'limit': max_results} if max_results else None
         data = []
-        path = "feeds/{0}/data".format(feed)
-        while len(data) < max_results:
-            data.extend(list(map(Data.from_dict, self._get(path,
-                                                           params=params))))
-            nlink = self.get_next_link()
-            if not nlink:
+        pages = self._iter_pages("feeds/{0}/data".format(feed), max_results=max_results)
+        if prefetch:
+            pages = _prefetch(pages, prefetch)
+        for page, _ in pages:
+            data.extend(page if lazy else Data.from_dicts(page))
+        return LazySequence(Data, data) if lazy else data
+
+    def iter_data(self, feed, start_time=None, end_time=None, page_size=None,
+                  raw=False, cursor=None, prefetch=0):
+        """Stream the data of a feed, newest first, one page at a time.  Unlike
+        data() only the current page is held in memory, and no extra request
+        is made to count the feed's data first.
+
+        Returns an iterator of Data instances (or of the raw dicts sent by the
+        service if raw is True).  Its cursor attribute holds a token for the
+        next unread page, or None once the history is exhausted; pass it back
+        as cursor to resume an interrupted download.  Resuming restarts at a
+        page boundary, so the rest of a partially read page is returned again.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param start_time: Optional oldest time to return, as an ISO 8601
+            string or datetime.
+        :param end_time: Optional newest time to return, as an ISO 8601
+            string or datetime.
+        :param int page_size: Number of points per request.  Defaults to an
+            adaptive size of up to 1000 points.
+        :param bool raw: Yield the decoded JSON dicts instead of Data instances.
+        :param string cursor: Cursor from a previous iterator to resume from.
+        :param int prefetch: Number of pages to download ahead on a
+            background thread.
+        """
+        if cursor is not None:
+            params = {k: v[-1] for k, v in parse_qs(cursor).items()}
+        else:
+            params = {}
+            if start_time is not None:
+                params['start_time'] = _format_time(start_time)
+            if end_time is not None:
+                params['end_time'] = _format_time(end_time)
+        pages = self._iter_pages("feeds/{0}/data".format(feed), params=params,
+                                 page_size=page_size)
+        if prefetch:
+            pages = _prefetch(pages, prefetch)
+        return DataIterator(pages, raw)
+
+    def data_block(self, feed, start_time=None, end_time=None, max_results=None,
+                   fields=DEFAULT_BLOCK_FIELDS, prefetch=0):
+        """Retrieve the data of a feed into a columnar DataBlock, which is
+        filled straight from the JSON pages without creating Data instances
+        and uses a fraction of the memory of data().
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param start_time: Optional oldest time to return, as an ISO 8601
+            string or datetime.
+        :param end_time: Optional newest time to return, as an ISO 8601
+            string or datetime.
+        :param int max_results: The maximum number of points to return.
+            Defaults to None, which returns all points.
+        :param fields: Names of the other DATA_FIELDS to keep for every point,
+            besides created_epoch, value and location.
+        :param int prefetch: Number of pages to download ahead on a
+            background thread.
+        """
+        params = {}
+        if start_time is not None:
+            params['start_time'] = _format_time(start_time)
+        if end_time is not None:
+            params['end_time'] = _format_time(end_time)
+        pages = self._iter_pages("feeds/{0}/data".format(feed), params=params,
+                                 max_results=max_results)
+        if prefetch:
+            pages = _prefetch(pages, prefetch)
+        block = DataBlock(fields)
+        for page, _ in pages:
+            block.extend(page)
+        block.sort()
+        return block
+
+    def _iter_pages(self, path, params=None, max_results=None, page_size=None):
+        """Yield the decoded records of a paginated listing one page at a time,
+        following the Link header until max_results records (or all of them,
+        if None) have been returned.  Each page is yielded together with the
+        query parameters of the page after it (None after the last page).
+
+        Each page's response is kept local rather than read back from
+        _last_response, so concurrent iterations don't see each other's pages.
+        The page size starts at the service maximum, is halved when a page is
+        slow to arrive (to stay clear of read timeouts) and grows back when
+        pages are fast again, unless a fixed page_size is given.
+        """
+        params = dict(params or {})
+        adaptive = page_size is None
+        if adaptive:
+            page_size = MAX_PAGE_LIMIT
+        count = 0
+        while max_results is None or count < max_results:
+            params['limit'] = page_size if max_results is None else \
+                min(page_size, max_results - count)
+            started = time.monotonic()
+            response = self._get_response(path, params=params)
+            page = self._decode(response)
+            elapsed = time.monotonic() - started
+            if adaptive and elapsed > SLOW_PAGE_SEC:
+                page_size = max(DEFAULT_PAGE_LIMIT, page_size // 2)
+            elif adaptive and elapsed < FAST_PAGE_SEC:
+                page_size = min(MAX_PAGE_LIMIT, page_size * 2)
+            count += len(page)
+            nlink = _parse_next_link(response.headers.get('link', ''))
+            if not nlink or not page:
+                yield page, None
                 break
             # Parse the link for the query parameters
-            params = parse_qs(urlparse(nlink).query)
-            if max_results:
-                params['limit'] = max_results - len(data)
-        return data
+            params = {k: v[-1] for k, v in parse_qs(urlparse(nlink).query).items()
+                      if k != 'limit'}
+            yield page, dict(params)
+
+    def receive_many(self, feeds, max_workers=DEFAULT_POOL_MAXSIZE):
+        """Retrieve the most recent value of several feeds concurrently.
+        Returns a dict mapping each feed to a Data instance.  A feed whose
+        request failed maps to the exception that was raised instead, so one
+        bad feed doesn't hide the results of the others.
+
+        :param list feeds: Names/Keys/IDs of Adafruit IO feeds.
+        :param int max_workers: Maximum number of requests in flight at once.
+            Keep this at or below the client's pool_maxsize so every worker
+            gets a pooled connection.
+        """
+        return self._map_feeds(self.receive, feeds, max_workers)
+
+    def data_many(self, feeds, max_results=DEFAULT_PAGE_LIMIT,
+                  max_workers=DEFAULT_POOL_MAXSIZE):
+        """Retrieve data from several feeds concurrently.  Returns a dict
+        mapping each feed to its list of Data instances, or to the exception
+        raised while retrieving it.
+
+        :param list feeds: Names/Keys/IDs of Adafruit IO feeds.
+        :param int max_results: The maximum number of results to return per
+            feed. To return all data, set to None.
+        :param int max_workers: Maximum number of requests in flight at once.
+        """
+        return self._map_feeds(lambda feed: self.data(feed, max_results=max_results),
+                               feeds, max_workers)
+
+    @staticmethod
+    def _map_feeds(func, feeds, max_workers):
+        # Run func for every feed on a bounded thread pool and collect results
+        # (or errors) per feed, in the order the feeds were given.
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(feed, executor.submit(func, feed)) for feed in feeds]
+            for feed, future in futures:
+                try:
+                    results[feed] = future.result()
+                except Exception as err:
+                    results[feed] = err
+        return results
 
     def get_next_link(self):
         """Parse the `next` page URL in the pagination Link header.
@@ -384,11 +945,7 @@ class Client(object):
         """
         if not self._last_response:
             return
-        link_header = self._last_response.headers['link']
-        res = re.search('rel="next", <(.+?)>', link_header)
-        if not res:
-            return
-        return res.groups()[0]
+        return _parse_next_link(self._last_response.headers['link'])
 
     def create_data(self, feed, data):
         """Create a new row of data in the specified feed.
@@ -411,17 +968,22 @@ class Client(object):
         self._delete(path)
 
     # feed functionality.
-    def feeds(self, feed=None):
+    def feeds(self, feed=None, lazy=False):
         """Retrieve a list of all feeds, or the specified feed.  If feed is not
         specified a list of all feeds will be returned.
 
         :param string feed: Name/Key/ID of Adafruit IO feed, defaults to None.
+        :param bool lazy: Return the list of all feeds as a LazySequence that
+            only builds Feed instances when they are accessed.
         """
         if feed is None:
             path = "feeds"
-            return list(map(Feed.from_dict, self._get(path)))
+            if lazy:
+                return self._get_cached(path, lambda res: LazySequence(Feed, res),
+                                        variant='lazy')
+            return self._get_cached(path, Feed.from_dicts)
         path = "feeds/{0}".format(feed)
-        return Feed.from_dict(self._get(path))
+        return self._get_cached(path, Feed.from_dict)
 
     def create_feed(self, feed, group_key=None):
         """Create the specified feed.
@@ -446,16 +1008,23 @@ class Client(object):
         self._delete(path)
 
     # Group functionality.
-    def groups(self, group=None):
+    def groups(self, group=None, lazy=False):
         """Retrieve a list of all groups, or the specified group.
 
         :param string group: Name/Key/ID of Adafruit IO Group. Defaults to None.
+        :param bool lazy: Build the groups' feeds only when they are accessed,
+            and return the list of all groups as a LazySequence.
         """
         if group is None:
             path = "groups/"
-            return list(map(Group.from_dict, self._get(path)))
+            if lazy:
+                return self._get_cached(path, lambda res: LazySequence(Group, res),
+                                        variant='lazy')
+            return self._get_cached(path, Group.from_dicts)
         path = "groups/{0}".format(group)
-        return Group.from_dict(self._get(path))
+        if lazy:
+            return self._get_cached(path, Group._lazy_from_dict, variant='lazy')
+        return self._get_cached(path, Group.from_dict)
 
     def create_group(self, group):
         """Create the specified group.
@@ -481,9 +1050,9 @@ class Client(object):
         """
         if dashboard is None:
             path = "dashboards/"
-            return list(map(Dashboard.from_dict, self._get(path)))
+            return self._get_cached(path, Dashboard.from_dicts)
         path = "dashboards/{0}".format(dashboard)
-        return Dashboard.from_dict(self._get(path))
+        return self._get_cached(path, Dashboard.from_dict)
 
     def create_dashboard(self, dashboard):
         """Create the specified dashboard.
@@ -510,9 +1079,9 @@ class Client(object):
         """
         if block is None:
             path = "dashboards/{0}/blocks".format(dashboard)
-            return list(map(Block.from_dict, self._get(path)))
+            return self._get_cached(path, Block.from_dicts)
         path = "dashboards/{0}/blocks/{1}".format(dashboard, block)
-        return Block.from_dict(self._get(path))
+        return self._get_cached(path, Block.from_dict)
 
     def create_block(self, dashboard, block):
         """Create the specified block under the specified dashboard.
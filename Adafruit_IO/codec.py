@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+
+# Faster JSON libraries are optional, the standard library is used when
+# neither is installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec(object):
+    """Encodes REST payloads to UTF-8 JSON bytes and decodes responses from
+    bytes, using the standard library json module."""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        """Return obj encoded as UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data):
+        """Decode UTF-8 JSON bytes (or str).  Raises ValueError if data is not
+        valid JSON."""
+        return json.loads(data)
+
+
+def _orjson_default(obj):
+    # orjson doesn't encode tuple subclasses, encode namedtuples (like the
+    # Feeds of a Group) as arrays like the json module does.
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError("Type is not JSON serializable: {0}".format(type(obj).__name__))
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the orjson package.")
+
+    def dumps(self, obj):
+        try:
+            return orjson.dumps(obj, default=_orjson_default)
+        except TypeError:
+            # Integers beyond 64 bits, which only the json module handles.
+            return JSONCodec.dumps(self, obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec backed by ujson."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("UjsonCodec requires the ujson package.")
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+_CODECS = {'json': JSONCodec, 'orjson': OrjsonCodec, 'ujson': UjsonCodec}
+
+
+def get_codec(codec=None):
+    """Return a JSON codec instance.
+
+    :param codec: A codec instance, the name of one ('json', 'orjson' or
+        'ujson'), or None for the fastest installed library.
+    """
+    if codec is None:
+        if orjson is not None:
+            return OrjsonCodec()
+        if ujson is not None:
+            return UjsonCodec()
+        return JSONCodec()
+    if isinstance(codec, str):
+        try:
+            return _CODECS[codec]()
+        except KeyError:
+            raise ValueError("Unknown JSON codec: {0}".format(codec))
+    return codec
@@ -0,0 +1,267 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from sys import intern
+
+from .model import Data, DATA_FIELDS
+
+# Location columns, stored as float64 arrays only when a point has a location.
+LOCATION_FIELDS = ('lat', 'lon', 'ele')
+
+# Other data fields kept by default.  Each is stored as a list of interned
+# values, so repeated values (like feed_id) share one object.
+DEFAULT_BLOCK_FIELDS = ('id', 'feed_id')
+
+_NAN = float('nan')
+
+
+def _epoch(value):
+    # Accept datetimes as well as epoch seconds for time bounds.
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _intern(value):
+    return intern(value) if type(value) is str else value
+
+
+def _number_string(number):
+    # String form of a number moved to a string column: "1" rather than "1.0".
+    if number != number:
+        return None
+    text = repr(number)
+    return text[:-2] if text.endswith('.0') else text
+
+
+class DataBlock(object):
+    """Columnar container for a feed's data points, far smaller than a list
+    of Data instances.
+
+    created_epoch is stored as a float64 array.  value is a float64 array
+    (with NaN for missing values) if every value is numeric, otherwise a list
+    of the values as sent, interned.  The values are kept as sent until the
+    type of the column is decided on first use of value (or of the block),
+    so load every point before that; numbers added afterwards are written in
+    their shortest form ("1", not "1.0") if a string arrives.  lat, lon and
+    ele are float64 arrays with NaN for missing values, or None if no point
+    has a location.  The other fields from DATA_FIELDS listed in `fields`
+    are stored as lists of interned values; the rest are dropped.
+
+    Points are kept in ascending created_epoch order once loading is done, so
+    a block can be sliced by time with between() and indexed like a sequence
+    of Data instances.
+    """
+
+    def __init__(self, fields=DEFAULT_BLOCK_FIELDS):
+        """Create an empty block.
+
+        :param fields: Names of the other DATA_FIELDS to keep for every point.
+        """
+        for field in fields:
+            if field not in DATA_FIELDS:
+                raise ValueError("Unknown data field: {0}".format(field))
+        self.created_epoch = array('d')
+        # Values as sent, until _decided.
+        self._value = []
+        self._decided = False
+        self.lat = None
+        self.lon = None
+        self.ele = None
+        self.columns = {field: [] for field in fields
+                        if field not in LOCATION_FIELDS
+                        and field not in ('created_epoch', 'value')}
+        self._ascending = True
+        self._descending = True
+
+    @classmethod
+    def from_records(cls, records, fields=DEFAULT_BLOCK_FIELDS):
+        """Build a block from an iterable of data dicts as sent by Adafruit IO.
+
+        :param records: Decoded JSON data records.
+        :param fields: Names of the other DATA_FIELDS to keep for every point.
+        """
+        block = cls(fields)
+        block.extend(records)
+        block.sort()
+        return block
+
+    def __len__(self):
+        return len(self.created_epoch)
+
+    def extend(self, records):
+        """Append data dicts, as decoded from an Adafruit IO JSON page.
+        Call sort() once all points are loaded.
+
+        :param records: Decoded JSON data records.
+        """
+        epochs = self.created_epoch
+        for record in records:
+            epoch = record.get('created_epoch')
+            epoch = _NAN if epoch is None else float(epoch)
+            if epochs:
+                last = epochs[-1]
+                if epoch < last:
+                    self._ascending = False
+                elif epoch > last:
+                    self._descending = False
+            epochs.append(epoch)
+            self._append_value(record.get('value'))
+            for field in LOCATION_FIELDS:
+                self._append_location(field, record.get(field))
+            for field, column in self.columns.items():
+                column.append(_intern(record.get(field)))
+
+    @property
+    def value(self):
+        if not self._decided:
+            try:
+                self._value = array('d', (_NAN if v is None else float(v)
+                                          for v in self._value))
+            except (TypeError, ValueError):
+                # Not all numeric, keep the values as sent.
+                pass
+            self._decided = True
+        return self._value
+
+    @value.setter
+    def value(self, column):
+        self._value = column
+        self._decided = True
+
+    def _append_value(self, value):
+        if type(self._value) is array:
+            if value is None:
+                self._value.append(_NAN)
+                return
+            try:
+                self._value.append(float(value))
+                return
+            except (TypeError, ValueError):
+                # Not numeric, switch the column to strings.
+                self._value = [_intern(_number_string(v)) for v in self._value]
+        self._value.append(_intern(value))
+
+    def _append_location(self, field, value):
+        column = getattr(self, field)
+        if column is None:
+            if value is None:
+                return
+            column = array('d', [_NAN]) * (len(self.created_epoch) - 1)
+            setattr(self, field, column)
+        column.append(_NAN if value is None else float(value))
+
+    def _columns(self):
+        yield self.created_epoch
+        yield self.value
+        for field in LOCATION_FIELDS:
+            if getattr(self, field) is not None:
+                yield getattr(self, field)
+        for column in self.columns.values():
+            yield column
+
+    def sort(self):
+        """Put the points in ascending created_epoch order.  History from
+        Adafruit IO arrives newest first, which is reversed in place."""
+        if self._ascending:
+            return
+        if self._descending:
+            for column in self._columns():
+                column.reverse()
+        else:
+            self._reorder(sorted(range(len(self)), key=self.created_epoch.__getitem__))
+        self._ascending = True
+        self._descending = len(self) <= 1
+
+    def _reorder(self, order):
+        self.created_epoch = array('d', (self.created_epoch[i] for i in order))
+        if type(self.value) is array:
+            self.value = array('d', (self.value[i] for i in order))
+        else:
+            self.value = [self.value[i] for i in order]
+        for field in LOCATION_FIELDS:
+            column = getattr(self, field)
+            if column is not None:
+                setattr(self, field, array('d', (column[i] for i in order)))
+        for field, column in self.columns.items():
+            self.columns[field] = [column[i] for i in order]
+
+    def index_range(self, start=None, end=None):
+        """Return the (first, last + 1) indexes of the points created between
+        start and end (inclusive), given as epoch seconds or datetimes."""
+        self.sort()
+        first = 0 if start is None else bisect_left(self.created_epoch, _epoch(start))
+        last = len(self) if end is None else bisect_right(self.created_epoch, _epoch(end))
+        return first, max(first, last)
+
+    def between(self, start=None, end=None):
+        """Return a new block with the points created between start and end
+        (inclusive), given as epoch seconds or datetimes."""
+        first, last = self.index_range(start, end)
+        return self[first:last]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            block = DataBlock(())
+            block.created_epoch = self.created_epoch[index]
+            block.value = self.value[index]
+            for field in LOCATION_FIELDS:
+                column = getattr(self, field)
+                setattr(block, field, None if column is None else column[index])
+            block.columns = {field: column[index] for field, column in self.columns.items()}
+            if index.step is not None and index.step < 0:
+                block._ascending = self._descending
+                block._descending = self._ascending
+            else:
+                block._ascending = self._ascending
+                block._descending = self._descending
+            return block
+        if index < 0:
+            index += len(self)
+        params = {field: column[index] for field, column in self.columns.items()}
+        params['created_epoch'] = self.created_epoch[index]
+        value = self.value[index]
+        if value == value:
+            params['value'] = value
+        for field in LOCATION_FIELDS:
+            column = getattr(self, field)
+            if column is not None and column[index] == column[index]:
+                params[field] = column[index]
+        return Data(**params)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_numpy(self, field):
+        """Return a zero-copy NumPy view of a numeric column (created_epoch,
+        value, lat, lon or ele).  Requires NumPy.  The block can't grow while
+        a view of it exists."""
+        # NumPy is optional and slow to import, it's only loaded here.
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("DataBlock.to_numpy requires the numpy package.")
+        column = getattr(self, field)
+        if type(column) is not array:
+            raise TypeError("The {0} column is not numeric.".format(field))
+        return numpy.frombuffer(column, dtype=numpy.float64)
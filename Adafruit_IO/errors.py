@@ -19,8 +19,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import json, requests
-from paho.mqtt.client import error_string
 
 class AdafruitIOError(Exception):
     """Base class for all Adafruit IO request failures."""
@@ -29,16 +27,21 @@ class AdafruitIOError(Exception):
 
 class RequestError(Exception):
     """General error for a failed Adafruit IO request."""
-    def __init__(self, response):
-        error_message = self._parse_error(response)
+    def __init__(self, response, codec=None):
+        self.status_code = response.status_code
+        error_message = self._parse_error(response, codec)
         super(RequestError, self).__init__("Adafruit IO request failed: {0} {1} - {2}".format(
             response.status_code, response.reason, error_message))
 
-    def _parse_error(self, response):
-        content = response.json()
+    def _parse_error(self, response, codec=None):
+        # Error bodies aren't always JSON (proxies and gateways send HTML).
         try:
+            if codec is not None:
+                content = codec.loads(response.content)
+            else:
+                content = response.json()
             return content['error']
-        except ValueError:
+        except (ValueError, TypeError, KeyError):
             return ""
 
 
@@ -56,6 +59,12 @@ class MQTTError(Exception):
     """Handles connection attempt failed errors.
     """
     def __init__(self, response):
-        error = error_string(response)
+        # paho-mqtt is only loaded once an MQTT error actually happens.
+        from paho.mqtt.client import error_string
+        if isinstance(response, int):
+            error = error_string(response)
+        else:
+            # Reason codes from the broker describe themselves.
+            error = str(response)
         super(MQTTError, self).__init__(error)
     pass
\ No newline at end of file
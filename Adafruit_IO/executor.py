@@ -0,0 +1,184 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# What submit() does when max_pending calls are already queued.
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+
+class CallbackExecutor(object):
+    """Runs callbacks on a pool of worker threads, in order per key.
+
+    Calls submitted with the same key (the MQTT client uses the message
+    topic) run one at a time in the order they were submitted, while calls
+    with different keys run in parallel.  Keys with queued calls take turns,
+    so one busy feed can't starve the others.  At most max_pending calls are
+    queued; when that is reached the overflow policy either blocks submit()
+    until there is room, drops the oldest queued call or drops the new one.
+    Dropped calls are counted in dropped_oldest and dropped_newest.
+    """
+
+    def __init__(self, workers=4, max_pending=10000, overflow=BLOCK):
+        """Create an executor and start its worker threads.
+
+        :param int workers: Number of worker threads.
+        :param int max_pending: Maximum number of calls waiting to run.
+        :param string overflow: What to do when the queue is full, one of
+            'block', 'drop_oldest' or 'drop_newest'.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy: {0}".format(overflow))
+        if workers < 1 or max_pending < 1:
+            raise ValueError("workers and max_pending must be at least 1.")
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        self._lock = threading.Lock()
+        # Signalled when a key becomes ready, and when a call is taken or done.
+        self._work_ready = threading.Condition(self._lock)
+        self._progress = threading.Condition(self._lock)
+        # Queued calls of each key that is queued or running.
+        self._queues = {}
+        # Keys with queued calls and no call running.
+        self._ready = deque()
+        # Queued calls oldest first, for drop_oldest.  Calls that ran are
+        # only marked as done and skipped later.
+        self._order = deque()
+        self._pending = 0
+        self._running = 0
+        self._closed = False
+        self._threads = [threading.Thread(target=self._work, daemon=True)
+                         for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def pending(self):
+        """Number of calls waiting to run."""
+        return self._pending
+
+    def submit(self, key, fn, *args):
+        """Queue fn(*args) to run after the calls already queued for key.
+        Returns False if the call was dropped because the queue is full.
+
+        :param key: Hashable key, calls with the same key run in order.
+        :param fn: Function to call.
+        """
+        call = [key, fn, args]
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CallbackExecutor is shut down.")
+            if self._pending >= self.max_pending:
+                if self.overflow == DROP_NEWEST:
+                    self.dropped_newest += 1
+                    return False
+                if self.overflow == DROP_OLDEST:
+                    self._drop_oldest()
+                else:
+                    while self._pending >= self.max_pending and not self._closed:
+                        self._progress.wait()
+                    if self._closed:
+                        raise RuntimeError("CallbackExecutor is shut down.")
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                self._ready.append(key)
+                self._work_ready.notify()
+            queue.append(call)
+            self._order.append(call)
+            self._pending += 1
+            if len(self._order) > 2 * self.max_pending:
+                self._order = deque(c for c in self._order if c[1] is not None)
+        return True
+
+    def _drop_oldest(self):
+        # The oldest queued call is always first in its key's queue.
+        while True:
+            call = self._order.popleft()
+            if call[1] is not None:
+                break
+        self._queues[call[0]].popleft()
+        call[1] = None
+        self._pending -= 1
+        self.dropped_oldest += 1
+
+    def join(self, timeout=None):
+        """Wait until every queued call has run.  Returns False on timeout.
+
+        :param float timeout: Optional number of seconds to wait.
+        """
+        with self._lock:
+            return self._progress.wait_for(
+                lambda: not self._pending and not self._running, timeout)
+
+    def shutdown(self, wait=True):
+        """Stop accepting calls.  Calls already queued still run.
+
+        :param bool wait: Wait for the worker threads to finish.
+        """
+        with self._lock:
+            self._closed = True
+            self._work_ready.notify_all()
+            self._progress.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _work(self):
+        while True:
+            with self._lock:
+                while not self._ready:
+                    if self._closed and not self._pending and not self._running:
+                        return
+                    self._work_ready.wait()
+                key = self._ready.popleft()
+                queue = self._queues[key]
+                if not queue:
+                    # Its calls were dropped while it waited for a worker.
+                    del self._queues[key]
+                    continue
+                call = queue.popleft()
+                fn, args = call[1], call[2]
+                call[1] = None
+                self._pending -= 1
+                self._running += 1
+                self._progress.notify_all()
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception('Callback for %s failed.', key)
+            with self._lock:
+                self._running -= 1
+                if queue:
+                    self._ready.append(key)
+                    self._work_ready.notify()
+                else:
+                    del self._queues[key]
+                if self._closed and not self._pending and not self._running:
+                    self._work_ready.notify_all()
+                self._progress.notify_all()
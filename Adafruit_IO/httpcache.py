@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+from collections import namedtuple, OrderedDict
+
+# A cached, already parsed response and the validators it was sent with.
+CacheEntry = namedtuple('CacheEntry', ['value', 'etag', 'last_modified', 'stored'])
+
+
+class HTTPCache(object):
+    """Bounded LRU cache of parsed metadata responses (feeds, groups,
+    dashboards and blocks) used by the REST client.
+
+    An entry younger than `ttl` seconds is returned without contacting the
+    service.  An older entry is revalidated with a conditional request
+    (If-None-Match / If-Modified-Since), and reused as is when the service
+    answers 304 Not Modified.  Once more than `maxsize` entries are stored
+    the least recently used ones are evicted.
+    """
+
+    def __init__(self, maxsize=128, ttl=30.0, clock=time.monotonic):
+        """Create a cache.
+
+        :param int maxsize: Maximum number of responses to keep.
+        :param float ttl: Seconds a response is trusted without revalidating.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the entry stored for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry):
+        """Return True if entry can be used without revalidating it."""
+        return self._clock() - entry.stored < self.ttl
+
+    def validators(self, entry):
+        """Return the conditional request headers for entry."""
+        headers = {}
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def put(self, key, value, etag=None, last_modified=None):
+        """Store a parsed response and its validators."""
+        with self._lock:
+            self._entries[key] = CacheEntry(value, etag, last_modified, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key):
+        """Mark the entry for key as just validated."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = entry._replace(stored=self._clock())
+
+    def invalidate(self, match):
+        """Drop every entry whose key match(key) returns True for."""
+        with self._lock:
+            for key in [key for key in self._entries if match(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
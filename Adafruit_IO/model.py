@@ -19,6 +19,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 from collections import namedtuple
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
 # Handle python 2 and 3 (where map functions like itertools.imap)
 try:
     from itertools import imap as map
@@ -111,39 +115,104 @@ Block.__new__.__defaults__ = (None, None, None, {}, None)
 # explicitly set feed values
 Feed.__new__.__defaults__ = (None, None, None, None, None, None, 'ON', 'Private', None, None, None)
 
-# Define methods to convert from dicts to the data types.
-def _from_dict(cls, data):
-    # Convert dict to call to class initializer (to work with the data types
-    # base on namedtuple).  However be very careful to preserve forwards
-    # compatibility by ignoring any attributes in the dict which are unknown
-    # by the data type.
-    params = {x: data.get(x, None) for x in cls._fields}
-    return cls(**params)
-
-
-def _feed_from_dict(cls, data):
-    params = {x: data.get(x, None) for x in cls._fields}
-    return cls(**params)
-
-
-def _group_from_dict(cls, data):
-    params = {x: data.get(x, None) for x in cls._fields}
-    # Parse the feeds if they're provided and generate feed instances.
-    params['feeds'] = tuple(map(Feed.from_dict, data.get('feeds', [])))
-    return cls(**params)
-
-
-def _dashboard_from_dict(cls, data):
-    params = {x: data.get(x, None) for x in cls._fields}
-    # Parse the blocks if they're provided and generate block instances.
-    params['blocks'] = tuple(map(Block.from_dict, data.get('blocks', [])))
-    return cls(**params)
-
-
-# Now add the from_dict class methods defined above to the data types.
-Data.from_dict   = classmethod(_from_dict)
-Feed.from_dict   = classmethod(_feed_from_dict)
-Group.from_dict  = classmethod(_group_from_dict)
-Dashboard.from_dict  = classmethod(_dashboard_from_dict)
-Block.from_dict  = classmethod(_from_dict)
-Layout.from_dict  = classmethod(_from_dict)
+# Define methods to convert from dicts to the data types.  The methods are
+# generated per type (in the same way namedtuple generates its own code) so
+# every field is looked up directly and the tuple is built positionally, which
+# is much faster than building a keyword dict and calling the initializer.
+# However be very careful to preserve forwards compatibility by ignoring any
+# attributes in the dict which are unknown by the data type.  Fields missing
+# from the dict are None.
+_FROM_DICT_TEMPLATE = """\
+def from_dict(cls, data):
+    get = data.get
+    return _tuple_new(cls, ({fields},))
+
+def from_dicts(cls, records):
+    result = []
+    append = result.append
+    new = _tuple_new
+    for data in records:
+        get = data.get
+        append(new(cls, ({fields},)))
+    return result
+
+def lazy_from_dict(cls, data):
+    get = data.get
+    return _tuple_new(cls, ({lazy_fields},))
+"""
+
+
+def _add_from_dict(cls, nested=None):
+    # Add from_dict(data) and from_dicts(records) class methods to cls.  Fields
+    # listed in nested hold a list of dicts, parsed into a tuple of instances
+    # of the given type (or into a LazySequence by _lazy_from_dict).
+    namespace = {'_tuple_new': tuple.__new__, 'map': map, 'tuple': tuple,
+                 'LazySequence': LazySequence}
+    fields = []
+    lazy_fields = []
+    for field in cls._fields:
+        if nested and field in nested:
+            kind = '_{0}_type'.format(field)
+            namespace[kind] = nested[field]
+            fields.append("tuple(map({0}.from_dict, get({1!r}, [])))".format(kind, field))
+            lazy_fields.append("LazySequence({0}, get({1!r}, []))".format(kind, field))
+        else:
+            fields.append("get({0!r})".format(field))
+            lazy_fields.append(fields[-1])
+    exec(_FROM_DICT_TEMPLATE.format(fields=', '.join(fields),
+                                    lazy_fields=', '.join(lazy_fields)), namespace)
+    cls.from_dict = classmethod(namespace['from_dict'])
+    cls.from_dicts = classmethod(namespace['from_dicts'])
+    cls._lazy_from_dict = classmethod(namespace['lazy_from_dict'])
+
+
+class LazySequence(Sequence):
+    """Read-only sequence view over decoded JSON records, returned by the
+    client when lazy=True.  An item is only turned into a model instance
+    (Data, Feed, Group...) when it is accessed, and nested lists such as a
+    Group's feeds are lazy too.  Items are built again on every access, so
+    keep a reference to an item that is used repeatedly.  Single fields can
+    be read without building instances at all with field().
+    """
+
+    def __init__(self, kind, records):
+        """Create a view.
+
+        :param kind: Model type of the items, like Data or Feed.
+        :param list records: Decoded JSON dicts, one per item.
+        """
+        self.kind = kind
+        self.records = records
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazySequence(self.kind, self.records[index])
+        return self.kind._lazy_from_dict(self.records[index])
+
+    def __repr__(self):
+        return 'LazySequence({0}, {1} items)'.format(self.kind.__name__, len(self))
+
+    def field(self, name, index=None):
+        """Return the value of one field for every item, or for the item at
+        index, without building model instances.
+
+        :param string name: Name of the field, like 'key' or 'value'.
+        :param int index: Optional index of a single item.
+        """
+        if name not in self.kind._fields:
+            raise ValueError("Unknown {0} field: {1}".format(self.kind.__name__, name))
+        if index is not None:
+            return self.records[index].get(name)
+        return [record.get(name) for record in self.records]
+
+
+# Now add the from_dict and from_dicts class methods to the data types.
+_add_from_dict(Data)
+_add_from_dict(Feed)
+_add_from_dict(Group, nested={'feeds': Feed})
+_add_from_dict(Block)
+_add_from_dict(Dashboard, nested={'blocks': Block})
+_add_from_dict(Layout)
@@ -20,14 +20,24 @@
 # SOFTWARE.
 import logging
 import re
+import threading
+from concurrent.futures import Future
 
 import paho.mqtt.client as mqtt
 import sys
 from .errors import MQTTError, RequestError
+from .executor import CallbackExecutor
+from .topics import TopicRouter, topic_key, FEED, GROUP, WEATHER, AIR_QUALITY, TIME, RANDOMIZER
 
 # How long to wait before sending a keep alive (paho-mqtt configuration).
 KEEP_ALIVE_SEC = 60  # One minute
 
+# Most topics sent in one SUBSCRIBE or UNSUBSCRIBE packet by subscribe_many,
+# subscribe_group_many and unsubscribe_many.
+MAX_TOPICS_PER_PACKET = 500
+
+FEED_KEY_RE = re.compile(r"^[a-zA-Z0-9-]+((\/|\.)[a-zA-Z0-9-]+)?$")
+
 logger = logging.getLogger(__name__)
 
 forecast_types = ["current", "forecast_minutes_5",
@@ -47,9 +57,7 @@ def validate_feed_key(feed_key):
     """
     if len(feed_key) > 128:  # validate feed key length
         raise ValueError("Feed key must be 128 characters or less.")
-    if not bool(
-        re.match(r"^[a-zA-Z0-9-]+((\/|\.)[a-zA-Z0-9-]+)?$", feed_key)
-    ):  # validate key naming scheme
+    if not FEED_KEY_RE.match(feed_key):  # validate key naming scheme
         raise TypeError(
             "Feed key must contain English letters, numbers, dash, and a period or a forward slash."
         )
@@ -60,17 +68,27 @@ class MQTTClient(object):
     using the MQTT protocol.
     """
 
-    def __init__(self, username, key, service_host='io.adafruit.com', secure=True):
+    def __init__(self, username, key, service_host='io.adafruit.com', secure=True, port=None,
+                 executor=None):
         """Create instance of MQTT client.
 
           :param username: Adafruit.IO Username for your account.
           :param key: Adafruit IO access key (AIO Key) for your account.
           :param secure: (optional, boolean) Switches secure/insecure connections
+          :param port: (optional, int) Port of the MQTT broker, defaults to
+            8883 for secure and 1883 for insecure connections.
+          :param executor: (optional) Run message callbacks on worker threads
+            instead of the network thread, so slow callbacks don't hold up
+            the connection.  Either a number of worker threads or a
+            CallbackExecutor instance.  Messages of one feed are still handled
+            in order.
 
         """
         self._username = username
         self._service_host = service_host
-        if secure:
+        if port is not None:
+            self._service_port = port
+        elif secure:
             self._service_port = 8883
         elif not secure:
             self._service_port = 1883
@@ -92,7 +110,17 @@ class MQTTClient(object):
         self._client.on_disconnect = self._mqtt_disconnect
         self._client.on_message    = self._mqtt_message
         self._client.on_subscribe  = self._mqtt_subscribe
+        self._client.on_unsubscribe = self._mqtt_unsubscribe
         self._connected = False
+        # Requests of the *_many methods waiting for a SUBACK or UNSUBACK,
+        # by message id.
+        self._bulk = {}
+        self._bulk_lock = threading.Lock()
+        # Maps the topics we subscribe to onto the names given to on_message.
+        self._router = TopicRouter()
+        if executor is not None and not isinstance(executor, CallbackExecutor):
+            executor = CallbackExecutor(workers=executor)
+        self.executor = executor
 
 
     def _mqtt_connect(self, client, userdata, flags, rc):
@@ -125,38 +153,71 @@ class MQTTClient(object):
             self.on_disconnect(self)
 
     def _mqtt_message(self, client, userdata, msg):
-        """Parse out the topic and call on_message callback
-        assume topic looks like `username/topic/id`
+        """Look up the feed name of the topic and call on_message callback.
+        Topics are routed by the subscriptions that produced them (see
+        TopicRouter), and the result is cached per topic.
 
         """
         logger.debug('Client on_message called.')
-        parsed_topic = msg.topic.split('/')
-        if self.on_message is not None:
-            if parsed_topic[0] == 'time':
-                topic = parsed_topic[0]
-                payload = msg.payload.decode('utf-8')    
-            elif parsed_topic[1] == 'groups':
-                topic = parsed_topic[3]
-                payload = msg.payload.decode('utf-8')
-            elif parsed_topic[2] == 'weather':
-                topic = parsed_topic[4]
-                payload = '' if msg.payload is None else msg.payload.decode('utf-8')    
-            elif parsed_topic[2] == 'air_quality':
-                topic = parsed_topic[3]
-                payload = '' if msg.payload is None else msg.payload.decode('utf-8')
-            else:
-                topic = parsed_topic[2]
-                payload = '' if msg.payload is None else msg.payload.decode('utf-8')
-        else:
+        if self.on_message is None:
             raise ValueError('on_message not defined')
-        self.on_message(self, topic, payload)
+        kind, topic = self._router.route(msg.topic)
+        payload = '' if msg.payload is None else msg.payload.decode('utf-8')
+        if self.executor is not None:
+            self.executor.submit(msg.topic, self.on_message, self, topic, payload)
+        else:
+            self.on_message(self, topic, payload)
 
     def _mqtt_subscribe(self, client, userdata, mid, granted_qos):
         """Called when broker responds to a subscribe request."""
         logger.debug('Client called on_subscribe')
+        self._bulk_acked(mid, granted_qos)
         if self.on_subscribe is not None:
           self.on_subscribe(self, userdata, mid, granted_qos)
 
+    def _mqtt_unsubscribe(self, client, userdata, mid):
+        """Called when broker responds to an unsubscribe request."""
+        logger.debug('Client called on_unsubscribe')
+        self._bulk_acked(mid)
+
+    def _bulk_acked(self, mid, granted_qos=()):
+        # Record the answer to one packet of a *_many request, completing its
+        # future once every packet was answered.
+        with self._bulk_lock:
+            entry = self._bulk.pop(mid, None)
+            if entry is None:
+                return
+            request, offset = entry
+            future, results = request[0], request[1]
+            if results is not None:
+                results[offset:offset + len(granted_qos)] = granted_qos
+            request[2] -= 1
+            if request[2]:
+                return
+        future.set_result(results)
+
+    def _send_many(self, send, topics, results):
+        # Send topics with as few packets as possible, returning a future
+        # completed when the broker answered all of them.
+        future = Future()
+        packets = -(-len(topics) // MAX_TOPICS_PER_PACKET)
+        request = [future, results, packets]
+        if not packets:
+            future.set_result(results)
+            return future
+        # Hold the lock until every message id is recorded, the answers can
+        # arrive on the network thread before send() returns.
+        with self._bulk_lock:
+            for offset in range(0, len(topics), MAX_TOPICS_PER_PACKET):
+                res, mid = send(topics[offset:offset + MAX_TOPICS_PER_PACKET])
+                if res != mqtt.MQTT_ERR_SUCCESS:
+                    for sent in [m for m, entry in self._bulk.items() if entry[0] is request]:
+                        del self._bulk[sent]
+                    future.set_exception(MQTTError(res))
+                    break
+                self._bulk[mid] = (request, offset)
+        return future
+
     def connect(self, **kwargs):
         """Connect to the Adafruit.IO service.  Must be called before any loop
         or publish operations are called.  Will raise an exception if a
@@ -221,6 +282,63 @@ class MQTTClient(object):
         """
         self._client.loop(timeout=timeout_sec)
 
+    def _topic_callback(self, kind, topic, callback):
+        # Wrap a callback taking (client, feed_key, payload) so paho can call
+        # it directly for one topic.  The name is worked out here, once.
+        name = topic_key(kind, topic.split('/'))
+        def on_topic_message(client, userdata, msg):
+            payload = '' if msg.payload is None else msg.payload.decode('utf-8')
+            if self.executor is not None:
+                self.executor.submit(msg.topic, callback, self, name, payload)
+            else:
+                callback(self, name, payload)
+        return on_topic_message
+
+    def add_feed_callback(self, feed_key, callback, feed_user=None):
+        """Call a function for messages on one feed instead of on_message.
+        The function takes the same (client, feed_key, payload) arguments as
+        on_message, which is still called for feeds without a callback.  Only
+        one callback can be added per feed, and adding another replaces it.
+        This does not subscribe to the feed, call subscribe for that.
+
+        :param str feed_key: The key of the feed.
+        :param callback: Function to call with each message on the feed.
+        :param str feed_user: Optional, identifies feed owner. Used for feed sharing.
+        """
+        validate_feed_key(feed_key)
+        topic = '{0}/feeds/{1}'.format(feed_user or self._username, feed_key)
+        self._client.message_callback_add(topic, self._topic_callback(FEED, topic, callback))
+
+    def remove_feed_callback(self, feed_key, feed_user=None):
+        """Stop calling the callback added with add_feed_callback for a feed,
+        its messages go to on_message again.
+
+        :param str feed_key: The key of the feed.
+        :param str feed_user: Optional, identifies feed owner. Used for feed sharing.
+        """
+        validate_feed_key(feed_key)
+        topic = '{0}/feeds/{1}'.format(feed_user or self._username, feed_key)
+        self._client.message_callback_remove(topic)
+
+    def add_group_callback(self, group_id, callback):
+        """Call a function for messages on one group instead of on_message,
+        like add_feed_callback.  The function is called with the group_id.
+        This does not subscribe to the group, call subscribe_group for that.
+
+        :param str group_id: The id of the group.
+        :param callback: Function to call with each message on the group.
+        """
+        topic = '{0}/groups/{1}'.format(self._username, group_id)
+        self._client.message_callback_add(topic, self._topic_callback(GROUP, topic, callback))
+
+    def remove_group_callback(self, group_id):
+        """Stop calling the callback added with add_group_callback for a group.
+
+        :param str group_id: The id of the group.
+        """
+        topic = '{0}/groups/{1}'.format(self._username, group_id)
+        self._client.message_callback_remove(topic)
+
     def subscribe(self, feed_key, feed_user=None, qos=0):
         """Subscribe to changes on the specified feed.  When the feed is updated
         the on_message function will be called with the feed_key and new value.
@@ -234,9 +352,11 @@ class MQTTClient(object):
         if qos > 1:
             raise MQTTError("Adafruit IO only supports a QoS level of 0 or 1.")
         if feed_user is not None:
-            (res, mid) = self._client.subscribe('{0}/feeds/{1}'.format(feed_user, feed_key), qos=qos)
+            topic = '{0}/feeds/{1}'.format(feed_user, feed_key)
         else:
-            (res, mid) = self._client.subscribe('{0}/feeds/{1}'.format(self._username, feed_key), qos=qos)
+            topic = '{0}/feeds/{1}'.format(self._username, feed_key)
+        self._router.add(topic, FEED)
+        (res, mid) = self._client.subscribe(topic, qos=qos)
         return res, mid
 
     def subscribe_group(self, group_id, qos=0):
@@ -247,7 +367,9 @@ class MQTTClient(object):
       :param int qos: The QoS to use when subscribing. Defaults to 0.
 
       """
-      self._client.subscribe('{0}/groups/{1}'.format(self._username, group_id), qos=qos)
+      topic = '{0}/groups/{1}'.format(self._username, group_id)
+      self._router.add(topic, GROUP)
+      self._client.subscribe(topic, qos=qos)
 
     def subscribe_randomizer(self, randomizer_id):
       """Subscribe to changes on a specified random data stream from
@@ -259,7 +381,9 @@ class MQTTClient(object):
       :param int randomizer_id: ID of the random word record you want data for.
 
       """
-      self._client.subscribe('{0}/integration/words/{1}'.format(self._username, randomizer_id))
+      topic = '{0}/integration/words/{1}'.format(self._username, randomizer_id)
+      self._router.add(topic, RANDOMIZER)
+      self._client.subscribe(topic)
 
     def subscribe_weather(self, weather_id, forecast_type):
       """Subscribe to Adafruit IO Weather
@@ -278,7 +402,9 @@ class MQTTClient(object):
       - forecast_days_5
       """
       if forecast_type in forecast_types:
-        self._client.subscribe('{0}/integration/weather/{1}/{2}'.format(self._username, weather_id, forecast_type))
+        topic = '{0}/integration/weather/{1}/{2}'.format(self._username, weather_id, forecast_type)
+        self._router.add(topic, WEATHER)
+        self._client.subscribe(topic)
       else:
         raise TypeError("Invalid Forecast Type Specified.")
         return
@@ -289,7 +415,9 @@ class MQTTClient(object):
         :param string forecast: Can be "current", "forecast_today", or "forecast_tomorrow".
         """       
         if forecast in forecast_types:
-            self._client.subscribe('{0}/integration/air_quality/{1}/{2}'.format(self._username, airq_location_id, forecast))
+            topic = '{0}/integration/air_quality/{1}/{2}'.format(self._username, airq_location_id, forecast)
+            self._router.add(topic, AIR_QUALITY)
+            self._client.subscribe(topic)
         else:
             raise TypeError("Invalid Forecast Type Specified.")
 
@@ -302,12 +430,14 @@ class MQTTClient(object):
             iso: ISO-8601 (https://en.wikipedia.org/wiki/ISO_8601)
         """
         if time == 'millis' or time == 'seconds':
-            self._client.subscribe('time/{0}'.format(time))
+            topic = 'time/{0}'.format(time)
         elif time == 'iso':
-            self._client.subscribe('time/ISO-8601')
+            topic = 'time/ISO-8601'
         else:
             raise TypeError('Invalid Time Feed Specified.')
             return
+        self._router.add(topic, TIME)
+        self._client.subscribe(topic)
     
     def unsubscribe(self, feed_key=None, group_id=None):
       """Unsubscribes from a specified MQTT topic.
@@ -316,18 +446,22 @@ class MQTTClient(object):
       """
       if feed_key is not None:
         validate_feed_key(feed_key)
-        self._client.unsubscribe('{0}/feeds/{1}'.format(self._username, feed_key))
+        topic = '{0}/feeds/{1}'.format(self._username, feed_key)
       elif group_id is not None:
-        self._client.unsubscribe('{0}/groups/{1}'.format(self._username, group_id))
+        topic = '{0}/groups/{1}'.format(self._username, group_id)
       else:
         raise TypeError('Invalid topic type specified.')
         return
+      self._router.remove(topic)
+      self._client.unsubscribe(topic)
 
     def unsubscribe_randomizer(self, randomizer_id):
       """Unsubscribe from a specified random data stream.
       :param int randomizer_id: ID of the random word record to unsubscribe from.
       """
-      self._client.unsubscribe('{0}/integration/words/{1}'.format(self._username, randomizer_id))
+      topic = '{0}/integration/words/{1}'.format(self._username, randomizer_id)
+      self._router.remove(topic)
+      self._client.unsubscribe(topic)
 
     def unsubscribe_weather(self, weather_id, forecast_type):
       """Unsubscribe from Adafruit IO Weather
@@ -335,7 +469,9 @@ class MQTTClient(object):
       :param string type: type of forecast data
       """
       if forecast_type in forecast_types:
-        self._client.unsubscribe('{0}/integration/weather/{1}/{2}'.format(self._username, weather_id, forecast_type))
+        topic = '{0}/integration/weather/{1}/{2}'.format(self._username, weather_id, forecast_type)
+        self._router.remove(topic)
+        self._client.unsubscribe(topic)
       else:
         raise TypeError("Invalid Forecast Type Specified.")
 
@@ -343,12 +479,14 @@ class MQTTClient(object):
         """Unsubscribe from Adafruit IO time feeds.
         """
         if time == 'millis' or time == 'seconds':
-            self._client.unsubscribe('time/{0}'.format(time))
+            topic = 'time/{0}'.format(time)
         elif time == 'iso':
-            self._client.unsubscribe('time/ISO-8601')
+            topic = 'time/ISO-8601'
         else:
             raise TypeError('Invalid Time Feed Specified.')
             return
+        self._router.remove(topic)
+        self._client.unsubscribe(topic)
 
     def unsubscribe_air_quality(self, airq_location_id, forecast='current'):
         """Unsubscribe from Adafruit IO Air Quality Service
@@ -356,10 +494,70 @@ class MQTTClient(object):
         :param string forecast: Can be "current", "forecast_today", or "forecast_tomorrow".
         """
         if forecast in forecast_types:
-            self._client.unsubscribe('{0}/integration/air_quality/{1}/{2}'.format(self._username, airq_location_id, forecast))
+            topic = '{0}/integration/air_quality/{1}/{2}'.format(self._username, airq_location_id, forecast)
+            self._router.remove(topic)
+            self._client.unsubscribe(topic)
         else:
             raise TypeError("Invalid Forecast Type Specified.")
 
+    def subscribe_many(self, feeds, feed_user=None):
+        """Subscribe to many feeds at once.  The topics are packed into as
+        few SUBSCRIBE packets as possible (MAX_TOPICS_PER_PACKET per packet)
+        instead of one per feed.
+
+        Returns a concurrent.futures.Future, whose result is the list of QoS
+        levels the broker granted in the order of feeds (128 for a refused
+        subscription) once every packet was acknowledged.
+
+        :param list feeds: Feed keys, or (feed_key, qos) pairs.
+        :param str feed_user: Optional, identifies feed owner. Used for feed sharing.
+        """
+        topics = []
+        for feed in feeds:
+            feed_key, qos = (feed, 0) if isinstance(feed, str) else feed
+            validate_feed_key(feed_key)
+            if qos > 1:
+                raise MQTTError("Adafruit IO only supports a QoS level of 0 or 1.")
+            topics.append(('{0}/feeds/{1}'.format(feed_user or self._username, feed_key), qos))
+        for topic, qos in topics:
+            self._router.add(topic, FEED)
+        return self._send_many(self._client.subscribe, topics, [None] * len(topics))
+
+    def subscribe_group_many(self, groups):
+        """Subscribe to many groups at once, like subscribe_many.
+
+        :param list groups: Group ids, or (group_id, qos) pairs.
+        """
+        topics = []
+        for group in groups:
+            group_id, qos = (group, 0) if isinstance(group, str) else group
+            if qos > 1:
+                raise MQTTError("Adafruit IO only supports a QoS level of 0 or 1.")
+            topics.append(('{0}/groups/{1}'.format(self._username, group_id), qos))
+        for topic, qos in topics:
+            self._router.add(topic, GROUP)
+        return self._send_many(self._client.subscribe, topics, [None] * len(topics))
+
+    def unsubscribe_many(self, feed_keys=(), group_ids=(), feed_user=None):
+        """Unsubscribe from many feeds and groups at once, with as few
+        UNSUBSCRIBE packets as possible.  Returns a
+        concurrent.futures.Future completed when the broker acknowledged all
+        of them.
+
+        :param list feed_keys: Keys of the feeds to unsubscribe from.
+        :param list group_ids: Ids of the groups to unsubscribe from.
+        :param str feed_user: Optional, identifies the owner of the feeds. Used for feed sharing.
+        """
+        topics = []
+        for feed_key in feed_keys:
+            validate_feed_key(feed_key)
+            topics.append('{0}/feeds/{1}'.format(feed_user or self._username, feed_key))
+        topics.extend('{0}/groups/{1}'.format(self._username, group_id)
+                      for group_id in group_ids)
+        for topic in topics:
+            self._router.remove(topic)
+        return self._send_many(self._client.unsubscribe, topics, None)
+
     def receive(self, feed_key):
       """Receive the last published value from a specified feed.
 
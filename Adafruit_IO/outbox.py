@@ -0,0 +1,358 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import requests
+
+from .client import Client, DEFAULT_BATCH_SIZE
+from .errors import RequestError, ThrottlingError
+from .model import Data
+
+# Default limit for the size of the queue on disk, in bytes.
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Failures that mean Adafruit IO can't be reached right now, so draining
+# stops and is tried again later.
+_TRANSIENT_ERRORS = (requests.exceptions.ConnectionError,
+                     requests.exceptions.Timeout, ThrottlingError)
+
+# HTTP status codes that mean the same, rather than a problem with the data.
+_TRANSIENT_STATUS_CODES = (408,)
+
+_STATE_FILE = 'state.json'
+
+# Points Adafruit IO refused are moved to this file in the queue directory.
+# It is kept under max_bytes // REJECTED_FRACTION bytes by dropping its
+# oldest lines.
+REJECTED_FILE = 'rejected.log'
+REJECTED_FRACTION = 10
+
+
+def _is_transient(err):
+    return isinstance(err, _TRANSIENT_ERRORS) or \
+        (isinstance(err, RequestError) and err.status_code in _TRANSIENT_STATUS_CODES)
+
+
+def _is_rejected(err):
+    # True if Adafruit IO refused the data itself, so sending it again would
+    # fail the same way.  Server errors, timeouts and authentication failures
+    # are not about the data.
+    return isinstance(err, RequestError) and 400 <= err.status_code < 500 and \
+        err.status_code not in (401, 403) + _TRANSIENT_STATUS_CODES
+
+
+def _fsync_dir(path):
+    # Make renames in path durable.  Not possible (or needed) on Windows.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (OSError, AttributeError):
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class Outbox(object):
+    """Durable store-and-forward queue for data sent to Adafruit IO.
+
+    send() stamps a value with the time it was captured and appends it to a
+    log file in `path`, so readings taken while Adafruit IO can't be reached
+    survive network outages and restarts.  drain() uploads the queued points
+    in batches with send_batch_data, at the rate allowed by the client's rate
+    limiter, and stops quietly when the service can't be reached.
+
+    Each point is written as one JSON line and synced to disk before send()
+    returns.  The position of the first unsent point is kept in a small state
+    file that is replaced atomically, so a crash can at worst cause a batch
+    to be sent twice, and a partly written last line is ignored.  Sent points
+    are removed by rewriting the log, and if the queue grows past max_bytes
+    the oldest points are dropped (and counted in the dropped attribute).
+    Points that Adafruit IO rejects (with a 4xx error other than 401, 403 or
+    408) are moved to rejected.log in `path`, in the same format as the
+    queue, and counted in the rejected attribute, so they don't block the
+    others.  rejected.log is kept under a tenth of max_bytes by dropping its
+    oldest lines.
+    """
+
+    def __init__(self, client, path, batch_size=DEFAULT_BATCH_SIZE,
+                 max_bytes=DEFAULT_MAX_BYTES, fsync=True):
+        """Open (or create) a queue.
+
+        :param Client client: REST client used to upload the points.
+        :param string path: Directory holding the queue files.
+        :param int batch_size: Maximum number of points per upload.
+        :param int max_bytes: Maximum size of the queue on disk.  The log
+            of rejected points may take up to a tenth of this in addition.
+        :param bool fsync: Sync every write to disk.  Turning this off is
+            faster but points may be lost if the system crashes.
+        """
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+        self.dropped = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._draining = False
+        os.makedirs(path, exist_ok=True)
+        state = self._read_state()
+        self._generation = state['generation']
+        self._offset = state['offset']
+        self._remove_stale_logs()
+        self._log = open(self._log_path(self._generation), 'ab+')
+        self._truncate_torn_line()
+        self._pending = sum(1 for _ in self._records(self._offset))
+
+    def __len__(self):
+        return self._pending
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the queue files.  Queued points stay on disk."""
+        with self._lock:
+            self._log.close()
+
+    def _log_path(self, generation):
+        return os.path.join(self.path, 'queue.{0}.log'.format(generation))
+
+    def _read_state(self):
+        try:
+            with open(os.path.join(self.path, _STATE_FILE)) as state_file:
+                return json.load(state_file)
+        except FileNotFoundError:
+            return {'generation': 0, 'offset': 0}
+
+    def _write_state(self, generation, offset):
+        # Replace the state file atomically, so it's always either the old or
+        # the new state after a crash.
+        tmp = os.path.join(self.path, _STATE_FILE + '.tmp')
+        with open(tmp, 'w') as state_file:
+            json.dump({'generation': generation, 'offset': offset}, state_file)
+            state_file.flush()
+            if self.fsync:
+                os.fsync(state_file.fileno())
+        os.replace(tmp, os.path.join(self.path, _STATE_FILE))
+        if self.fsync:
+            _fsync_dir(self.path)
+        self._generation, self._offset = generation, offset
+
+    def _remove_stale_logs(self):
+        # Logs left behind by a compaction that was interrupted.
+        current = os.path.basename(self._log_path(self._generation))
+        for name in os.listdir(self.path):
+            if name.startswith('queue.') and name.endswith('.log') and name != current:
+                os.remove(os.path.join(self.path, name))
+
+    def _truncate_torn_line(self):
+        # Drop a last line that was only partly written before a crash.
+        self._log.seek(0)
+        end = 0
+        for line in self._log:
+            if not line.endswith(b'\n'):
+                break
+            end += len(line)
+        self._log.truncate(end)
+
+    def _sync(self, f):
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def _records(self, offset, limit=None):
+        # Yield (end offset, record) for the queued lines from offset on.
+        self._log.seek(offset)
+        count = 0
+        for line in self._log:
+            if limit is not None and count >= limit:
+                return
+            offset += len(line)
+            count += 1
+            yield offset, line
+
+    def send(self, feed, value, metadata=None):
+        """Queue a value for a feed.  Takes the same arguments as
+        Client.send_data.
+
+        :param string feed: Name/Key/ID of Adafruit IO feed.
+        :param string value: Value to send.
+        :param dict metadata: Optional metadata associated with the value.
+        """
+        data = Client._create_payload(value, metadata)
+        if data.created_at is None:
+            data = data._replace(created_at=datetime.now(timezone.utc).isoformat())
+        fields = {k: v for k, v in data._asdict().items() if v is not None}
+        line = json.dumps({'feed': feed, 'data': fields}).encode('utf-8') + b'\n'
+        with self._lock:
+            self._log.seek(0, os.SEEK_END)
+            self._log.write(line)
+            self._sync(self._log)
+            self._pending += 1
+            # The log isn't rewritten while a drain is uploading lines from it.
+            if self._log.tell() > self.max_bytes and not self._draining:
+                self._compact(limit=self.max_bytes - self.max_bytes // 10)
+
+    send_data = send
+
+    def drain(self, max_points=None):
+        """Upload queued points in batches, oldest first, and return how many
+        were sent.  Stops without raising if Adafruit IO can't be reached or
+        is throttling.  Points Adafruit IO rejects are moved to rejected.log
+        and draining goes on with the others; other errors are raised and
+        the batch stays queued.
+
+        :param int max_points: Optional maximum number of points to send.
+        """
+        with self._drain_lock:
+            with self._lock:
+                self._draining = True
+            try:
+                return self._drain(max_points)
+            finally:
+                with self._lock:
+                    self._draining = False
+
+    def _drain(self, max_points):
+        sent = 0
+        while max_points is None or sent < max_points:
+            limit = self.batch_size if max_points is None else min(self.batch_size,
+                                                                    max_points - sent)
+            with self._lock:
+                start = self._offset
+                lines = list(self._records(start, limit))
+            if not lines:
+                break
+            batches = OrderedDict()
+            for _, line in lines:
+                record = json.loads(line)
+                batches.setdefault(record['feed'], []).append(Data(**record['data']))
+            done = []
+            rejected = []
+            try:
+                for feed, points in batches.items():
+                    try:
+                        self.client.send_batch_data(feed, points, chunk_size=self.batch_size)
+                    except Exception as err:
+                        if not _is_rejected(err):
+                            raise
+                        self._reject(feed, lines)
+                        rejected.append(feed)
+                    done.append(feed)
+            except Exception as err:
+                self._ack(start, lines, done)
+                if _is_transient(err):
+                    break
+                raise
+            finally:
+                sent += sum(len(batches[feed]) for feed in done if feed not in rejected)
+            self._ack(start, lines, done)
+        if sent:
+            with self._lock:
+                self._log.seek(0, os.SEEK_END)
+                if self._offset * 2 >= self._log.tell():
+                    self._compact()
+        return sent
+
+    def _reject(self, feed, lines):
+        # Move the points of feed in lines to the rejected log.  They are
+        # removed from the queue by the _ack that follows.
+        rejected = [line for _, line in lines if json.loads(line)['feed'] == feed]
+        path = os.path.join(self.path, REJECTED_FILE)
+        with self._lock:
+            with open(path, 'ab') as rejected_log:
+                rejected_log.writelines(rejected)
+                self._sync(rejected_log)
+                size = rejected_log.tell()
+            self.rejected += len(rejected)
+            limit = self.max_bytes // REJECTED_FRACTION
+            if size > limit:
+                self._trim_rejected(path, size, limit)
+
+    def _trim_rejected(self, path, size, limit):
+        # Rewrite the rejected log without its oldest lines, leaving some room
+        # so it isn't rewritten on every rejection.
+        with open(path, 'rb') as rejected_log:
+            lines = rejected_log.readlines()
+        limit -= limit // 10
+        drop = 0
+        while size > limit and drop < len(lines):
+            size -= len(lines[drop])
+            drop += 1
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as new_log:
+            new_log.writelines(lines[drop:])
+            self._sync(new_log)
+        os.replace(tmp, path)
+        if self.fsync:
+            _fsync_dir(self.path)
+
+    def _ack(self, start, lines, feeds):
+        # Mark the points of the given feeds in lines as sent.
+        if not feeds:
+            return
+        with self._lock:
+            if len(feeds) == len({json.loads(line)['feed'] for _, line in lines}):
+                self._write_state(self._generation, lines[-1][0])
+                self._pending -= len(lines)
+            else:
+                # Only some feeds of the batch made it, keep the others queued.
+                feeds = set(feeds)
+                keep = [line for _, line in lines if json.loads(line)['feed'] not in feeds]
+                self._pending -= len(lines) - len(keep)
+                self._compact(head=keep, offset=lines[-1][0])
+
+    def _compact(self, head=(), offset=None, limit=None):
+        # Rewrite the log with only the unsent lines (head, then everything
+        # after offset), dropping the oldest if they take more than limit
+        # bytes.  The new log becomes current when the state file is replaced.
+        lines = list(head)
+        lines.extend(line for _, line in self._records(self._offset if offset is None
+                                                       else offset))
+        if limit is not None:
+            size = sum(len(line) for line in lines)
+            drop = 0
+            while size > limit and drop < len(lines):
+                size -= len(lines[drop])
+                drop += 1
+            del lines[:drop]
+            self.dropped += drop
+            self._pending -= drop
+        generation = self._generation + 1
+        with open(self._log_path(generation), 'wb') as new_log:
+            new_log.writelines(lines)
+            self._sync(new_log)
+        old = self._log_path(self._generation)
+        self._write_state(generation, 0)
+        self._log.close()
+        os.remove(old)
+        self._log = open(self._log_path(generation), 'ab+')
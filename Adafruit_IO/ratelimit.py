@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+
+
+class RateLimiter(object):
+    """Client-side token bucket that paces requests to stay under an Adafruit
+    IO rate limit, expressed in data points per minute.
+
+    Callers reserve points with acquire() and are delayed until the budget
+    allows them through, so requests are spread out instead of being rejected
+    by the service.  When the service still answers with a throttling error,
+    throttled() shrinks the budget and pauses the bucket; the budget then
+    slowly recovers towards the configured limit.  A limiter is thread safe
+    and can be shared between clients using the same account.
+    """
+
+    def __init__(self, points_per_minute, burst=1, shrink_factor=0.8,
+                 recovery_interval=60.0, clock=time.monotonic, sleep=time.sleep):
+        """Create a rate limiter.
+
+        :param int points_per_minute: Data points allowed per minute.
+        :param int burst: Number of points that may be sent back to back
+            before pacing kicks in.  The refill rate is reduced by the same
+            amount, so no rolling minute ever exceeds points_per_minute.
+        :param float shrink_factor: Factor applied to the budget after the
+            service reports throttling.
+        :param float recovery_interval: Seconds without throttling after which
+            a shrunk budget grows back by a tenth of the configured limit.
+        """
+        if points_per_minute <= burst:
+            raise ValueError("points_per_minute must be larger than burst.")
+        self.points_per_minute = points_per_minute
+        self.burst = burst
+        self.shrink_factor = shrink_factor
+        self.recovery_interval = recovery_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._budget = float(points_per_minute)
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._adjusted = self._updated
+
+    @property
+    def budget(self):
+        """Current budget in data points per minute."""
+        return self._budget
+
+    def _refill(self, now):
+        rate = (self._budget - self.burst) / 60.0
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        # Grow a shrunk budget back after a quiet period.
+        if self._budget < self.points_per_minute and \
+                now - self._adjusted >= self.recovery_interval:
+            self._budget = min(self.points_per_minute,
+                               self._budget + self.points_per_minute / 10.0)
+            self._adjusted = now
+        return rate
+
+    def acquire(self, points=1):
+        """Reserve points from the budget, sleeping until they are available.
+        Returns the number of seconds spent waiting.
+
+        :param int points: Number of data points the next request sends.
+        """
+        with self._lock:
+            now = self._clock()
+            rate = self._refill(now)
+            self._tokens -= points
+            wait = max(-self._tokens / rate, self._paused_until - now, 0.0)
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    def throttled(self, retry_after=None):
+        """Record that the service rejected a request for exceeding its rate
+        limit.  Shrinks the budget, empties the bucket and, if the service
+        said how long to wait, pauses the bucket for that long.
+
+        :param float retry_after: Seconds the service asked to wait, if known.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._budget = max(self.burst + 1.0, self._budget * self.shrink_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self._adjusted = now
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
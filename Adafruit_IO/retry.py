@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import random
+import time
+
+# HTTP status codes that usually mean a temporary server or gateway problem.
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Methods that can be repeated without creating duplicate data.
+IDEMPOTENT_METHODS = ('GET', 'DELETE')
+
+
+class RetryPolicy(object):
+    """Describes when and how often the REST client retries a failed request.
+
+    Failed attempts are retried after a jittered exponential backoff: the
+    n-th retry waits a random time between zero and backoff * 2 ** (n - 1)
+    seconds, capped at max_backoff.  If the service sends a Retry-After header
+    the wait is at least that long.  Only the methods listed in `methods` are
+    retried after a response or a broken connection, since a POST may already
+    have created data; a connection that could not be opened at all is
+    retried for any method.
+    """
+
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30.0, deadline=None,
+                 status_codes=RETRY_STATUS_CODES, methods=IDEMPOTENT_METHODS,
+                 clock=time.monotonic, sleep=time.sleep):
+        """Create a retry policy.
+
+        :param int max_attempts: Total attempts per call, including the first.
+            Use 1 to disable retries.
+        :param float backoff: Base delay in seconds for the exponential backoff.
+        :param float max_backoff: Upper bound in seconds for a single delay.
+        :param float deadline: Optional limit in seconds for the whole call,
+            including all retries and waits.
+        :param status_codes: HTTP status codes that may be retried.
+        :param methods: HTTP methods that may be retried.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.clock = clock
+        self.sleep = sleep
+
+    def remaining(self, started):
+        """Seconds left before the deadline of a call started at `started`,
+        or None if the policy has no deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - (self.clock() - started), 0.0)
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Return the jittered delay before retrying after `attempt` failed
+        attempts, at least retry_after seconds if given."""
+        cap = min(self.max_backoff, self.backoff * 2 ** (min(attempt, 64) - 1))
+        return max(random.uniform(0, cap), retry_after or 0.0)
+
+    def next_delay(self, method, attempt, started, status_code=None,
+                   retry_after=None, connect_failed=False):
+        """Return how many seconds to wait before retrying a failed attempt,
+        or None if the failure should be raised.
+
+        :param string method: HTTP method of the request.
+        :param int attempt: Number of attempts made so far.
+        :param float started: Clock time the call started at.
+        :param int status_code: Status code of the failed response, or None if
+            no response was received.
+        :param float retry_after: Delay requested by the service, if any.
+        :param bool connect_failed: True if the connection could not be made,
+            so the request was never sent.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not connect_failed and method.upper() not in self.methods:
+            return None
+        if status_code is not None and status_code not in self.status_codes:
+            return None
+        delay = self.backoff_delay(attempt, retry_after)
+        remaining = self.remaining(started)
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
@@ -0,0 +1,160 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+# Kinds of topics the MQTT client subscribes to.
+FEED = 'feed'
+GROUP = 'group'
+WEATHER = 'weather'
+AIR_QUALITY = 'air_quality'
+TIME = 'time'
+RANDOMIZER = 'randomizer'
+
+# Largest number of topics whose route is remembered.  Wildcard
+# subscriptions can match any number of topics, so the cache is emptied when
+# it grows past this.
+MAX_CACHED_TOPICS = 65536
+
+
+def topic_key(kind, parts):
+    """Return the name passed to on_message for a topic of the given kind,
+    split on '/'.  Short topics fall back to their last level instead of
+    raising IndexError."""
+    if kind == TIME:
+        return 'time'
+    if kind == WEATHER:
+        index = 4
+    elif kind in (GROUP, AIR_QUALITY):
+        index = 3
+    else:
+        index = 2
+    if kind == GROUP and len(parts) == 3:
+        # Messages on the group topic itself, name the group.
+        index = 2
+    return parts[index] if len(parts) > index else parts[-1]
+
+
+def classify(parts):
+    """Return the kind of a topic that matches no subscription, judging by
+    its shape like the client always has."""
+    if parts[0] == 'time':
+        return TIME
+    if len(parts) > 1 and parts[1] == 'groups':
+        return GROUP
+    if len(parts) > 2 and parts[2] == 'weather':
+        return WEATHER
+    if len(parts) > 2 and parts[2] == 'air_quality':
+        return AIR_QUALITY
+    return FEED
+
+
+class _Node(object):
+    __slots__ = ('children', 'kind', 'count')
+
+    def __init__(self):
+        self.children = {}
+        self.kind = None
+        self.count = 0
+
+
+class TopicRouter(object):
+    """Maps MQTT topics to the (kind, key) pair passed on to callbacks.
+
+    Subscription patterns, which may use the + and # wildcards, are stored in
+    a trie keyed by topic level.  The route of every topic seen is cached, so
+    a message on a known topic costs a single dict lookup; the cache is
+    cleared whenever the subscriptions change.  Topics that match no
+    subscription are classified by their shape.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def add(self, pattern, kind):
+        """Register a subscription pattern for a kind of topic."""
+        with self._lock:
+            node = self._root
+            for level in pattern.split('/'):
+                node = node.children.setdefault(level, _Node())
+            node.kind = kind
+            node.count += 1
+            self._cache = {}
+
+    def remove(self, pattern):
+        """Forget a subscription pattern registered with add()."""
+        with self._lock:
+            path = [self._root]
+            for level in pattern.split('/'):
+                node = path[-1].children.get(level)
+                if node is None:
+                    return
+                path.append(node)
+            node = path[-1]
+            node.count -= 1
+            if node.count <= 0:
+                node.kind = None
+                node.count = 0
+                # Prune branches that no longer lead to a pattern.
+                levels = pattern.split('/')
+                for parent, level in zip(reversed(path[:-1]), reversed(levels)):
+                    child = parent.children[level]
+                    if child.kind is not None or child.children:
+                        break
+                    del parent.children[level]
+            self._cache = {}
+
+    def match(self, topic):
+        """Return the kind of the most specific pattern matching topic, or
+        None.  Exact levels win over +, which wins over #."""
+        return self._match(self._root, topic.split('/'), 0)
+
+    def _match(self, node, parts, depth):
+        if depth == len(parts):
+            if node.kind is not None:
+                return node.kind
+            # "a/#" also matches "a".
+            wildcard = node.children.get('#')
+            return None if wildcard is None else wildcard.kind
+        level = parts[depth]
+        for key in (level, '+'):
+            child = node.children.get(key)
+            if child is not None:
+                kind = self._match(child, parts, depth + 1)
+                if kind is not None:
+                    return kind
+        wildcard = node.children.get('#')
+        return None if wildcard is None else wildcard.kind
+
+    def route(self, topic):
+        """Return the (kind, key) pair for a topic."""
+        route = self._cache.get(topic)
+        if route is None:
+            # Match and fill the cache under the lock, so a route computed
+            # before add() or remove() can't be cached after it.
+            parts = topic.split('/')
+            with self._lock:
+                kind = self.match(topic) or classify(parts)
+                route = (kind, topic_key(kind, parts))
+                if len(self._cache) >= MAX_CACHED_TOPICS:
+                    self._cache = {}
+                self._cache[topic] = route
+        return route
@@ -0,0 +1,76 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Benchmark of the time it takes to import the library.
+
+Each statement is timed in fresh interpreters (the best of --repeat runs) and
+compared with a bare interpreter start.  With --budget the script exits with
+status 1 if `import Adafruit_IO` costs more than that many milliseconds, so it
+can guard the import time in CI.
+
+Usage: python benchmarks/bench_import.py [--repeat 10] [--budget 50]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    'import Adafruit_IO',
+    'from Adafruit_IO import Client',
+    'from Adafruit_IO import MQTTClient',
+]
+
+
+def best_time(code, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', code], cwd=ROOT)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=None,
+                        help='maximum milliseconds for `import Adafruit_IO`')
+    args = parser.parse_args()
+
+    baseline = best_time('pass', args.repeat)
+    print('interpreter start {0:8.1f} ms'.format(baseline * 1000))
+    costs = {}
+    for statement in STATEMENTS:
+        costs[statement] = (best_time(statement, args.repeat) - baseline) * 1000
+        print('{0:<34} {1:8.1f} ms'.format(statement, costs[statement]))
+
+    if args.budget is not None and costs['import Adafruit_IO'] > args.budget:
+        print('import Adafruit_IO took {0:.1f} ms, over the {1:.1f} ms budget'.format(
+            costs['import Adafruit_IO'], args.budget))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
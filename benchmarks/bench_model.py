@@ -0,0 +1,91 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Benchmark of the model from_dict constructors.
+
+Parses a list of synthetic data records (shaped like an Adafruit IO feed
+history page) with the generated Data.from_dict / Data.from_dicts methods,
+and with the keyword-dict constructor they replaced.
+
+Usage: python benchmarks/bench_model.py [--records 1000000] [--repeat 3]
+"""
+import argparse
+import gc
+import time
+
+from Adafruit_IO import Data
+
+
+def legacy_from_dict(cls, data):
+    # The constructor used before the generated methods.
+    params = {x: data.get(x, None) for x in cls._fields}
+    return cls(**params)
+
+
+def make_records(count):
+    return [{'id': '0E{0:012d}'.format(i), 'value': str(i * 0.5), 'feed_id': 1234,
+             'feed_key': 'temperature', 'created_at': '2024-01-01T00:00:00Z',
+             'created_epoch': 1704067200 + i, 'expiration': '2024-02-01T00:00:00Z',
+             'lat': None, 'lon': None, 'ele': None} for i in range(count)]
+
+
+def best_times(funcs, repeat):
+    # Time the functions in turn, repeat times, so a slow patch of the machine
+    # doesn't only hit one of them.  Like timeit, the garbage collector is
+    # paused while timing, so the results don't depend on when a collection
+    # of the records happens.
+    best = [None] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            gc.collect()
+            gc.disable()
+            try:
+                started = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - started
+            finally:
+                gc.enable()
+            best[i] = elapsed if best[i] is None else min(best[i], elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    assert [legacy_from_dict(Data, r) for r in records[:100]] == Data.from_dicts(records[:100])
+
+    cases = [
+        ('legacy from_dict', lambda: [legacy_from_dict(Data, r) for r in records]),
+        ('Data.from_dict', lambda: list(map(Data.from_dict, records))),
+        ('Data.from_dicts', lambda: Data.from_dicts(records)),
+    ]
+    print('{0} records, best of {1}'.format(args.records, args.repeat))
+    times = best_times([func for _, func in cases], args.repeat)
+    for (name, _), elapsed in zip(cases, times):
+        print('{0:<18} {1:8.3f} s {2:10.0f} records/s  {3:5.2f}x'.format(
+            name, elapsed, args.records / elapsed, times[0] / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Benchmark of the MQTT client's message dispatch and publish round trips.
+
+The dispatch part feeds synthetic paho MQTTMessage objects for feed, group,
+weather, air quality and time topics straight into MQTTClient's message
+handler and reports messages/sec and the dispatch overhead per message (the
+time spent before the on_message callback, which does nothing here).
+
+The round trip part starts the broker stand-in (tests/mqtt_broker.py)
+in a separate process, subscribes to a feed and publishes to it in a loop.
+It reports messages/sec for a burst of messages, and the publish ->
+on_message latency of messages sent one at a time.
+
+Usage: python benchmarks/bench_mqtt.py [--messages 200000] [--publish 5000]
+                                       [--samples 1000] [--output FILE]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+
+import paho.mqtt.client as mqtt
+
+from Adafruit_IO import MQTTClient, __version__
+
+BROKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'mqtt_broker.py')
+
+TOPICS = {
+    'feed': 'user/feeds/temperature',
+    'group': 'user/groups/weatherstation/json',
+    'weather': 'user/integration/weather/1234/current',
+    'air_quality': 'user/integration/air_quality/5678/current',
+    'time': 'time/seconds',
+}
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def quiet_client(*args, **kwargs):
+    # MQTTClient prints status messages, keep the report clean.
+    with contextlib.redirect_stdout(io.StringIO()):
+        return MQTTClient(*args, **kwargs)
+
+
+def bench_dispatch(count):
+    client = quiet_client('user', 'key', secure=False)
+    client.on_message = lambda client, feed, payload: None
+    callback = client.on_message
+
+    started = time.perf_counter()
+    for _ in range(count):
+        callback(client, 'temperature', '42')
+    baseline = time.perf_counter() - started
+
+    results = {}
+    for kind, topic in TOPICS.items():
+        message = mqtt.MQTTMessage(topic=topic.encode('utf-8'))
+        message.payload = b'42'
+        handle = client._mqtt_message
+        started = time.perf_counter()
+        for _ in range(count):
+            handle(None, None, message)
+        elapsed = time.perf_counter() - started
+        results[kind] = {
+            'messages': count,
+            'messages_per_sec': round(count / elapsed, 1),
+            'ns_per_message': round(elapsed / count * 1e9, 1),
+            'dispatch_overhead_ns': round((elapsed - baseline) / count * 1e9, 1),
+        }
+    return results
+
+
+def bench_publish(count, samples, port, qos):
+    # Throughput: publish count messages back to back.  Latency: publish
+    # samples messages one at a time, each after the previous one arrived.
+    received = []
+    arrived = threading.Semaphore(0)
+
+    def on_message(client, feed, payload):
+        received.append(time.perf_counter() - float(payload))
+        arrived.release()
+
+    subscribed = threading.Event()
+    client = quiet_client('user', 'key', service_host='127.0.0.1', secure=False, port=port)
+    client.on_message = on_message
+    client.on_subscribe = lambda *args: subscribed.set()
+    with contextlib.redirect_stdout(io.StringIO()):
+        client.connect()
+        client.loop_background()
+        client.subscribe('latency', qos=qos)
+        subscribed.wait(10)
+
+        started = time.perf_counter()
+        for _ in range(count):
+            client.publish('latency', repr(time.perf_counter()))
+        delivered = sum(1 for _ in range(count) if arrived.acquire(timeout=10))
+        elapsed = time.perf_counter() - started
+
+        del received[:]
+        for _ in range(samples):
+            client.publish('latency', repr(time.perf_counter()))
+            if not arrived.acquire(timeout=10):
+                break
+        client.disconnect()
+        client.loop_background(stop=True)
+    return {
+        'messages': count,
+        'received': delivered,
+        'messages_per_sec': round(delivered / elapsed, 1),
+        'latency_samples': len(received),
+        'p50_latency_ms': round(percentile(received, 0.50) * 1000, 3) if received else None,
+        'p99_latency_ms': round(percentile(received, 0.99) * 1000, 3) if received else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--messages', type=int, default=200000,
+                        help='messages dispatched per topic kind')
+    parser.add_argument('--publish', type=int, default=5000,
+                        help='messages published through the broker')
+    parser.add_argument('--samples', type=int, default=1000,
+                        help='one-at-a-time round trips timed for latency')
+    parser.add_argument('--qos', type=int, default=0, choices=(0, 1),
+                        help='QoS of the subscription')
+    parser.add_argument('--output', help='write the results to this file')
+    args = parser.parse_args()
+
+    report = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'paho_mqtt': mqtt.__version__ if hasattr(mqtt, '__version__') else None,
+        'dispatch': bench_dispatch(args.messages),
+    }
+    for kind, result in report['dispatch'].items():
+        print('dispatch {0:<12} {1:12.1f} msg/s  {2:8.1f} ns overhead'.format(
+            kind, result['messages_per_sec'], result['dispatch_overhead_ns']), file=sys.stderr)
+
+    broker = subprocess.Popen([sys.executable, BROKER], stdout=subprocess.PIPE)
+    try:
+        port = int(broker.stdout.readline())
+        report['publish'] = bench_publish(args.publish, args.samples, port, args.qos)
+    finally:
+        broker.terminate()
+        broker.wait()
+    print('publish {0:12.1f} msg/s  p50 {1} ms  p99 {2} ms'.format(
+        report['publish']['messages_per_sec'], report['publish']['p50_latency_ms'],
+        report['publish']['p99_latency_ms']), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Offline throughput benchmark of the REST client.
+
+Starts the local stub server (benchmarks/stub_server.py) in a separate
+process, so only the client's own work is measured, and runs these
+scenarios against it:
+
+    send_data        one point per request
+    send_batch_data  batches of 1000 points
+    data_pages       data(feed, max_results=None), following the Link header
+    receive          the last value of a feed
+    feeds, groups, dashboards
+                     metadata listings
+
+For each scenario it reports requests/sec, p50/p99 latency per call, client
+CPU time per point and the peak memory allocated by one call, as JSON.
+
+Usage: python benchmarks/bench_rest.py [--ops 200] [--history 10000] [--output FILE]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from Adafruit_IO import Client, Data, __version__
+
+STUB_SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stub_server.py')
+
+BATCH_SIZE = 1000
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def scenarios(args):
+    # name -> (number of calls, points per call, callable taking the client)
+    batch = [Data(value=str(i)) for i in range(BATCH_SIZE)]
+    return {
+        'send_data': (args.ops, 1, lambda io: io.send_data('feed-0', 42)),
+        'send_batch_data': (max(args.ops // 20, 1), BATCH_SIZE,
+                            lambda io: io.send_batch_data('feed-1', batch)),
+        'data_pages': (max(args.ops // 40, 1), args.history,
+                       lambda io: io.data('feed-2', max_results=None)),
+        'receive': (args.ops, 1, lambda io: io.receive('feed-3')),
+        'feeds': (args.ops, 1, lambda io: io.feeds()),
+        'groups': (args.ops, 1, lambda io: io.groups()),
+        'dashboards': (args.ops, 1, lambda io: io.dashboards()),
+    }
+
+
+def run(io, calls, points, func):
+    requests = [0]
+
+    def count(response, *args, **kwargs):
+        requests[0] += 1
+    io._session.hooks['response'].append(count)
+    func(io)  # warm up connections and caches
+    requests[0] = 0
+    latencies = []
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for _ in range(calls):
+        call_started = time.perf_counter()
+        func(io)
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    io._session.hooks['response'].remove(count)
+
+    tracemalloc.start()
+    func(io)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'calls': calls,
+        'requests': requests[0],
+        'points': calls * points,
+        'seconds': round(elapsed, 4),
+        'requests_per_sec': round(requests[0] / elapsed, 1),
+        'points_per_sec': round(calls * points / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 3),
+        'cpu_us_per_point': round(cpu / (calls * points) * 1e6, 3),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ops', type=int, default=200, help='calls per scenario')
+    parser.add_argument('--history', type=int, default=10000,
+                        help='points in the feed read by data_pages')
+    parser.add_argument('--scenario', action='append',
+                        help='only run this scenario (may be repeated)')
+    parser.add_argument('--json-codec', default=None, help="'json', 'orjson' or 'ujson'")
+    parser.add_argument('--output', help='write the results to this file')
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, STUB_SERVER, '--history', str(args.history)],
+                              stdout=subprocess.PIPE)
+    try:
+        port = int(server.stdout.readline())
+        io = Client('user', 'key', base_url='http://127.0.0.1:{0}'.format(port),
+                    json_codec=args.json_codec)
+        results = {}
+        for name, (calls, points, func) in scenarios(args).items():
+            if args.scenario and name not in args.scenario:
+                continue
+            results[name] = run(io, calls, points, func)
+            print('{0:<16} {1:9.1f} req/s  p50 {2:8.3f} ms  p99 {3:8.3f} ms  '
+                  '{4:8.3f} us CPU/point'.format(name, results[name]['requests_per_sec'],
+                                                results[name]['p50_ms'],
+                                                results[name]['p99_ms'],
+                                                results[name]['cpu_us_per_point']),
+                  file=sys.stderr)
+        io.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    report = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'json_codec': io.json_codec.name,
+        'ops': args.ops,
+        'history': args.history,
+        'scenarios': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Local stand-in for the Adafruit IO v2 REST API, for offline benchmarks.
+
+Implements the endpoints the REST client uses for feed data (create, batch,
+last/next/previous, paginated history with the service's Link header),
+feed details and the feed, group and dashboard listings.  Everything is kept
+in memory and the server speaks HTTP/1.1 keep-alive like the real service.
+
+Run it on its own with `python benchmarks/stub_server.py [--port 0]`; it
+prints the port it listens on.
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+PATH_RE = re.compile(r'^/api/v2/(?P<user>[^/]+)/(?P<rest>.*?)/?$')
+
+# Timestamp of the oldest seeded point, newer points are one second apart.
+EPOCH = 1704067200
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+
+
+class Store(object):
+    """In-memory feeds, groups and dashboards."""
+
+    def __init__(self, feeds=10, history=10000, groups=10, dashboards=10):
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.feeds = {}
+        self.points = {}
+        for i in range(feeds):
+            key = 'feed-{0}'.format(i)
+            self.feeds[key] = {'id': i, 'key': key, 'name': 'Feed {0}'.format(i),
+                               'description': '', 'history': True,
+                               'visibility': 'private', 'unit_type': None,
+                               'unit_symbol': None, 'license': None,
+                               'status_notify': False, 'status_timeout': 60}
+            self.points[key] = [self.point(key, str(n * 0.5), EPOCH + n) for n in range(history)]
+        self.groups = [{'id': i, 'key': 'group-{0}'.format(i), 'name': 'Group {0}'.format(i),
+                        'description': '', 'source_keys': None, 'source': None,
+                        'properties': {}, 'feeds': list(self.feeds.values())}
+                       for i in range(groups)]
+        self.dashboards = [{'id': i, 'key': 'dashboard-{0}'.format(i),
+                            'name': 'Dashboard {0}'.format(i), 'description': '',
+                            'show_header': False, 'color_mode': 'dark',
+                            'block_borders': True, 'header_image_url': None,
+                            'blocks': [{'id': n, 'name': 'Block {0}'.format(n),
+                                        'visual_type': 'line_chart', 'properties': {},
+                                        'block_feeds': []} for n in range(8)]}
+                           for i in range(dashboards)]
+
+    def point(self, feed, value, epoch, lat=None, lon=None, ele=None):
+        self.next_id += 1
+        return {'id': '0E{0:016d}'.format(self.next_id), 'value': value,
+                'feed_id': self.feeds[feed]['id'], 'feed_key': feed,
+                'created_at': _iso(epoch), 'created_epoch': epoch,
+                'expiration': _iso(epoch + 30 * 86400), 'lat': lat, 'lon': lon, 'ele': ele}
+
+    def append(self, feed, record):
+        epoch = time.time()
+        if record.get('created_at'):
+            epoch = datetime.fromisoformat(record['created_at'].replace('Z', '+00:00')).timestamp()
+        with self.lock:
+            point = self.point(feed, record.get('value'), epoch,
+                               record.get('lat'), record.get('lon'), record.get('ele'))
+            self.points.setdefault(feed, []).append(point)
+        return point
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, don't let Nagle's algorithm
+    # hold the body back for a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, body, status=200, headers=None):
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def route(self):
+        url = urlparse(self.path)
+        match = PATH_RE.match(url.path)
+        if match is None:
+            return None, None
+        return match.group('rest').split('/'), {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+    def do_GET(self):
+        store = self.server.store
+        parts, query = self.route()
+        if parts is None:
+            return self.send_json({'error': 'not found'}, 404)
+        if parts == ['feeds']:
+            return self.send_json(list(store.feeds.values()))
+        if parts == ['groups']:
+            return self.send_json(store.groups)
+        if parts == ['dashboards']:
+            return self.send_json(store.dashboards)
+        if len(parts) == 2 and parts[0] == 'groups':
+            return self.send_json(store.groups[0])
+        if len(parts) == 2 and parts[0] == 'dashboards':
+            return self.send_json(store.dashboards[0])
+        if parts[0] != 'feeds' or parts[1] not in store.feeds:
+            return self.send_json({'error': 'not found'}, 404)
+        feed = parts[1]
+        points = store.points[feed]
+        if len(parts) == 2:
+            return self.send_json(store.feeds[feed])
+        if parts[2:] == ['details']:
+            return self.send_json({'details': {'data': {'count': len(points)}}})
+        if parts[2:] == ['data', 'last']:
+            return self.send_json(points[-1] if points else {})
+        if parts[2:] in (['data', 'next'], ['data', 'previous']):
+            return self.send_json(points[0] if points else {})
+        if parts[2:] == ['data']:
+            return self.send_page(points, query)
+        return self.send_json({'error': 'not found'}, 404)
+
+    def send_page(self, points, query):
+        # Newest first, paged by an end_time cursor (an index here).  The service's Link
+        # header puts the next page's URL right after `rel="next", `, which is
+        # where the client reads it from.
+        limit = min(int(query.get('limit', 1000)), 1000)
+        end = len(points)
+        if 'end_time' in query:
+            end = int(query['end_time'])
+        start = max(end - limit, 0)
+        page = points[start:end][::-1]
+        headers = {}
+        if start > 0:
+            url = 'http://{0}:{1}{2}'.format(self.server.server_address[0],
+                                             self.server.server_address[1],
+                                             urlparse(self.path).path)
+            headers['Link'] = '<{0}>; rel="next", <{0}?end_time={1}&limit={2}>; rel="prev"'.format(
+                url, start, limit)
+        self.send_json(page, headers=headers)
+
+    def do_POST(self):
+        store = self.server.store
+        parts, _ = self.route()
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or b'{}')
+        if parts is None:
+            return self.send_json({'error': 'not found'}, 404)
+        if len(parts) == 3 and parts[0] == 'groups' and parts[2] == 'data':
+            return self.send_json([store.append(parts[1] + '.' + f['key'],
+                                                {'value': f['value'],
+                                                 'created_at': body.get('created_at')})
+                                   for f in body['feeds']])
+        if parts[0] != 'feeds' or len(parts) < 3:
+            return self.send_json({'error': 'not found'}, 404)
+        feed = parts[1]
+        store.feeds.setdefault(feed, {'id': len(store.feeds), 'key': feed, 'name': feed})
+        if parts[2:] == ['data']:
+            return self.send_json(store.append(feed, body))
+        if parts[2:] == ['data', 'batch']:
+            return self.send_json([store.append(feed, record) for record in body['data']])
+        return self.send_json({'error': 'not found'}, 404)
+
+
+class StubServer(object):
+    """Threaded stub server, usable as a context manager.
+
+    :param int port: Port to listen on, 0 picks a free one.
+    :param int history: Number of points seeded in every feed.
+    """
+
+    def __init__(self, port=0, history=10000, host='127.0.0.1'):
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = Store(history=history)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--history', type=int, default=10000,
+                        help='points seeded in every feed')
+    args = parser.parse_args()
+    server = StubServer(args.port, args.history)
+    print(server.httpd.server_address[1])
+    sys.stdout.flush()
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
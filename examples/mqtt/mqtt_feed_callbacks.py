@@ -0,0 +1,66 @@
+# Example of using the MQTT client class to handle each feed with its own
+# callback function, instead of checking the feed key in on_message.  Edit the
+# variables below to configure the key, username, and feeds to subscribe to.
+
+# Import standard python modules.
+import os
+import sys
+
+# Import Adafruit IO MQTT client.
+from Adafruit_IO import MQTTClient
+
+# Set to your Adafruit IO username.
+# (go to https://accounts.adafruit.com to find your username)
+ADAFRUIT_IO_USERNAME = os.getenv('ADAFRUIT_IO_USERNAME', 'YOUR_AIO_USERNAME')
+
+# Set to your Adafruit IO key.
+# Remember, your key is a secret,
+# so make sure **not** to publish it when you publish this code!
+ADAFRUIT_IO_KEY = os.getenv('ADAFRUIT_IO_KEY', 'YOUR_AIO_KEY')
+
+# Keys of the feeds with their own callbacks, and of another feed whose
+# messages go to on_message.
+TEMPERATURE_FEED = 'temperature'
+HUMIDITY_FEED = 'humidity'
+OTHER_FEED = 'DemoFeed'
+
+
+# Define callback functions which will be called when certain events happen.
+def connected(client):
+    print('Connected to Adafruit IO!  Listening for changes...')
+    client.subscribe(TEMPERATURE_FEED)
+    client.subscribe(HUMIDITY_FEED)
+    client.subscribe(OTHER_FEED)
+
+def disconnected(client):
+    print('Disconnected from Adafruit IO!')
+    sys.exit(1)
+
+def temperature(client, feed_key, payload):
+    # Called only for new values on the temperature feed.
+    print('Temperature is now {0}'.format(payload))
+
+def humidity(client, feed_key, payload):
+    # Called only for new values on the humidity feed.
+    print('Humidity is now {0}'.format(payload))
+
+def message(client, feed_key, payload):
+    # Called for feeds that don't have their own callback.
+    print('Feed {0} received new value: {1}'.format(feed_key, payload))
+
+
+# Create an MQTT client instance.
+client = MQTTClient(ADAFRUIT_IO_USERNAME, ADAFRUIT_IO_KEY)
+
+# Setup the callback functions defined above.
+client.on_connect    = connected
+client.on_disconnect = disconnected
+client.on_message    = message
+client.add_feed_callback(TEMPERATURE_FEED, temperature)
+client.add_feed_callback(HUMIDITY_FEED, humidity)
+
+# Connect to the Adafruit IO server.
+client.connect()
+
+# Start a message loop that blocks forever waiting for MQTT messages.
+client.loop_blocking()
@@ -64,6 +64,7 @@ setup(
 
     version          =  verstr,
     install_requires = ["requests", "paho-mqtt"],
+    extras_require   = {'async': ["aiohttp"], 'json': ["orjson"]},
 
 
     packages         = ['Adafruit_IO'],
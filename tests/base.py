@@ -18,9 +18,14 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import json
 import os
 import unittest
 
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
 
 class IOTestCase(unittest.TestCase):
 
@@ -43,3 +48,61 @@ class IOTestCase(unittest.TestCase):
             raise RuntimeError("ADAFRUIT_IO_USERNAME environment variable must be " \
               "set with valid Adafruit IO username to run this test!")
         return username
+
+
+class FakeClock(object):
+    """Clock whose sleep() just advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter that records outgoing requests and answers them with
+    canned responses, so REST client behavior can be tested offline.
+
+    Responses are given either as a list of (status, body, headers) tuples
+    which are returned in order, or as a callable that takes the prepared
+    request and returns such a tuple.
+    """
+
+    def __init__(self, responses=None):
+        super(StubAdapter, self).__init__()
+        self.responses = responses if callable(responses) else list(responses or [])
+        self.requests = []
+        self.closed = False
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        if callable(self.responses):
+            status, body, headers = self.responses(request)
+        else:
+            status, body, headers = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'Stub'
+        response.headers = CaseInsensitiveDict(headers or {})
+        response._content = b'' if body is None else json.dumps(body).encode('utf-8')
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+def stub_client(client, responses=None):
+    """Route all requests made by a REST client through a new StubAdapter and
+    return the adapter."""
+    adapter = StubAdapter(responses)
+    client._session.mount('https://', adapter)
+    client._session.mount('http://', adapter)
+    return adapter
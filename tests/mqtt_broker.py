@@ -0,0 +1,200 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Minimal MQTT 3.1.1 broker stand-in, for offline tests and benchmarks.
+
+Supports what the MQTT client uses: CONNECT, SUBSCRIBE/UNSUBSCRIBE (with +
+and # wildcards), PUBLISH at QoS 0 and 1, PINGREQ and DISCONNECT.  Messages
+are delivered to every matching subscriber at QoS 0.  There is no
+authentication, retained messages or session state.
+
+Run it on its own with `python tests/mqtt_broker.py [--port 0]`; it
+prints the port it listens on.
+"""
+import argparse
+import socket
+import socketserver
+import struct
+import sys
+import threading
+
+CONNECT, CONNACK, PUBLISH, PUBACK = 1, 2, 3, 4
+SUBSCRIBE, SUBACK, UNSUBSCRIBE, UNSUBACK = 8, 9, 10, 11
+PINGREQ, PINGRESP, DISCONNECT = 12, 13, 14
+
+
+def topic_matches(pattern, topic):
+    """Return True if topic matches a subscription pattern."""
+    pattern_parts = pattern.split('/')
+    topic_parts = topic.split('/')
+    for i, part in enumerate(pattern_parts):
+        if part == '#':
+            return True
+        if i >= len(topic_parts) or (part != '+' and part != topic_parts[i]):
+            return False
+    return len(pattern_parts) == len(topic_parts)
+
+
+def encode_length(length):
+    encoded = bytearray()
+    while True:
+        byte, length = length % 128, length // 128
+        encoded.append(byte | 0x80 if length else byte)
+        if not length:
+            return bytes(encoded)
+
+
+def packet(kind, body=b'', flags=0):
+    return bytes([kind << 4 | flags]) + encode_length(len(body)) + body
+
+
+def read_string(body, offset):
+    length = struct.unpack_from('!H', body, offset)[0]
+    return body[offset + 2:offset + 2 + length], offset + 2 + length
+
+
+class Session(socketserver.BaseRequestHandler):
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stream = self.request.makefile('rb')
+        self.send_lock = threading.Lock()
+        self.subscriptions = set()
+        with self.server.lock:
+            self.server.sessions.add(self)
+
+    def send(self, data):
+        with self.send_lock:
+            self.request.sendall(data)
+
+    def read_packet(self):
+        header = self.stream.read(1)
+        if not header:
+            return None, None, None
+        length, shift = 0, 0
+        while True:
+            byte = self.stream.read(1)[0]
+            length += (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        return header[0] >> 4, header[0] & 0x0F, self.stream.read(length)
+
+    def handle(self):
+        broker = self.server
+        try:
+            while True:
+                kind, flags, body = self.read_packet()
+                if kind is None or kind == DISCONNECT:
+                    break
+                if kind == CONNECT:
+                    self.send(packet(CONNACK, b'\x00\x00'))
+                elif kind == SUBSCRIBE:
+                    offset, granted = 2, bytearray()
+                    while offset < len(body):
+                        topic, offset = read_string(body, offset)
+                        granted.append(min(body[offset], 1))
+                        offset += 1
+                        with broker.lock:
+                            self.subscriptions.add(topic.decode('utf-8'))
+                    self.send(packet(SUBACK, body[:2] + bytes(granted)))
+                elif kind == UNSUBSCRIBE:
+                    offset = 2
+                    while offset < len(body):
+                        topic, offset = read_string(body, offset)
+                        with broker.lock:
+                            self.subscriptions.discard(topic.decode('utf-8'))
+                    self.send(packet(UNSUBACK, body[:2]))
+                elif kind == PUBLISH:
+                    topic, offset = read_string(body, 0)
+                    qos = (flags >> 1) & 3
+                    if qos:
+                        self.send(packet(PUBACK, body[offset:offset + 2]))
+                        offset += 2
+                    broker.publish(topic, body[offset:])
+                elif kind == PINGREQ:
+                    self.send(packet(PINGRESP))
+        except (ConnectionError, OSError, IndexError):
+            pass
+
+    def finish(self):
+        with self.server.lock:
+            self.server.sessions.discard(self)
+
+
+class Broker(socketserver.ThreadingTCPServer):
+    """Threaded broker, usable as a context manager.
+
+    :param int port: Port to listen on, 0 picks a free one.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=0, host='127.0.0.1'):
+        socketserver.ThreadingTCPServer.__init__(self, (host, port), Session)
+        self.lock = threading.Lock()
+        self.sessions = set()
+
+    def publish(self, topic, payload):
+        name = topic.decode('utf-8')
+        message = packet(PUBLISH, struct.pack('!H', len(topic)) + topic + payload)
+        with self.lock:
+            targets = [s for s in self.sessions
+                       if any(topic_matches(p, name) for p in s.subscriptions)]
+        for session in targets:
+            try:
+                session.send(message)
+            except OSError:
+                pass
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=0)
+    args = parser.parse_args()
+    broker = Broker(args.port)
+    print(broker.port)
+    sys.stdout.flush()
+    try:
+        broker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
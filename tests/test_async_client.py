@@ -0,0 +1,106 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import unittest
+
+from Adafruit_IO import AsyncClient, Data, RequestError, ThrottlingError
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    """Offline tests for the asyncio client against a local aiohttp server."""
+
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        app = web.Application()
+        app.router.add_get('/api/v2/testuser/feeds/{feed}/data/last', self.last)
+        app.router.add_post('/api/v2/testuser/feeds/{feed}/data', self.create)
+        app.router.add_get('/api/v2/testuser/feeds/{feed}/data', self.history)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url('/'))
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def last(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        feed = request.match_info['feed']
+        if feed == 'missing':
+            return web.json_response({'error': 'not found'}, status=404)
+        if feed == 'throttled':
+            return web.json_response({'error': 'slow down'}, status=429)
+        return web.json_response({'value': feed, 'id': '1'})
+
+    async def create(self, request):
+        self.assertEqual(request.headers['X-AIO-Key'], 'testkey')
+        body = await request.json()
+        return web.json_response({'value': body['value'], 'feed_id': 7})
+
+    async def history(self, request):
+        if 'end_time' not in request.query:
+            # Mirrors the service's Link header, see Client.get_next_link.
+            link = '<x>; rel="next", <{0}>; rel="prev"'.format(
+                request.url.with_query({'end_time': '1'}))
+            return web.json_response([{'value': '2'}, {'value': '1'}],
+                                     headers={'Link': link})
+        return web.json_response([{'value': '0'}])
+
+    async def test_send_and_receive(self):
+        async with AsyncClient('testuser', 'testkey', base_url=self.base_url) as aio:
+            data = await aio.send_data('feed', 42)
+            self.assertEqual(data.value, 42)
+            self.assertEqual(data.feed_id, 7)
+            self.assertIsInstance(await aio.receive('feed'), Data)
+
+    async def test_concurrent_requests_share_connection_limit(self):
+        async with AsyncClient('testuser', 'testkey', base_url=self.base_url,
+                               max_connections=4) as aio:
+            feeds = ['feed{0}'.format(i) for i in range(12)]
+            results = await asyncio.gather(*(aio.receive(f) for f in feeds))
+        self.assertEqual([d.value for d in results], feeds)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, 4)
+
+    async def test_data_follows_pagination(self):
+        async with AsyncClient('testuser', 'testkey', base_url=self.base_url) as aio:
+            data = await aio.data('feed', max_results=10)
+        self.assertEqual([d.value for d in data], ['2', '1', '0'])
+
+    async def test_errors(self):
+        async with AsyncClient('testuser', 'testkey', base_url=self.base_url) as aio:
+            with self.assertRaises(RequestError):
+                await aio.receive('missing')
+            with self.assertRaises(ThrottlingError):
+                await aio.receive('throttled')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import unittest
+
+from Adafruit_IO import AsyncMQTTClient, MQTTError
+
+from mqtt_broker import Broker
+
+
+class TestAsyncMQTTClient(unittest.IsolatedAsyncioTestCase):
+    """Offline tests for the asyncio MQTT client against a local broker."""
+
+    def setUp(self):
+        self.broker = Broker().start()
+
+    def tearDown(self):
+        self.broker.stop()
+
+    def client(self, **kwargs):
+        return AsyncMQTTClient('testuser', 'testkey', service_host='127.0.0.1',
+                               secure=False, port=self.broker.port, **kwargs)
+
+    async def test_publish_and_receive(self):
+        async with self.client() as client:
+            self.assertTrue(client.is_connected())
+            self.assertEqual(await client.subscribe('temp', qos=1), 1)
+            self.assertEqual(await client.subscribe_group('weather'), 0)
+            await client.publish('temp', 21)
+            await client.publish('temp', 22, qos=1)
+            await client.publish('temp', 23, group_id='weather')
+            received = []
+            async for feed, payload in client.messages():
+                received.append((feed, payload))
+                if len(received) == 2:
+                    break
+            self.assertEqual(received, [('temp', '21'), ('temp', '22')])
+            await client.unsubscribe('temp')
+        self.assertFalse(client.is_connected())
+
+    async def test_messages_end_after_disconnect(self):
+        client = self.client()
+        await client.connect()
+        await client.subscribe('temp')
+        await client.publish('temp', 'a', qos=1)
+
+        async def read():
+            return [message async for message in client.messages()]
+
+        reader = asyncio.ensure_future(read())
+        await asyncio.sleep(0.1)
+        await client.disconnect()
+        self.assertEqual(await asyncio.wait_for(reader, 5), [('temp', 'a')])
+
+    async def test_bounded_queue(self):
+        async with self.client(max_queued=2) as client:
+            await client.subscribe('temp')
+            for i in range(4):
+                await client.publish('temp', i, qos=1)
+            await asyncio.sleep(0.2)
+            self.assertEqual(client.dropped, 2)
+            messages = client.messages()
+            self.assertEqual(await messages.__anext__(), ('temp', '2'))
+            self.assertEqual(await messages.__anext__(), ('temp', '3'))
+            await messages.aclose()
+
+    async def test_invalid_qos(self):
+        client = self.client()
+        with self.assertRaises(MQTTError):
+            await client.subscribe('temp', qos=2)
@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import time
+import unittest
+
+from Adafruit_IO import Client, BufferedSender, RequestError, RetryPolicy
+
+import base
+
+
+class TestBufferedSender(unittest.TestCase):
+
+    def setUp(self):
+        self.io = Client('testuser', 'testkey', retry=RetryPolicy(max_attempts=1))
+        self.fail = False
+        self.adapter = base.stub_client(self.io, self.respond)
+
+    def respond(self, request):
+        if self.fail:
+            return 400, {'error': 'rejected'}, None
+        return 200, [], None
+
+    def batches(self):
+        return [(r.path_url.split('/')[5], json.loads(r.body)['data'])
+                for r in self.adapter.requests]
+
+    def test_flushes_full_batch(self):
+        with BufferedSender(self.io, max_batch=3, max_age=60) as sender:
+            for i in range(7):
+                sender.send('temp', i)
+            self.assertEqual(len(self.adapter.requests), 2)
+        batches = self.batches()
+        self.assertEqual([len(data) for _, data in batches], [3, 3, 1])
+        self.assertEqual([d['value'] for _, data in batches for d in data], list(range(7)))
+        self.assertTrue(all(d['created_at'] for _, data in batches for d in data))
+
+    def test_buffers_per_feed(self):
+        sender = BufferedSender(self.io, max_batch=10, max_age=60)
+        sender.send('a', 1)
+        sender.send('b', 2)
+        sender.send('a', 3)
+        self.assertEqual(self.adapter.requests, [])
+        sender.close()
+        values = {feed: [d['value'] for d in data] for feed, data in self.batches()}
+        self.assertEqual(values, {'a': [1, 3], 'b': [2]})
+        self.assertRaises(RuntimeError, sender.send, 'a', 4)
+
+    def test_flushes_old_points(self):
+        sender = BufferedSender(self.io, max_batch=10, max_age=0.05)
+        sender.send('temp', 1)
+        deadline = time.time() + 2
+        while not self.adapter.requests and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.adapter.requests), 1)
+        sender.close()
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_keeps_failed_points_up_to_cap(self):
+        self.io.retry = RetryPolicy(max_attempts=1, backoff=60, max_backoff=60)
+        sender = BufferedSender(self.io, max_batch=100, max_age=60, max_points=4)
+        self.fail = True
+        for i in range(3):
+            sender.send('temp', i)
+        # Upload errors are logged, the point stays buffered.
+        with self.assertLogs('Adafruit_IO.buffered', level='WARNING'):
+            sender.send('temp', 3)
+        self.assertEqual(sender.dropped, 0)
+        # The feed is backing off, so the oldest point is dropped instead.
+        sender.send('temp', 4)
+        self.assertEqual(sender.dropped, 1)
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.fail = False
+        sender.close()
+        self.assertEqual([d['value'] for d in self.batches()[-1][1]], [1, 2, 3, 4])
+
+    def test_backs_off_failing_feed(self):
+        self.io.retry = RetryPolicy(max_attempts=1, backoff=60, max_backoff=60)
+        sender = BufferedSender(self.io, max_batch=100, max_age=0.01)
+        self.fail = True
+        with self.assertLogs('Adafruit_IO.buffered', level='WARNING'):
+            sender.send('temp', 1)
+            deadline = time.time() + 2
+            while not self.adapter.requests and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(1.2)
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertRaises(RequestError, sender.flush)
+        self.fail = False
+        sender.close()
+        self.assertEqual(len(self.adapter.requests), 3)
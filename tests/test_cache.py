@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+import shutil
+import tempfile
+import unittest
+from urllib.parse import urlparse, parse_qs
+from datetime import datetime
+
+from Adafruit_IO import Client, FeedCache
+
+import base
+
+
+class TestFeedCache(unittest.TestCase):
+    """Offline tests for the SQLite feed history cache."""
+
+    def respond(self, request):
+        # Serve the points in self.points newest first, honouring start_time
+        # and end_time like the service.
+        self.queries.append(parse_qs(urlparse(request.url).query))
+        query = self.queries[-1]
+        points = sorted(self.points, key=lambda p: -p['created_epoch'])
+        if 'start_time' in query:
+            start = datetime.fromisoformat(query['start_time'][0]).timestamp()
+            points = [p for p in points if p['created_epoch'] >= start]
+        if 'end_time' in query:
+            end = datetime.fromisoformat(query['end_time'][0]).timestamp()
+            points = [p for p in points if p['created_epoch'] <= end]
+        return 200, points, None
+
+    def add_points(self, *epochs):
+        self.points.extend({'id': str(e), 'value': str(e), 'created_epoch': e,
+                            'feed_id': 1} for e in epochs)
+
+    def setUp(self):
+        self.points = []
+        self.queries = []
+        self.tmpdir = tempfile.mkdtemp()
+        self.io = Client('testuser', 'testkey')
+        base.stub_client(self.io, self.respond)
+        self.cache = FeedCache(self.io, os.path.join(self.tmpdir, 'cache.db'))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_sync_is_incremental(self):
+        self.add_points(100, 200, 300)
+        self.cache.sync('feed')
+        self.assertNotIn('start_time', self.queries[0])
+        self.add_points(400)
+        self.cache.sync('feed')
+        self.assertEqual(datetime.fromisoformat(self.queries[1]['start_time'][0]).timestamp(), 300)
+        values = [d.value for d in self.cache.data('feed', end_time=250)]
+        self.assertEqual(values, ['200', '100'])
+
+    def test_covered_range_is_served_locally(self):
+        self.add_points(100, 200, 300)
+        self.cache.sync('feed')
+        requests = len(self.queries)
+        data = self.cache.data('feed', start_time=150, end_time=300)
+        self.assertEqual([d.value for d in data], ['300', '200'])
+        self.assertEqual(len(self.queries), requests)
+
+    def test_open_range_syncs_first(self):
+        self.add_points(100)
+        self.assertEqual([d.value for d in self.cache.data('feed')], ['100'])
+        self.add_points(200)
+        self.assertEqual([d.value for d in self.cache.data('feed')], ['200', '100'])
+
+    def test_backfills_older_history(self):
+        self.add_points(100, 200, 300)
+        self.cache.sync('feed', since=250)
+        self.assertFalse(self.cache.covers('feed', start_time=150, end_time=300))
+        data = self.cache.data('feed', start_time=150, end_time=300)
+        self.assertEqual([d.value for d in data], ['300', '200'])
+        self.assertTrue(self.cache.covers('feed', start_time=150, end_time=300))
+
+    def test_cache_is_keyed_by_username(self):
+        self.add_points(100)
+        self.cache.sync('feed')
+        other = Client('otheruser', 'testkey')
+        base.stub_client(other, lambda request: (200, [], None))
+        cache = FeedCache(other, os.path.join(self.tmpdir, 'cache.db'))
+        self.assertEqual(cache.data('feed'), [])
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
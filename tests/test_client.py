@@ -1,9 +1,13 @@
 # Test REST client.
 # Author: Tony DiCola (tdicola@adafruit.com)
+import json
+import threading
 import time
+from datetime import datetime
 import unittest
+from urllib.parse import urlparse, parse_qs
 
-from Adafruit_IO import Client, Data, Feed, Group, Dashboard, Block, Layout, RequestError
+from Adafruit_IO import Client, Data, Feed, Group, Dashboard, Block, Layout, LazySequence, RequestError
 
 import base
 
@@ -405,5 +409,234 @@ class TestClient(base.IOTestCase):
         io.delete_dashboard(dash.key)
 
 
+class TestClientSession(unittest.TestCase):
+    """Offline tests for the pooled HTTP session."""
+
+    def test_requests_share_one_session(self):
+        io = Client('testuser', 'testkey')
+        adapter = base.stub_client(io, [(200, {'value': '1'}, None),
+                                        (200, [{'name': 'f', 'key': 'f'}], None),
+                                        (200, {}, None)])
+        self.assertEqual(io.receive('testfeed').value, '1')
+        self.assertEqual(io.feeds()[0].key, 'f')
+        io.delete_feed('f')
+        self.assertEqual([r.method for r in adapter.requests], ['GET', 'GET', 'DELETE'])
+        self.assertEqual(adapter.requests[0].url,
+                         'https://io.adafruit.com/api/v2/testuser/feeds/testfeed/data/last')
+        self.assertEqual(adapter.requests[0].headers['X-AIO-Key'], 'testkey')
+
+    def test_lazy_listings(self):
+        io = Client('testuser', 'testkey')
+        base.stub_client(io, [(200, [{'name': 'f', 'key': 'f', 'unknown': 1}], None),
+                              (200, [{'name': 'g', 'feeds': [{'key': 'g.f'}]}], None)])
+        feeds = io.feeds(lazy=True)
+        self.assertEqual(feeds.field('key'), ['f'])
+        self.assertEqual(feeds[0], Feed.from_dict({'name': 'f', 'key': 'f'}))
+        groups = io.groups(lazy=True)
+        self.assertIsInstance(groups[0].feeds, LazySequence)
+        self.assertEqual(groups[0].feeds[0].key, 'g.f')
+
+    def test_pool_settings(self):
+        io = Client('testuser', 'testkey', pool_connections=2, pool_maxsize=32, pool_block=True)
+        adapter = io._session.get_adapter('https://io.adafruit.com')
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+
+    def test_context_manager_closes_session(self):
+        with Client('testuser', 'testkey') as io:
+            adapter = base.stub_client(io)
+        self.assertTrue(adapter.closed)
+
+
+class TestClientConcurrency(unittest.TestCase):
+    """Offline tests for the concurrent multi-feed helpers."""
+
+    def respond(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        feed = request.path_url.split('/')[5]
+        if feed == 'missing':
+            return 404, {'error': 'not found'}, None
+        if request.path_url.endswith('/data/last'):
+            return 200, {'value': feed}, None
+        return 200, [{'value': feed}], {'link': ''}
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.io = Client('testuser', 'testkey')
+        base.stub_client(self.io, self.respond)
+
+    def test_receive_many(self):
+        feeds = ['feed{0}'.format(i) for i in range(8)] + ['missing']
+        results = self.io.receive_many(feeds, max_workers=4)
+        self.assertEqual(list(results), feeds)
+        self.assertEqual(results['feed3'].value, 'feed3')
+        self.assertIsInstance(results['missing'], RequestError)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, 4)
+
+    def test_data_many(self):
+        results = self.io.data_many(['a', 'b'], max_results=10)
+        self.assertEqual(results['a'][0].value, 'a')
+        self.assertEqual(results['b'][0].value, 'b')
+
+
+class TestClientBatch(unittest.TestCase):
+    """Offline tests for chunked batch uploads."""
+
+    def respond(self, request):
+        data = json.loads(request.body)['data']
+        with self.lock:
+            self.received.append(data)
+        if any(d['value'] == 'bad' for d in data):
+            return 400, {'error': 'rejected'}, None
+        return 200, [], None
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.received = []
+        self.io = Client('testuser', 'testkey')
+        base.stub_client(self.io, self.respond)
+
+    def test_chunks_generator(self):
+        results = self.io.send_batch_data('testfeed', (Data(value=i) for i in range(25)),
+                                          chunk_size=10)
+        self.assertEqual([(r.offset, r.count, r.error) for r in results],
+                         [(0, 10, None), (10, 10, None), (20, 5, None)])
+        self.assertEqual([len(data) for data in self.received], [10, 10, 5])
+        self.assertIsNone(self.received[0][0]['created_at'])
+
+    def test_parallel_upload_keeps_order(self):
+        values = [Data(value=i) for i in range(100)]
+        results = self.io.send_batch_data('testfeed', values, chunk_size=7, max_workers=4)
+        self.assertEqual(len(results), 15)
+        self.assertEqual([r.offset for r in results], list(range(0, 100, 7)))
+        points = sorted((d for data in self.received for d in data),
+                        key=lambda d: d['created_at'])
+        self.assertEqual([d['value'] for d in points], list(range(100)))
+
+    def test_partial_failure(self):
+        values = [Data(value=v) for v in ('1', '2', 'bad', '4')]
+        results = self.io.send_batch_data('testfeed', values, chunk_size=2)
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[0].data)
+        self.assertIsInstance(results[1].error, RequestError)
+        self.assertEqual([d.value for d in results[1].data], ['bad', '4'])
+
+    def test_raises_when_everything_fails(self):
+        with self.assertRaises(RequestError):
+            self.io.send_batch_data('testfeed', [Data(value='bad')])
+
+    def test_send_group_data(self):
+        io = Client('testuser', 'testkey')
+        adapter = base.stub_client(io, [(200, [{'value': '1', 'feed_key': 'g.a'},
+                                               {'value': '2', 'feed_key': 'g.b'}], None)])
+        data = io.send_group_data('g', {'a': 1, 'b': 2},
+                                  metadata={'lat': 1.0, 'lon': 2.0, 'ele': None,
+                                            'created_at': datetime(2020, 1, 1)})
+        self.assertEqual([d.value for d in data], ['1', '2'])
+        request = adapter.requests[0]
+        self.assertTrue(request.path_url.endswith('/groups/g/data'))
+        self.assertEqual(json.loads(request.body),
+                         {'feeds': [{'key': 'a', 'value': 1}, {'key': 'b', 'value': 2}],
+                          'location': {'lat': 1.0, 'lon': 2.0},
+                          'created_at': '2020-01-01T00:00:00'})
+
+    def test_send_group_batch_data(self):
+        rows = [('2020-01-01T00:00:0{0}Z'.format(i), {'a': i, 'b': -i}) for i in range(3)]
+        results = self.io.send_group_batch_data('g', rows)
+        self.assertEqual(list(results), ['a', 'b'])
+        self.assertEqual(results['a'][0].count, 3)
+        self.assertEqual(sorted([d['value'] for d in data] for data in self.received),
+                         [[0, -1, -2], [0, 1, 2]])
+        self.assertEqual(self.received[0][2]['created_at'], '2020-01-01T00:00:02Z')
+
+
+class TestClientPagination(unittest.TestCase):
+    """Offline tests for paging through feed history."""
+
+    TOTAL = 2500
+
+    def respond(self, request):
+        # Serve TOTAL points, newest first, paged by `end_time` like the
+        # service does.  Mirrors the service's Link header format.
+        query = parse_qs(urlparse(request.url).query)
+        self.limits.append(int(query['limit'][0]))
+        end = int(query.get('end_time', [self.TOTAL])[0])
+        start = max(end - int(query['limit'][0]), 0)
+        page = [{'value': str(i), 'id': str(i)} for i in range(end - 1, start - 1, -1)]
+        headers = {}
+        if start > 0:
+            headers['link'] = '<x>; rel="next", <{0}?end_time={1}>; rel="prev"'.format(
+                request.url.split('?')[0], start)
+        return 200, page, headers
+
+    def setUp(self):
+        self.limits = []
+        self.io = Client('testuser', 'testkey')
+        base.stub_client(self.io, self.respond)
+
+    def test_data_follows_pages(self):
+        data = self.io.data('testfeed', max_results=2200)
+        self.assertEqual(len(data), 2200)
+        self.assertEqual(data[0].value, '2499')
+        self.assertEqual(data[-1].value, '300')
+        self.assertEqual(self.limits, [1000, 1000, 200])
+
+    def test_prefetch_returns_same_data(self):
+        expected = self.io.data('testfeed', max_results=self.TOTAL)
+        data = self.io.data('testfeed', max_results=self.TOTAL, prefetch=2)
+        self.assertEqual(data, expected)
+        self.assertEqual(len(data), self.TOTAL)
+
+    def test_lazy_data(self):
+        expected = self.io.data('testfeed', max_results=self.TOTAL)
+        data = self.io.data('testfeed', max_results=self.TOTAL, lazy=True)
+        self.assertIsInstance(data, LazySequence)
+        self.assertEqual(list(data), expected)
+        self.assertEqual(data.field('value')[:2], ['2499', '2498'])
+        self.assertEqual(data[-1], expected[-1])
+
+    def test_iter_data_streams_all_pages(self):
+        items = self.io.iter_data('testfeed', page_size=1000)
+        values = [d.value for d in items]
+        self.assertEqual(len(values), self.TOTAL)
+        self.assertEqual(values[-1], '0')
+        self.assertIsNone(items.cursor)
+        # Every request is a page of data, no feed details lookup.
+        self.assertEqual(self.limits, [1000, 1000, 1000])
+
+    def test_iter_data_resumes_from_cursor(self):
+        items = self.io.iter_data('testfeed', page_size=1000, raw=True)
+        first = [next(items) for _ in range(1500)]
+        self.assertEqual(first[-1]['value'], '1000')
+        resumed = list(self.io.iter_data('testfeed', page_size=1000, cursor=items.cursor))
+        self.assertEqual(resumed[0].value, '1499')
+        self.assertEqual(len(resumed), 1500)
+
+    def test_iter_data_time_range(self):
+        adapter = base.stub_client(self.io, [(200, [], None)])
+        list(self.io.iter_data('testfeed', start_time='2019-01-01T00:00:00Z',
+                               end_time=datetime(2019, 2, 1)))
+        query = parse_qs(urlparse(adapter.requests[0].url).query)
+        self.assertEqual(query['start_time'], ['2019-01-01T00:00:00Z'])
+        self.assertEqual(query['end_time'], ['2019-02-01T00:00:00'])
+
+    def test_prefetch_raises_errors(self):
+        io = Client('testuser', 'testkey')
+        link = '<x>; rel="next", <http://x/?end_time=1>; rel="prev"'
+        base.stub_client(io, [(200, [{'value': '1'}], {'link': link}),
+                              (404, {'error': 'not found'}, None)])
+        with self.assertRaises(RequestError):
+            io.data('testfeed', max_results=10, prefetch=1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import unittest
+
+from Adafruit_IO import Client, Feed, Group, JSONCodec, RequestError
+from Adafruit_IO.codec import get_codec, orjson, ujson
+
+import base
+
+
+class RecordingCodec(JSONCodec):
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super(RecordingCodec, self).dumps(obj)
+
+    def loads(self, data):
+        self.calls.append('loads')
+        return super(RecordingCodec, self).loads(data)
+
+
+class TestCodec(unittest.TestCase):
+
+    PAYLOAD = {'data': [{'value': 'café', 'lat': 1.5, 'id': None}], 'n': 3}
+
+    def check_round_trip(self, codec):
+        encoded = codec.dumps(self.PAYLOAD)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded.decode('utf-8')), self.PAYLOAD)
+        self.assertEqual(codec.loads(encoded), self.PAYLOAD)
+        self.assertRaises(ValueError, codec.loads, b'<html>')
+
+    def check_matches_json(self, codec):
+        # Payloads that the json module encodes must encode the same way.
+        group = Group(name='g', feeds=(Feed(key='a'), Feed(key='b')))._asdict()
+        for payload in (group, {'value': 2 ** 70}, {'value': -2 ** 64}):
+            self.assertEqual(json.loads(codec.dumps(payload).decode('utf-8')),
+                             json.loads(json.dumps(payload)))
+        self.assertRaises(TypeError, codec.dumps, {'value': object()})
+
+    def test_stdlib(self):
+        self.check_round_trip(get_codec('json'))
+        self.check_matches_json(get_codec('json'))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        self.check_round_trip(get_codec('orjson'))
+        self.check_matches_json(get_codec('orjson'))
+
+    @unittest.skipIf(ujson is None, "ujson is not installed")
+    def test_ujson(self):
+        self.check_round_trip(get_codec('ujson'))
+        self.check_matches_json(get_codec('ujson'))
+
+    def test_get_codec(self):
+        codec = JSONCodec()
+        self.assertIs(get_codec(codec), codec)
+        self.assertIn(get_codec().name, ('json', 'orjson', 'ujson'))
+        self.assertRaises(ValueError, get_codec, 'yaml')
+
+    def test_client_uses_codec(self):
+        codec = RecordingCodec()
+        io = Client('testuser', 'testkey', json_codec=codec)
+        adapter = base.stub_client(io, [(200, {'value': '42'}, None)])
+        self.assertEqual(io.send_data('testfeed', 42).value, '42')
+        self.assertEqual(codec.calls, ['dumps', 'loads'])
+        self.assertEqual(json.loads(adapter.requests[0].body)['value'], 42)
+
+    def test_client_sends_nested_models(self):
+        io = Client('testuser', 'testkey')
+        adapter = base.stub_client(io, [(200, {'name': 'g'}, None)])
+        io.create_group(Group(name='g', feeds=(Feed(key='a'),)))
+        self.assertEqual(json.loads(adapter.requests[0].body)['feeds'][0][1], 'a')
+
+    def test_request_error_with_invalid_body(self):
+        io = Client('testuser', 'testkey', json_codec='json')
+        base.stub_client(io, [(400, {'error': 'bad value'}, None),
+                              (400, None, None)])
+        with self.assertRaisesRegex(RequestError, 'bad value'):
+            io.send_data('testfeed', 42)
+        self.assertRaises(RequestError, io.send_data, 'testfeed', 42)
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import unittest
+from array import array
+
+from Adafruit_IO import Client, Data, DataBlock
+
+import base
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def records(count, start=1000):
+    # Newest first, the way the service returns history.
+    return [{'id': str(i), 'feed_id': 7, 'value': str(i * 0.5),
+             'created_epoch': start + i, 'created_at': 'x', 'unknown': 1}
+            for i in range(count - 1, -1, -1)]
+
+
+class TestDataBlock(unittest.TestCase):
+
+    def test_columns_are_arrays(self):
+        block = DataBlock.from_records(records(5))
+        self.assertEqual(len(block), 5)
+        self.assertIsInstance(block.created_epoch, array)
+        self.assertEqual(list(block.created_epoch), [1000, 1001, 1002, 1003, 1004])
+        self.assertEqual(list(block.value), [0, 0.5, 1.0, 1.5, 2.0])
+        self.assertIsNone(block.lat)
+        self.assertEqual(block.columns['id'], ['0', '1', '2', '3', '4'])
+
+    def test_rows_are_data(self):
+        block = DataBlock.from_records(records(3))
+        self.assertEqual(block[-1], Data(id='2', feed_id=7, value=1.0, created_epoch=1002))
+        self.assertEqual(len(list(block)), 3)
+
+    def test_non_numeric_values_become_strings(self):
+        block = DataBlock.from_records([{'value': '1', 'created_epoch': 1},
+                                        {'value': '007', 'created_epoch': 2},
+                                        {'value': 'on', 'created_epoch': 3}])
+        self.assertEqual(block.value, ['1', '007', 'on'])
+        self.assertIs(block.value[2], 'on')
+
+    def test_missing_values_are_nan(self):
+        block = DataBlock.from_records([{'value': '1', 'created_epoch': 1},
+                                        {'value': None, 'created_epoch': 2}])
+        self.assertIsInstance(block.value, array)
+        self.assertNotEqual(block.value[1], block.value[1])  # NaN
+        self.assertIsNone(block[1].value)
+
+    def test_strings_after_numbers_keep_short_form(self):
+        block = DataBlock.from_records([{'value': '1', 'created_epoch': 1},
+                                        {'value': '2.5', 'created_epoch': 2}])
+        block.extend([{'value': 'on', 'created_epoch': 3}])
+        self.assertEqual(block.value, ['1', '2.5', 'on'])
+
+    def test_reversed_slice(self):
+        block = DataBlock.from_records(records(5))
+        backwards = block[::-1]
+        self.assertEqual(list(backwards.created_epoch), [1004, 1003, 1002, 1001, 1000])
+        self.assertEqual(list(backwards.between(1001, 1002).created_epoch), [1001, 1002])
+        backwards.sort()
+        self.assertEqual(list(backwards.created_epoch), [1000, 1001, 1002, 1003, 1004])
+
+    def test_location_columns(self):
+        block = DataBlock.from_records([{'value': '1', 'created_epoch': 1},
+                                        {'value': '2', 'created_epoch': 2,
+                                         'lat': '40.5', 'lon': -74}])
+        self.assertNotEqual(block.lat[0], block.lat[0])  # NaN
+        self.assertEqual(block.lat[1], 40.5)
+        self.assertEqual(block.lon[1], -74)
+        self.assertIsNone(block.ele)
+        self.assertIsNone(block[0].lat)
+
+    def test_between_slices_by_time(self):
+        block = DataBlock.from_records(records(10))
+        part = block.between(1002, 1005)
+        self.assertEqual(list(part.created_epoch), [1002, 1003, 1004, 1005])
+        self.assertEqual(part.columns['id'], ['2', '3', '4', '5'])
+        self.assertEqual(len(block.between(2000)), 0)
+
+    def test_unsorted_input_is_sorted(self):
+        block = DataBlock.from_records([{'value': '3', 'created_epoch': 3},
+                                        {'value': '1', 'created_epoch': 1},
+                                        {'value': '2', 'created_epoch': 2}])
+        self.assertEqual(list(block.value), [1, 2, 3])
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            DataBlock(fields=('nope',))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_views_share_memory(self):
+        block = DataBlock.from_records(records(4))
+        view = block.to_numpy('value')
+        self.assertEqual(view.tolist(), [0, 0.5, 1.0, 1.5])
+        block.value[0] = 9
+        self.assertEqual(view[0], 9)
+
+    def test_client_data_block(self):
+        io = Client('testuser', 'testkey')
+        base.stub_client(io, [(200, records(3), None)])
+        block = io.data_block('testfeed')
+        self.assertEqual(list(block.created_epoch), [1000, 1001, 1002])
+
+
+if __name__ == "__main__":
+    unittest.main()
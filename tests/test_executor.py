@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+import unittest
+
+from Adafruit_IO import CallbackExecutor
+
+
+class TestCallbackExecutor(unittest.TestCase):
+
+    def test_keeps_order_per_key(self):
+        executor = CallbackExecutor(workers=4)
+        seen = {'a': [], 'b': [], 'c': []}
+        for i in range(200):
+            for key in seen:
+                executor.submit(key, seen[key].append, i)
+        self.assertTrue(executor.join(timeout=5))
+        executor.shutdown()
+        for values in seen.values():
+            self.assertEqual(values, list(range(200)))
+
+    def test_keys_run_in_parallel(self):
+        executor = CallbackExecutor(workers=2)
+        release = threading.Event()
+        done = []
+        executor.submit('slow', release.wait, 5)
+        executor.submit('fast', done.append, 1)
+        self.assertTrue(self._wait_for(lambda: done))
+        release.set()
+        executor.shutdown()
+
+    def test_drop_newest(self):
+        executor, release, seen = self._blocked(CallbackExecutor(workers=1, max_pending=2,
+                                                                  overflow='drop_newest'))
+        results = [executor.submit('k', seen.append, i) for i in range(4)]
+        release.set()
+        executor.shutdown()
+        self.assertEqual(results, [True, True, False, False])
+        self.assertEqual(seen, [0, 1])
+        self.assertEqual(executor.dropped_newest, 2)
+
+    def test_drop_oldest(self):
+        executor, release, seen = self._blocked(CallbackExecutor(workers=1, max_pending=2,
+                                                                  overflow='drop_oldest'))
+        for i in range(4):
+            executor.submit('k' if i % 2 else 'j', seen.append, i)
+        release.set()
+        executor.shutdown()
+        self.assertEqual(sorted(seen), [2, 3])
+        self.assertEqual(executor.dropped_oldest, 2)
+
+    def test_block(self):
+        executor, release, seen = self._blocked(CallbackExecutor(workers=1, max_pending=1))
+        executor.submit('k', seen.append, 0)
+        thread = threading.Thread(target=executor.submit, args=('k', seen.append, 1))
+        thread.start()
+        time.sleep(0.05)
+        self.assertTrue(thread.is_alive())
+        release.set()
+        thread.join(timeout=5)
+        executor.shutdown()
+        self.assertEqual(seen, [0, 1])
+
+    def test_errors_are_logged(self):
+        executor = CallbackExecutor(workers=1)
+        seen = []
+        with self.assertLogs('Adafruit_IO.executor', level='ERROR'):
+            executor.submit('k', lambda: 1 / 0)
+            executor.submit('k', seen.append, 1)
+            executor.join(timeout=5)
+        executor.shutdown()
+        self.assertEqual(seen, [1])
+        self.assertRaises(RuntimeError, executor.submit, 'k', seen.append, 2)
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, CallbackExecutor, overflow='spill')
+
+    def _blocked(self, executor):
+        # Occupy the only worker until release is set.
+        release = threading.Event()
+        started = threading.Event()
+        executor.submit('busy', lambda: (started.set(), release.wait(5)))
+        started.wait(5)
+        return executor, release, []
+
+    def _wait_for(self, predicate, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import unittest
+
+from Adafruit_IO import Client, Feed, HTTPCache
+
+import base
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHTTPCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = HTTPCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a').value, 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_validators(self):
+        cache = HTTPCache()
+        cache.put('a', 1, etag='"abc"', last_modified='Wed, 21 Oct 2015 07:28:00 GMT')
+        self.assertEqual(cache.validators(cache.get('a')),
+                         {'If-None-Match': '"abc"',
+                          'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+
+    def test_invalidate(self):
+        cache = HTTPCache()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.invalidate(lambda key: key == 'a')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b').value, 2)
+
+
+class TestClientHTTPCache(unittest.TestCase):
+    """Offline tests for cached metadata lookups."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.io = Client('testuser', 'testkey',
+                         http_cache=HTTPCache(ttl=10, clock=self.clock))
+        self.feeds = [{'name': 'a', 'key': 'a'}, {'name': 'b', 'key': 'b'}]
+
+    def test_fresh_entries_skip_the_request(self):
+        adapter = base.stub_client(self.io, [(200, self.feeds, {'ETag': '"v1"'})])
+        first = self.io.feeds()
+        first.append('changed by caller')
+        self.assertEqual(self.io.feeds(), [Feed.from_dict(f) for f in self.feeds])
+        self.assertEqual(len(adapter.requests), 1)
+
+    def test_stale_entries_are_revalidated(self):
+        adapter = base.stub_client(self.io, [(200, self.feeds, {'ETag': '"v1"'}),
+                                             (304, None, None),
+                                             (200, self.feeds[:1], {'ETag': '"v2"'})])
+        first = self.io.feeds()
+        self.clock.now = 11
+        self.assertEqual(self.io.feeds(), first)
+        self.assertEqual(adapter.requests[1].headers['If-None-Match'], '"v1"')
+        self.clock.now = 22
+        self.assertEqual(len(self.io.feeds()), 1)
+        self.assertEqual(len(adapter.requests), 3)
+
+    def test_writes_invalidate_the_cache(self):
+        adapter = base.stub_client(self.io, [(200, self.feeds, None),
+                                             (200, {}, None),
+                                             (200, self.feeds[:1], None)])
+        self.io.feeds()
+        self.io.delete_feed('b')
+        self.assertEqual(len(self.io.feeds()), 1)
+        self.assertNotIn('If-None-Match', adapter.requests[2].headers)
+
+    def test_writes_keep_unrelated_entries(self):
+        dashboards = [{'name': 'd', 'key': 'd'}]
+        adapter = base.stub_client(self.io, [(200, self.feeds, None),
+                                             (200, dashboards, None),
+                                             (200, {'value': 1}, None),
+                                             (200, {}, None),
+                                             (200, {}, None),
+                                             (200, self.feeds[:1], None)])
+        self.io.feeds()
+        self.io.dashboards()
+        self.io.send_data('a', 1)
+        self.assertEqual(len(self.io.feeds()), 2)
+        self.io.delete_dashboard('d')
+        self.assertEqual(len(self.io.feeds()), 2)
+        self.assertEqual(len(adapter.requests), 4)
+        self.io.delete_feed('b')
+        self.assertEqual(len(self.io.feeds()), 1)
+
+    def test_shared_between_accounts_and_hosts(self):
+        other = Client('otheruser', 'otherkey', http_cache=self.io.http_cache)
+        local = Client('testuser', 'testkey', base_url='http://localhost:8000',
+                       http_cache=self.io.http_cache)
+        base.stub_client(self.io, [(200, self.feeds, None)])
+        base.stub_client(other, [(200, self.feeds[:1], None)])
+        base.stub_client(local, [(200, [], None)])
+        self.assertEqual(len(self.io.feeds()), 2)
+        self.assertEqual(len(other.feeds()), 1)
+        self.assertEqual(len(local.feeds()), 0)
+        self.assertEqual(len(self.io.http_cache), 3)
+
+    def test_disabled_by_default(self):
+        io = Client('testuser', 'testkey')
+        adapter = base.stub_client(io, [(200, self.feeds, None)] * 2)
+        io.feeds()
+        io.feeds()
+        self.assertEqual(len(adapter.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
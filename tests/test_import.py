@@ -0,0 +1,69 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that are slow to import and must only be loaded when needed.
+HEAVY_MODULES = ('requests', 'paho', 'aiohttp', 'numpy', 'importlib.metadata',
+                 'pkg_resources')
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the heavy modules it loaded."""
+    script = code + ("\nimport sys\n"
+                     "print(' '.join(m for m in {0!r} if m in sys.modules))".format(HEAVY_MODULES))
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT)
+    return output.decode('utf-8').split()
+
+
+class TestImport(unittest.TestCase):
+
+    def test_package_import_is_light(self):
+        self.assertEqual(loaded_modules("import Adafruit_IO"), [])
+
+    def test_models_and_errors_are_light(self):
+        code = "from Adafruit_IO import Data, Feed, RequestError, MQTTError, HTTPCache"
+        self.assertEqual(loaded_modules(code), [])
+
+    def test_client_loads_on_first_use(self):
+        loaded = loaded_modules("import Adafruit_IO\nAdafruit_IO.Client")
+        self.assertIn('requests', loaded)
+        self.assertNotIn('paho', loaded)
+        self.assertNotIn('aiohttp', loaded)
+
+    def test_submodules_are_attributes(self):
+        code = ("import Adafruit_IO\n"
+                "for name in ('errors', 'client', 'mqtt_client', 'model'):\n"
+                "    getattr(Adafruit_IO, name)\n"
+                "Adafruit_IO.errors.RequestError\n")
+        loaded = loaded_modules(code)
+        self.assertIn('requests', loaded)
+        self.assertIn('paho', loaded)
+
+    def test_public_names(self):
+        import Adafruit_IO
+        for name in Adafruit_IO.__all__:
+            self.assertIsNotNone(getattr(Adafruit_IO, name))
+        self.assertIn('Client', dir(Adafruit_IO))
+        self.assertRaises(AttributeError, getattr, Adafruit_IO, 'NoSuchName')
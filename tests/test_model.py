@@ -18,7 +18,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-from Adafruit_IO import Data, Feed, Group, Dashboard, Block, Layout
+from Adafruit_IO import Data, Feed, Group, Dashboard, Block, Layout, LazySequence
 
 import base
 
@@ -116,3 +116,35 @@ class TestData(base.IOTestCase):
         self.assertIsNone(data.expiration)
         self.assertIsNone(data.position)
         self.assertIsNone(data.id)
+
+    def test_from_dicts_matches_from_dict(self):
+        records = [{'value': str(i), 'id': i, 'unknown_param': 42} for i in range(3)]
+        data = Data.from_dicts(records)
+        self.assertEqual(data, [Data.from_dict(r) for r in records])
+        self.assertEqual([d.value for d in data], ['0', '1', '2'])
+        self.assertIsNone(data[0].lat)
+
+    def test_from_dict_missing_fields_are_none(self):
+        feed = Feed.from_dict({'key': 'foo'})
+        self.assertEqual(feed.key, 'foo')
+        self.assertIsNone(feed.history)
+        self.assertIsNone(feed.visibility)
+
+    def test_from_dict_parses_nested_types(self):
+        group = Group.from_dict({'name': 'g', 'feeds': [{'key': 'a', 'unknown_param': 1}]})
+        self.assertEqual(group.feeds, (Feed.from_dict({'key': 'a'}),))
+        self.assertEqual(Group.from_dict({'name': 'g'}).feeds, ())
+        dashboards = Dashboard.from_dicts([{'name': 'd', 'blocks': [{'name': 'b'}]}])
+        self.assertIsInstance(dashboards[0].blocks[0], Block)
+        self.assertEqual(dashboards[0].blocks[0].name, 'b')
+
+    def test_lazy_sequence_builds_items_on_access(self):
+        records = [{'key': 'a', 'name': 'A'}, {'key': 'b', 'unknown_param': 1}]
+        feeds = LazySequence(Feed, records)
+        self.assertEqual(len(feeds), 2)
+        self.assertEqual(feeds[1], Feed.from_dict(records[1]))
+        self.assertEqual(feeds[-1].key, 'b')
+        self.assertEqual(list(feeds[:1]), [Feed.from_dict(records[0])])
+        self.assertEqual(feeds.field('key'), ['a', 'b'])
+        self.assertEqual(feeds.field('name', 0), 'A')
+        self.assertRaises(ValueError, feeds.field, 'unknown_param')
@@ -21,10 +21,13 @@
 import time
 import unittest
 
-from Adafruit_IO import MQTTClient
+import paho.mqtt.client as mqtt
+
+from Adafruit_IO import MQTTClient, MQTTError
 from Adafruit_IO.mqtt_client import validate_feed_key
 
 import base
+from mqtt_broker import Broker
 
 
 TIMEOUT_SEC = 5  # Max amount of time (in seconds) to wait for asyncronous events
@@ -244,3 +247,133 @@ class TestMQTTClientFeedKeyValidation(unittest.TestCase):
         client = MQTTClient('testuser', 'testkey')
         with self.assertRaises(TypeError):
             client.receive('test@feed')
+
+
+class TestMQTTClientOptions(unittest.TestCase):
+    """Offline tests for MQTT client options."""
+
+    def test_default_ports(self):
+        self.assertEqual(MQTTClient('testuser', 'testkey')._service_port, 8883)
+        self.assertEqual(MQTTClient('testuser', 'testkey', secure=False)._service_port, 1883)
+
+    def test_custom_port(self):
+        client = MQTTClient('testuser', 'testkey', service_host='localhost', secure=False,
+                            port=11883)
+        self.assertEqual(client._service_port, 11883)
+
+    def test_dispatches_by_subscription(self):
+        client = MQTTClient('testuser', 'testkey')
+        received = []
+        client.on_message = lambda client, feed, payload: received.append((feed, payload))
+        client.subscribe_group('weather')
+        client.subscribe_time('seconds')
+        for topic in ('testuser/feeds/temp', 'testuser/groups/weather',
+                      'testuser/integration/weather/12/current', 'time/seconds'):
+            message = mqtt.MQTTMessage(topic=topic.encode('utf-8'))
+            message.payload = b'42'
+            client._mqtt_message(None, None, message)
+        self.assertEqual(received, [('temp', '42'), ('weather', '42'),
+                                    ('current', '42'), ('time', '42')])
+
+    def test_message_without_on_message(self):
+        client = MQTTClient('testuser', 'testkey')
+        message = mqtt.MQTTMessage(topic=b'testuser/feeds/temp')
+        self.assertRaises(ValueError, client._mqtt_message, None, None, message)
+
+    def test_feed_and_group_callbacks(self):
+        client = MQTTClient('testuser', 'testkey')
+        received = []
+        client.on_message = lambda client, feed, payload: received.append(('any', feed, payload))
+        client.add_feed_callback('temp', lambda client, feed, payload: received.append(('temp', feed, payload)))
+        client.add_feed_callback('shared', lambda client, feed, payload: received.append(('shared', feed, payload)),
+                                 feed_user='friend')
+        client.add_group_callback('weather', lambda client, group, payload: received.append(('weather', group, payload)))
+
+        def deliver(topic):
+            message = mqtt.MQTTMessage(topic=topic.encode('utf-8'))
+            message.payload = b'1'
+            client._client._handle_on_message(message)
+
+        for topic in ('testuser/feeds/temp', 'friend/feeds/shared',
+                      'testuser/groups/weather', 'testuser/feeds/other'):
+            deliver(topic)
+        client.remove_feed_callback('temp')
+        client.remove_group_callback('weather')
+        deliver('testuser/feeds/temp')
+        deliver('testuser/groups/weather')
+        self.assertEqual(received, [('temp', 'temp', '1'), ('shared', 'shared', '1'),
+                                    ('weather', 'weather', '1'), ('any', 'other', '1'),
+                                    ('any', 'temp', '1'), ('any', 'weather', '1')])
+
+    def test_executor_dispatch(self):
+        client = MQTTClient('testuser', 'testkey', executor=2)
+        received = []
+        client.on_message = lambda client, feed, payload: received.append((feed, payload))
+        for i in range(50):
+            message = mqtt.MQTTMessage(topic=b'testuser/feeds/temp')
+            message.payload = str(i).encode('utf-8')
+            client._mqtt_message(None, None, message)
+        self.assertTrue(client.executor.join(timeout=5))
+        client.executor.shutdown()
+        self.assertEqual(received, [('temp', str(i)) for i in range(50)])
+
+    def test_subscribe_many_without_connection(self):
+        client = MQTTClient('testuser', 'testkey')
+        self.assertEqual(client.subscribe_many([]).result(timeout=1), [])
+        future = client.subscribe_many(['temp', ('humidity', 1)])
+        self.assertRaises(MQTTError, future.result, timeout=1)
+        self.assertEqual(client._bulk, {})
+        self.assertRaises(TypeError, client.subscribe_many, ['bad key'])
+
+
+class TestMQTTClientBulk(unittest.TestCase):
+    """Bulk subscriptions against a local broker."""
+
+    def setUp(self):
+        self.broker = Broker().start()
+        self.client = MQTTClient('testuser', 'testkey', service_host='127.0.0.1',
+                                 secure=False, port=self.broker.port)
+        self.packets = []
+        subscribe = self.client._client.subscribe
+        def counting_subscribe(topic, *args, **kwargs):
+            self.packets.append(topic)
+            return subscribe(topic, *args, **kwargs)
+        self.client._client.subscribe = counting_subscribe
+        self.client.connect()
+        self.client.loop_background()
+        for _ in range(100):
+            if self.client.is_connected():
+                break
+            time.sleep(0.05)
+
+    def tearDown(self):
+        self.client.disconnect()
+        self.client._client.loop_stop()
+        self.broker.stop()
+
+    def test_subscribe_many(self):
+        feeds = [('feed-{0}'.format(i), i % 2) for i in range(1200)]
+        granted = self.client.subscribe_many(feeds).result(timeout=5)
+        self.assertEqual(granted, [i % 2 for i in range(1200)])
+        self.assertEqual([len(packet) for packet in self.packets], [500, 500, 200])
+        groups = self.client.subscribe_group_many(['weather', ('home', 1)])
+        self.assertEqual(groups.result(timeout=5), [0, 1])
+        received = []
+        self.client.on_message = lambda client, feed, payload: received.append((feed, payload))
+        self.client.publish('feed-7', 'on')
+        for _ in range(100):
+            if received:
+                break
+            time.sleep(0.05)
+        self.assertEqual(received, [('feed-7', 'on')])
+        unsubscribed = self.client.unsubscribe_many(
+            ['feed-{0}'.format(i) for i in range(1200)], group_ids=['weather', 'home'])
+        self.assertIsNone(unsubscribed.result(timeout=5))
+        self.assertEqual(self.client._bulk, {})
+
+    def test_shared_feeds(self):
+        self.client.subscribe_many(['temp'], feed_user='friend').result(timeout=5)
+        self.assertEqual(self.client._router.match('friend/feeds/temp'), 'feed')
+        unsubscribed = self.client.unsubscribe_many(['temp'], feed_user='friend')
+        self.assertIsNone(unsubscribed.result(timeout=5))
+        self.assertIsNone(self.client._router.match('friend/feeds/temp'))
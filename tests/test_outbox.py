@@ -0,0 +1,156 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+
+from Adafruit_IO import Client, Outbox, RequestError, RetryPolicy
+
+import base
+
+
+class TestOutbox(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.io = Client('testuser', 'testkey', retry=RetryPolicy(max_attempts=1))
+        self.status = 200
+        self.received = []
+        base.stub_client(self.io, self.respond)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def respond(self, request):
+        if self.status is None:
+            raise requests.exceptions.ConnectionError('offline')
+        feed = request.path_url.split('/')[5]
+        data = json.loads(request.body)['data']
+        if self.status == 200 or (self.status == 'reject-b' and feed != 'b'):
+            self.received.append((feed, [d['value'] for d in data]))
+            return 200, [], None
+        return (400 if self.status == 'reject-b' else self.status), {'error': 'rejected'}, None
+
+    def test_queues_until_drained(self):
+        with Outbox(self.io, self.path, batch_size=2) as outbox:
+            for i in range(5):
+                outbox.send('temp', i)
+            self.assertEqual(len(outbox), 5)
+            self.assertEqual(outbox.drain(), 5)
+            self.assertEqual(len(outbox), 0)
+        self.assertEqual(self.received, [('temp', [0, 1]), ('temp', [2, 3]), ('temp', [4])])
+
+    def test_survives_outage_and_restart(self):
+        outbox = Outbox(self.io, self.path)
+        outbox.send('temp', 1)
+        self.status = None
+        self.assertEqual(outbox.drain(), 0)
+        outbox.close()
+        self.status = 200
+        outbox = Outbox(self.io, self.path)
+        outbox.send('temp', 2)
+        self.assertEqual(outbox.drain(), 2)
+        outbox.close()
+        self.assertEqual(self.received, [('temp', [1, 2])])
+
+    def test_ignores_torn_line(self):
+        outbox = Outbox(self.io, self.path)
+        outbox.send('temp', 1)
+        outbox.close()
+        with open(os.path.join(self.path, 'queue.0.log'), 'ab') as log:
+            log.write(b'{"feed": "temp", "da')
+        outbox = Outbox(self.io, self.path)
+        self.assertEqual(len(outbox), 1)
+        outbox.send('temp', 2)
+        outbox.drain()
+        outbox.close()
+        self.assertEqual(self.received, [('temp', [1, 2])])
+
+    def test_moves_rejected_points_aside(self):
+        outbox = Outbox(self.io, self.path)
+        outbox.send('a', 1)
+        outbox.send('b', 2)
+        outbox.send('a', 3)
+        self.status = 'reject-b'
+        self.assertEqual(outbox.drain(), 2)
+        self.assertEqual(len(outbox), 0)
+        self.assertEqual(outbox.rejected, 1)
+        outbox.send('a', 4)
+        self.assertEqual(outbox.drain(), 1)
+        outbox.close()
+        self.assertEqual(self.received, [('a', [1, 3]), ('a', [4])])
+        with open(os.path.join(self.path, 'rejected.log')) as rejected:
+            records = [json.loads(line) for line in rejected]
+        self.assertEqual([(r['feed'], r['data']['value']) for r in records], [('b', 2)])
+
+    def test_keeps_points_on_other_errors(self):
+        outbox = Outbox(self.io, self.path)
+        outbox.send('a', 1)
+        self.status = 401
+        self.assertRaises(RequestError, outbox.drain)
+        self.assertEqual(len(outbox), 1)
+        self.assertEqual(outbox.rejected, 0)
+        self.status = 200
+        self.assertEqual(outbox.drain(), 1)
+        outbox.close()
+
+    def test_keeps_points_on_request_timeout(self):
+        outbox = Outbox(self.io, self.path)
+        outbox.send('a', 1)
+        self.status = 408
+        self.assertEqual(outbox.drain(), 0)
+        self.assertEqual(len(outbox), 1)
+        self.assertEqual(outbox.rejected, 0)
+        self.assertFalse(os.path.exists(os.path.join(self.path, 'rejected.log')))
+        self.status = 200
+        self.assertEqual(outbox.drain(), 1)
+        outbox.close()
+
+    def test_bounds_rejected_log(self):
+        outbox = Outbox(self.io, self.path, max_bytes=20000)
+        self.status = 400
+        for i in range(100):
+            outbox.send('temp', i)
+            outbox.drain()
+        outbox.close()
+        self.assertEqual(outbox.rejected, 100)
+        path = os.path.join(self.path, 'rejected.log')
+        self.assertLessEqual(os.path.getsize(path), 2000)
+        with open(path) as rejected:
+            values = [json.loads(line)['data']['value'] for line in rejected]
+        self.assertEqual(values, list(range(100 - len(values), 100)))
+
+    def test_compacts_and_bounds_size(self):
+        outbox = Outbox(self.io, self.path, max_bytes=2000)
+        for i in range(100):
+            outbox.send('temp', i)
+        self.assertGreater(outbox.dropped, 0)
+        self.assertEqual(len(outbox) + outbox.dropped, 100)
+        log_size = lambda: sum(os.path.getsize(os.path.join(self.path, name))
+                               for name in os.listdir(self.path) if name.endswith('.log'))
+        self.assertLessEqual(log_size(), 2000)
+        outbox.drain()
+        self.assertEqual(log_size(), 0)
+        self.assertEqual(self.received[-1][1][-1], 99)
+        outbox.close()
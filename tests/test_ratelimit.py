@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import unittest
+
+from Adafruit_IO import Client, RateLimiter, RetryPolicy, ThrottlingError
+
+import base
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def get_limiter(self, points_per_minute, **kwargs):
+        self.clock = base.FakeClock()
+        return RateLimiter(points_per_minute, clock=self.clock,
+                           sleep=self.clock.sleep, **kwargs)
+
+    def test_paces_requests_within_budget(self):
+        limiter = self.get_limiter(61)
+        for _ in range(121):
+            limiter.acquire()
+        # One burst point, then one point per second: never more than the
+        # budget in any rolling minute.
+        self.assertAlmostEqual(self.clock.now, 120.0)
+
+    def test_batch_cost_borrows_from_future(self):
+        limiter = self.get_limiter(61)
+        self.assertEqual(limiter.acquire(1), 0)
+        self.assertAlmostEqual(limiter.acquire(30), 30.0)
+        self.assertAlmostEqual(limiter.acquire(1), 1.0)
+
+    def test_throttled_shrinks_budget_and_pauses(self):
+        limiter = self.get_limiter(100)
+        limiter.acquire()
+        limiter.throttled(retry_after=10)
+        self.assertAlmostEqual(limiter.budget, 80.0)
+        self.assertGreaterEqual(limiter.acquire(), 10.0)
+
+    def test_budget_recovers(self):
+        limiter = self.get_limiter(100, recovery_interval=60)
+        limiter.throttled()
+        self.clock.now += 60
+        limiter.acquire()
+        self.assertAlmostEqual(limiter.budget, 90.0)
+        self.clock.now += 60
+        limiter.acquire()
+        self.assertAlmostEqual(limiter.budget, 100.0)
+
+    def test_client_retries_after_throttling(self):
+        limiter = self.get_limiter(100)
+        io = Client('testuser', 'testkey', rate_limit=limiter)
+        adapter = base.stub_client(io, [(429, {}, {'Retry-After': '5'}),
+                                        (200, {'value': '1'}, None)])
+        self.assertEqual(io.send_data('testfeed', 1).value, '1')
+        self.assertAlmostEqual(limiter.budget, 80.0)
+        self.assertGreaterEqual(sum(self.clock.slept), 5.0)
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_client_reports_throttling_when_retries_run_out(self):
+        limiter = self.get_limiter(100)
+        io = Client('testuser', 'testkey', rate_limit=limiter,
+                    retry=RetryPolicy(max_attempts=2))
+        adapter = base.stub_client(io, [(429, {}, None)] * 2)
+        with self.assertRaises(ThrottlingError):
+            io.send_data('testfeed', 1)
+        self.assertEqual(len(adapter.requests), 2)
+        # Without a limiter throttling is reported straight away.
+        io = Client('testuser', 'testkey')
+        adapter = base.stub_client(io, [(429, {}, None)])
+        self.assertRaises(ThrottlingError, io.receive, 'testfeed')
+        self.assertEqual(len(adapter.requests), 1)
+
+    def test_client_creates_limiter_from_number(self):
+        io = Client('testuser', 'testkey', rate_limit=30)
+        self.assertEqual(io.rate_limiter.points_per_minute, 30)
+        self.assertIsNone(Client('testuser', 'testkey').rate_limiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import unittest
+
+import requests
+
+from Adafruit_IO import Client, RateLimiter, RetryPolicy, RequestError
+
+import base
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def get_policy(self, **kwargs):
+        self.slept = []
+        return RetryPolicy(sleep=self.slept.append, **kwargs)
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = self.get_policy(backoff=1.0, max_backoff=4.0, max_attempts=10)
+        started = policy.clock()
+        for attempt in range(1, 9):
+            delay = policy.next_delay('GET', attempt, started, status_code=503)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4.0, 2 ** (attempt - 1)))
+
+    def test_respects_methods_status_codes_and_attempts(self):
+        policy = self.get_policy()
+        started = policy.clock()
+        self.assertIsNone(policy.next_delay('POST', 1, started, status_code=502))
+        self.assertIsNotNone(policy.next_delay('POST', 1, started, connect_failed=True))
+        self.assertIsNone(policy.next_delay('GET', 1, started, status_code=404))
+        self.assertIsNone(policy.next_delay('GET', 3, started, status_code=502))
+
+    def test_retry_after_and_deadline(self):
+        policy = self.get_policy(status_codes=[429], deadline=10)
+        started = policy.clock()
+        self.assertGreaterEqual(policy.next_delay('GET', 1, started, status_code=429,
+                                                  retry_after=5), 5)
+        self.assertIsNone(policy.next_delay('GET', 1, started, status_code=429,
+                                            retry_after=60))
+
+
+class TestClientRetries(unittest.TestCase):
+
+    def test_get_is_retried_after_server_error(self):
+        retry = RetryPolicy(sleep=lambda s: None)
+        io = Client('testuser', 'testkey', retry=retry)
+        adapter = base.stub_client(io, [(502, {'error': 'bad gateway'}, None),
+                                        (200, {'value': '1'}, None)])
+        self.assertEqual(io.receive('testfeed').value, '1')
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_get_is_retried_after_connection_error(self):
+        calls = []
+        def respond(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise requests.ConnectionError('reset')
+            return 200, {'value': '1'}, None
+        io = Client('testuser', 'testkey', retry=RetryPolicy(sleep=lambda s: None))
+        base.stub_client(io, respond)
+        self.assertEqual(io.receive('testfeed').value, '1')
+        self.assertEqual(len(calls), 2)
+
+    def test_post_is_not_retried(self):
+        io = Client('testuser', 'testkey', retry=RetryPolicy(sleep=lambda s: None))
+        adapter = base.stub_client(io, [(502, {'error': 'bad gateway'}, None)])
+        with self.assertRaises(RequestError):
+            io.send_data('testfeed', 1)
+        self.assertEqual(len(adapter.requests), 1)
+
+    def test_gives_up_after_max_attempts(self):
+        io = Client('testuser', 'testkey',
+                    retry=RetryPolicy(max_attempts=2, sleep=lambda s: None))
+        adapter = base.stub_client(io, [(503, {'error': 'down'}, None)] * 2)
+        with self.assertRaises(RequestError):
+            io.receive('testfeed')
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_timeout_is_passed_to_transport(self):
+        io = Client('testuser', 'testkey', timeout=(1, 2))
+        self.assertEqual(io._timeout(io.retry.clock()), (1, 2))
+        io = Client('testuser', 'testkey', timeout=(1, 20),
+                    retry=RetryPolicy(deadline=5))
+        connect, read = io._timeout(io.retry.clock())
+        self.assertEqual(connect, 1)
+        self.assertLessEqual(read, 5)
+
+    def test_deadline_used_up_by_rate_limiter(self):
+        clock = base.FakeClock()
+        limiter = RateLimiter(61, clock=clock, sleep=clock.sleep)
+        io = Client('testuser', 'testkey', rate_limit=limiter,
+                    retry=RetryPolicy(deadline=0.5, clock=clock, sleep=clock.sleep))
+        adapter = base.stub_client(io, [(200, {'value': '1'}, None)] * 2)
+        self.assertEqual(io.receive('testfeed').value, '1')
+        # The limiter waits a second for the next point, past the deadline.
+        with self.assertRaises(requests.Timeout):
+            io.receive('testfeed')
+        self.assertEqual(len(adapter.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Adafruit Industries
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+import unittest
+
+from Adafruit_IO.topics import TopicRouter, FEED, GROUP, WEATHER, AIR_QUALITY, TIME
+
+
+class TestTopicRouter(unittest.TestCase):
+
+    def test_routes_legacy_topic_shapes(self):
+        router = TopicRouter()
+        self.assertEqual(router.route('user/feeds/temp'), (FEED, 'temp'))
+        self.assertEqual(router.route('user/groups/weather/json'), (GROUP, 'json'))
+        self.assertEqual(router.route('user/integration/weather/12/current'),
+                         (WEATHER, 'current'))
+        self.assertEqual(router.route('user/integration/air_quality/34/current'),
+                         (AIR_QUALITY, '34'))
+        self.assertEqual(router.route('time/seconds'), (TIME, 'time'))
+
+    def test_short_topics_do_not_fail(self):
+        router = TopicRouter()
+        self.assertEqual(router.route('user/groups/weather'), (GROUP, 'weather'))
+        self.assertEqual(router.route('user/feeds'), (FEED, 'feeds'))
+        self.assertEqual(router.route('user'), (FEED, 'user'))
+
+    def test_registered_patterns_take_precedence(self):
+        router = TopicRouter()
+        router.add('user/f/+', GROUP)
+        self.assertEqual(router.route('user/f/temp/json'), (FEED, 'temp'))
+        self.assertEqual(router.route('user/f/weather'), (GROUP, 'weather'))
+        router.add('user/f/#', WEATHER)
+        self.assertEqual(router.route('user/f/temp/json'), (WEATHER, 'json'))
+
+    def test_wildcard_precedence(self):
+        router = TopicRouter()
+        router.add('a/#', WEATHER)
+        router.add('a/+/c', GROUP)
+        router.add('a/b/c', FEED)
+        self.assertEqual(router.match('a/b/c'), FEED)
+        self.assertEqual(router.match('a/x/c'), GROUP)
+        self.assertEqual(router.match('a/x/y'), WEATHER)
+        self.assertEqual(router.match('a'), WEATHER)
+        self.assertIsNone(router.match('b/c'))
+
+    def test_remove_invalidates_cache(self):
+        router = TopicRouter()
+        router.add('user/f/+', GROUP)
+        router.add('user/f/+', GROUP)
+        self.assertEqual(router.route('user/f/x')[0], GROUP)
+        router.remove('user/f/+')
+        self.assertEqual(router.route('user/f/x')[0], GROUP)
+        router.remove('user/f/+')
+        self.assertEqual(router.route('user/f/x')[0], FEED)
+        self.assertEqual(router._root.children, {})
+        router.remove('not/registered')
+
+    def test_route_during_remove_is_not_cached(self):
+        router = TopicRouter()
+        router.add('user/f/+', GROUP)
+        match = router.match
+
+        def match_then_remove(topic):
+            # Another thread removes the pattern while this route is looked up.
+            kind = match(topic)
+            threading.Thread(target=router.remove, args=('user/f/+',)).start()
+            time.sleep(0.05)
+            return kind
+
+        router.match = match_then_remove
+        self.assertEqual(router.route('user/f/x')[0], GROUP)
+        router.match = match
+        time.sleep(0.05)
+        self.assertEqual(router.route('user/f/x')[0], FEED)